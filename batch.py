@@ -0,0 +1,405 @@
+"""Neinteraktivní dávkové spouštění turnajů z konfiguračního souboru.
+
+Na rozdíl od `main.py` se na nic neptá - vše potřebné přečte z JSON
+konfigurace, odehraje zadané turnaje za sebou (případně paralelně)
+a na standardní výstup vypíše strojově čitelné shrnutí.
+
+Příklad konfigurace::
+
+    {
+        "players": "players.json",
+        "tournament_type": "round_robin",
+        "location": "Praha",
+        "winning_score": 10,
+        "max_dice_value": 6,
+        "replicas": 4,
+        "seed": 42,
+        "output_format": "json.gz",
+        "compact": true,
+        "retention": "last:2",
+        "output_dir": "results",
+        "cache_dir": ".cache",
+        "workers": 2
+    }
+
+Je-li zadán "cache_dir", seedované repliky se berou z cache výsledků
+(`result_cache.ResultCache`) a simulují se jen při prvním běhu.
+Klíč "retention" (viz `tournament.RetentionPolicy`) určuje, kolik
+zápasů turnaj drží v paměti a zapíše do výsledků ("all", "last:K",
+"sample:F", "none").
+Je-li "roster_snapshot" true, soupiska se načítá z binárního snímku
+(`roster_snapshot.load_players_cached`), který se vytvoří při prvním běhu.
+Klíč "memory_limit_mb" zapne sledování paměti (`profiling.MemoryMonitor`):
+záznam běhu obsahuje špičku paměti a po překročení limitu se turnaj
+přeruší s dosavadními výsledky (důvod v klíči "cancelled").
+Je-li "profile" true (nebo zadán přepínač --profile), každá replika se
+odehraje pod `cProfile` a do výstupního adresáře se uloží její profil
+(`profile_*.pstats`) a sbalené zásobníky pro flamegraph (`profile_*.folded`).
+
+Místo jednoho turnaje lze zadat klíč "jobs" se seznamem úloh. Klíče
+na nejvyšší úrovni pak slouží jako výchozí hodnoty pro všechny úlohy;
+přepínače --output-dir a --profile platí pro všechny úlohy, i když mají
+vlastní hodnotu. Typy hodnot úloh se ověří před spuštěním
+(`JOB_FIELD_TYPES`) - chyba se ohlásí jako chybná konfigurace.
+
+Spuštění::
+
+    python batch.py config.json [--workers N] [--output-dir DIR] [--summary FILE] [--profile]
+
+Návratový kód je 0, pokud všechny běhy doběhly, jinak 1 (2 při chybné
+konfiguraci). Těžší moduly (`game`, `tournament`, `concurrent.futures`)
+se importují až ve chvíli, kdy jsou opravdu potřeba.
+"""
+
+import json
+import os
+import sys
+import time
+
+DEFAULT_JOB = {
+    "players": "players.json",
+    "tournament_type": "round_robin",
+    "location": "Batch",
+    "winning_score": 10,
+    "max_dice_value": 6,
+    "replicas": 1,
+    "seed": None,
+    "seeds": None,
+    "output_format": "none",
+    "output_dir": ".",
+    "cache_dir": None,
+    "compact": False,
+    "retention": "all",
+    "roster_snapshot": False,
+    "memory_limit_mb": None,
+    "profile": False,
+}
+
+OUTPUT_FORMATS = ("json", "json.gz", "none")
+
+# Přípustné typy hodnot klíčů úlohy (type(None) = hodnota smí být null)
+JOB_FIELD_TYPES = {
+    "name": (str, type(None)),
+    "players": (str,),
+    "tournament_type": (str,),
+    "location": (str,),
+    "winning_score": (int,),
+    "max_dice_value": (int,),
+    "replicas": (int,),
+    "seed": (int, type(None)),
+    "seeds": (list, type(None)),
+    "output_format": (str,),
+    "output_dir": (str,),
+    "cache_dir": (str, type(None)),
+    "compact": (bool,),
+    "retention": (str,),
+    "roster_snapshot": (bool,),
+    "memory_limit_mb": (int, float, type(None)),
+    "profile": (bool,),
+}
+
+TYPE_ABBREVIATIONS = {
+    "round_robin": "rr",
+    "elimination": "elim",
+}
+
+
+def load_config(path: str) -> dict:
+    """Načte dávkovou konfiguraci z JSON souboru.
+
+    Args:
+        path (str): Cesta ke konfiguračnímu souboru.
+
+    Returns:
+        dict: Konfigurace dávky.
+
+    Raises:
+        FileNotFoundError: Pokud soubor neexistuje.
+        ValueError: Pokud konfigurace není JSON objekt.
+    """
+    from files import jsonfile_read
+
+    config = jsonfile_read(path)
+    if not isinstance(config, dict):
+        raise ValueError("Konfigurace musí být JSON objekt.")
+    return config
+
+
+def _check_types(job: dict, i: int):
+    """Ověří typy hodnot úlohy podle `JOB_FIELD_TYPES`.
+
+    Raises:
+        ValueError: Pokud má některý klíč hodnotu nepřípustného typu.
+    """
+    for key, types in JOB_FIELD_TYPES.items():
+        value = job.get(key)
+        # bool je podtřída int - jako číslo se nepřijme
+        if not isinstance(value, types) or (isinstance(value, bool) and bool not in types):
+            names = " nebo ".join("null" if t is type(None) else t.__name__ for t in types)
+            raise ValueError(f"Úloha {i}: klíč '{key}' musí být {names}, ne {json.dumps(value)}.")
+
+    for seed in job["seeds"] or []:
+        if seed is not None and (not isinstance(seed, int) or isinstance(seed, bool)):
+            raise ValueError(f"Úloha {i}: seedy v klíči 'seeds' musí být celá čísla.")
+
+
+def expand_jobs(config: dict, overrides: dict = None) -> list:
+    """Rozloží konfiguraci na seznam úplně zadaných úloh.
+
+    Args:
+        config (dict): Konfigurace dávky (jedna úloha nebo klíč "jobs").
+        overrides (dict): Hodnoty, které přebijí klíče všech úloh (např.
+            přepínače příkazové řádky).
+
+    Returns:
+        list: Seznam slovníků úloh doplněných o výchozí hodnoty.
+
+    Raises:
+        ValueError: Pokud je některá úloha zadána neplatně.
+    """
+    defaults = {key: value for key, value in config.items() if key not in ("jobs", "workers")}
+    raw_jobs = config.get("jobs") or [{}]
+
+    if not isinstance(raw_jobs, list):
+        raise ValueError("Klíč 'jobs' musí obsahovat seznam úloh.")
+
+    jobs = []
+    for i, raw_job in enumerate(raw_jobs):
+        if not isinstance(raw_job, dict):
+            raise ValueError(f"Úloha {i} není slovník.")
+
+        job = {**DEFAULT_JOB, **defaults, **raw_job, **(overrides or {})}
+        _check_types(job, i)
+
+        if job["output_format"] not in OUTPUT_FORMATS:
+            raise ValueError(
+                f"Úloha {i}: neznámý výstupní formát '{job['output_format']}'. "
+                f"Podporované formáty: {', '.join(OUTPUT_FORMATS)}"
+            )
+
+        if job["seeds"] is not None:
+            job["replicas"] = len(job["seeds"])
+        elif job["seed"] is not None:
+            job["seeds"] = [job["seed"] + r for r in range(job["replicas"])]
+        else:
+            job["seeds"] = [None] * job["replicas"]
+
+        if job["replicas"] < 1:
+            raise ValueError(f"Úloha {i}: počet replik musí být alespoň 1.")
+
+        if job["cache_dir"] is not None and any(seed is not None for seed in job["seeds"]) \
+                and (job["profile"] or job["memory_limit_mb"] is not None):
+            raise ValueError(
+                f"Úloha {i}: 'profile' a 'memory_limit_mb' nelze kombinovat s 'cache_dir' "
+                "(výsledky z cache se nesimulují)."
+            )
+
+        jobs.append(job)
+
+    return jobs
+
+
+def _result_filename(job: dict, replica: int, prefix: str = "tournament", extension: str = "") -> str:
+    """Sestaví název výstupního souboru pro jednu repliku (přípona podle formátu)."""
+    tournament_type = job["tournament_type"].lower().strip()
+    abbr = TYPE_ABBREVIATIONS.get(tournament_type, tournament_type)
+    label = (job.get("name") or job["location"]).strip().lower().replace(' ', '_')
+    extension = extension or job['output_format']
+    return os.path.join(job["output_dir"], f"{prefix}_{abbr}_{label}_{replica:03d}.{extension}")
+
+
+_caches = {}
+
+
+def _get_cache(cache_dir: str):
+    """Vrací cache výsledků pro adresář (jedna instance na proces)."""
+    if cache_dir not in _caches:
+        from result_cache import ResultCache
+        _caches[cache_dir] = ResultCache(cache_dir)
+    return _caches[cache_dir]
+
+
+def run_replica(job: dict, replica: int) -> dict:
+    """Odehraje jednu repliku turnaje bez výstupu na konzoli.
+
+    Funkce je na úrovni modulu, aby ji šlo předat do procesového poolu.
+
+    Args:
+        job (dict): Úplně zadaná úloha (viz `expand_jobs`).
+        replica (int): Pořadové číslo repliky.
+
+    Returns:
+        dict: Strojově čitelný záznam o běhu.
+    """
+    import contextlib
+    import random
+
+    seed = job["seeds"][replica]
+    record = {
+        "job": job.get("name"),
+        "replica": replica,
+        "seed": seed,
+        "tournament_type": job["tournament_type"],
+        "status": "ok",
+    }
+    start = time.perf_counter()
+
+    try:
+        from game import load_players
+        from files import jsonfile_write
+
+        with open(os.devnull, mode='w') as devnull, contextlib.redirect_stdout(devnull):
+            if job["roster_snapshot"]:
+                from roster_snapshot import load_players_cached
+                players = load_players_cached(job["players"])
+            else:
+                players = load_players(job["players"])
+
+            if job["cache_dir"] is not None and seed is not None:
+                from result_cache import run_cached
+                results, cached = run_cached(
+                    _get_cache(job["cache_dir"]), players, job["tournament_type"], job["location"],
+                    job["winning_score"], job["max_dice_value"], seed, job["retention"]
+                )
+            else:
+                from tournament import TournamentFactory
+
+                if seed is not None:
+                    random.seed(seed)
+                tournament = TournamentFactory.create(
+                    tournament_type=job["tournament_type"],
+                    players=players,
+                    location=job["location"],
+                    winning_score=job["winning_score"],
+                    max_dice_value=job["max_dice_value"],
+                    retention=job["retention"],
+                    seed=seed
+                )
+                profile = None
+                if job["profile"]:
+                    profile = _result_filename(job, replica, prefix="profile", extension="pstats")
+                    record["profile"] = profile
+
+                if job["memory_limit_mb"] is not None:
+                    from profiling import MemoryMonitor
+                    with MemoryMonitor(job["memory_limit_mb"]) as monitor:
+                        tournament.play(monitor, profile=profile)
+                    record.update({"memory_peak": monitor.peak, "cancelled": tournament.cancelled})
+                else:
+                    tournament.play(profile=profile)
+                results, cached = tournament.get_results(), False
+
+        output = None
+        if job["output_format"] != "none":
+            output = _result_filename(job, replica)
+            jsonfile_write(output, results, compact=job["compact"])
+
+        record.update({
+            "winner": results["winner"]["nickname"] if results["winner"] else None,
+            "players": len(results["players"]),
+            "matches": results["statistics"]["total_matches"],
+            "rounds": results["statistics"]["total_rounds"],
+            "cached": cached,
+            "output": output,
+        })
+    except Exception as e:
+        record.update({"status": "error", "error": f"{type(e).__name__}: {e}"})
+
+    record["elapsed"] = round(time.perf_counter() - start, 6)
+    return record
+
+
+def run_batch(jobs: list, workers: int = 1) -> dict:
+    """Odehraje všechny repliky všech úloh a vrátí souhrn.
+
+    Args:
+        jobs (list): Seznam úloh (viz `expand_jobs`).
+        workers (int): Počet paralelních procesů (1 = bez paralelizace).
+
+    Returns:
+        dict: Souhrn dávky se záznamy jednotlivých běhů.
+    """
+    start = time.perf_counter()
+
+    for job in jobs:
+        if job["output_format"] != "none" or job["profile"]:
+            os.makedirs(job["output_dir"], exist_ok=True)
+
+    tasks = [(job, replica) for job in jobs for replica in range(job["replicas"])]
+
+    if workers > 1 and len(tasks) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            runs = list(executor.map(run_replica, *zip(*tasks)))
+    else:
+        runs = [run_replica(job, replica) for job, replica in tasks]
+
+    failed = sum(1 for run in runs if run["status"] != "ok")
+    return {
+        "jobs": len(jobs),
+        "runs": len(runs),
+        "succeeded": len(runs) - failed,
+        "failed": failed,
+        "workers": workers,
+        "elapsed": round(time.perf_counter() - start, 6),
+        "results": runs,
+    }
+
+
+def parse_args(argv=None):
+    """Zpracuje argumenty příkazové řádky."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Dávkové spouštění turnajů z konfiguračního souboru."
+    )
+    parser.add_argument("config", help="cesta k JSON konfiguraci dávky")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="počet paralelních procesů (přebíjí konfiguraci)")
+    parser.add_argument("--output-dir", default=None,
+                        help="adresář pro výsledkové soubory (přebíjí konfiguraci)")
+    parser.add_argument("--summary", default=None,
+                        help="uloží souhrn do souboru místo na standardní výstup")
+    parser.add_argument("--profile", action="store_true",
+                        help="odehraje repliky pod cProfile a uloží .pstats a .folded (přebíjí konfiguraci)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """Vstupní bod dávkového režimu.
+
+    Returns:
+        int: Návratový kód procesu.
+    """
+    args = parse_args(argv)
+
+    try:
+        config = load_config(args.config)
+        overrides = {}
+        if args.output_dir is not None:
+            overrides["output_dir"] = args.output_dir
+        if args.profile:
+            overrides["profile"] = True
+        jobs = expand_jobs(config, overrides)
+        workers = args.workers if args.workers is not None else config.get("workers", 1)
+        if not isinstance(workers, int) or isinstance(workers, bool):
+            raise ValueError("Klíč 'workers' musí být celé číslo.")
+    except (FileNotFoundError, ValueError) as e:
+        print(json.dumps({"status": "error", "error": str(e)}), file=sys.stderr)
+        return 2
+
+    summary = run_batch(jobs, max(1, workers))
+    summary["status"] = "ok" if summary["failed"] == 0 else "failed"
+
+    if args.summary:
+        from files import jsonfile_write
+        jsonfile_write(args.summary, summary)
+    else:
+        print(json.dumps(summary, ensure_ascii=False))
+
+    return 0 if summary["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""Kooperativní rušení a časové limity simulace.
+
+`CancellationToken` předaný do `BaseTournament.play()` / `iter_events()`
+se kontroluje na hranicích zápasů a kol. Po zrušení (nebo po vypršení
+limitu) turnaj další zápasy nehraje, ohlásí událost `TournamentCancelled`
+s dosavadním pořadím a statistikami a skončí - už odehrané zápasy a
+statistiky zůstávají k dispozici (`get_standings`, `get_results`).
+
+Token lze zrušit z jiného vlákna (`cancel`), nebo mu nastavit časový
+limit - kontrola je jen porovnání s `time.monotonic()`. Turnaj předává
+tokenu každou událost (`observe`), odvozené tokeny (např.
+`profiling.MemoryMonitor`) tak mohou sledovat průběh turnaje.
+"""
+
+import time
+from typing import Optional
+
+
+class CancellationToken:
+    """Příznak zrušení s volitelným časovým limitem."""
+
+    def __init__(self, timeout: Optional[float] = None):
+        """Inicializuje token.
+
+        Args:
+            timeout (Optional[float]): Časový limit v sekundách od vytvoření tokenu (None = bez limitu).
+
+        Raises:
+            ValueError: Pokud je limit záporný.
+        """
+        if timeout is not None and timeout < 0:
+            raise ValueError("Časový limit nesmí být záporný.")
+
+        self.deadline = time.monotonic() + timeout if timeout is not None else None
+        self.reason: Optional[str] = None
+
+    def cancel(self, reason: str = "Zrušeno"):
+        """Zruší simulaci (lze volat i z jiného vlákna).
+
+        Args:
+            reason (str): Důvod zrušení (první důvod se zachová).
+        """
+        if self.reason is None:
+            self.reason = reason
+
+    @property
+    def cancelled(self) -> bool:
+        """True, pokud byl token zrušen nebo vypršel jeho časový limit."""
+        if self.reason is None and self.deadline is not None and time.monotonic() >= self.deadline:
+            self.reason = "Vypršel časový limit"
+        return self.reason is not None
+
+    def observe(self, event):
+        """Zpracuje událost turnaje před její kontrolou zrušení (základní token ji ignoruje).
+
+        Args:
+            event: Událost z modulu `events`.
+        """
+
+    def remaining(self) -> Optional[float]:
+        """Vrací zbývající čas do limitu v sekundách (None = bez limitu)."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
@@ -0,0 +1,635 @@
+"""Distribuované spouštění turnajů přes koordinátora a workery (TCP).
+
+Koordinátor rozdělí práci na úlohy - repliky turnaje nebo bloky kol
+round-robin turnaje - a rozesílá je workerům připojeným přes TCP.
+Worker úlohu odehraje stávajícím simulačním kódem (`Match`,
+`TournamentFactory`) a vrátí kompaktní výsledek (souhrnné statistiky
+hráčů), který koordinátor sloučí. Pokud se worker během úlohy odpojí
+nebo nestihne časový limit, úloha se vrátí do fronty a dostane ji jiný
+worker. Odpojí-li se všichni workeři a do `worker_grace` sekund se
+nepřipojí žádný další, koordinátor skončí chybou `ConnectionError`.
+
+Protokol: zprávy jsou JSON objekty s 4bajtovou délkou (big-endian) na začátku.
+
+- worker -> koordinátor: {"type": "ready", "worker": jméno}
+- koordinátor -> worker: {"type": "task", "task_id": id, "task": {...}} nebo {"type": "shutdown"}
+- worker -> koordinátor: {"type": "result", "task_id": id, "result": {...}}
+  nebo {"type": "error", "task_id": id, "error": text}
+
+Spuštění::
+
+    python distributed.py coordinator config.json --port 5555
+    python distributed.py worker --host 10.0.0.1 --port 5555
+
+Konfigurace koordinátora má stejné klíče jako úloha v `batch.py`
+(players, tournament_type, location, winning_score, max_dice_value,
+replicas, seed) a navíc volitelný klíč "round_shards" pro rozdělení
+jednoho round-robin turnaje po kolech.
+"""
+
+import json
+import socket
+import socketserver
+import struct
+import sys
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+HEADER = struct.Struct('>I')
+MAX_MESSAGE_SIZE = 256 * 1024 * 1024
+
+
+def send_message(sock: socket.socket, message: Dict):
+    """Odešle jednu zprávu protokolu.
+
+    Args:
+        sock (socket.socket): Připojený socket.
+        message (Dict): JSON serializovatelná zpráva.
+    """
+    payload = json.dumps(message, separators=(',', ':')).encode('utf-8')
+    sock.sendall(HEADER.pack(len(payload)) + payload)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    """Přečte přesně `size` bajtů ze socketu.
+
+    Raises:
+        ConnectionError: Pokud protistrana spojení uzavřela.
+    """
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1024 * 1024))
+        if not chunk:
+            raise ConnectionError("Spojení bylo uzavřeno.")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def recv_message(sock: socket.socket) -> Dict:
+    """Přijme jednu zprávu protokolu.
+
+    Args:
+        sock (socket.socket): Připojený socket.
+
+    Returns:
+        Dict: Přijatá zpráva.
+
+    Raises:
+        ConnectionError: Pokud bylo spojení uzavřeno nebo je zpráva příliš velká.
+    """
+    (size,) = HEADER.unpack(_recv_exact(sock, HEADER.size))
+    if size > MAX_MESSAGE_SIZE:
+        raise ConnectionError(f"Zpráva je příliš velká ({size} B).")
+    return json.loads(_recv_exact(sock, size).decode('utf-8'))
+
+
+def roster_to_data(players: List) -> List[List[str]]:
+    """Převede hráče na kompaktní seznam [přezdívka, pohlaví, stát]."""
+    return [[p.nickname, p.gender.value, p.state] for p in players]
+
+
+def make_replica_tasks(players: List, tournament_type: str, location: str,
+                       winning_score: int = 10, max_dice_value: int = 6,
+                       replicas: int = 1, seed: Optional[int] = None) -> List[Dict]:
+    """Vytvoří úlohy - nezávislé repliky jednoho turnaje.
+
+    Args:
+        players (List[Player]): Soupiska.
+        tournament_type (str): Typ turnaje (viz `TournamentFactory`).
+        location (str): Místo konání.
+        winning_score (int): Počet bodů k vítězství v zápase.
+        max_dice_value (int): Maximální hodnota kostky.
+        replicas (int): Počet replik.
+        seed (Optional[int]): Výchozí seed (replika i dostane seed + i).
+
+    Returns:
+        List[Dict]: Seznam úloh.
+    """
+    roster = roster_to_data(players)
+    return [
+        {
+            "kind": "replica",
+            "roster": roster,
+            "tournament_type": tournament_type,
+            "location": location,
+            "winning_score": winning_score,
+            "max_dice_value": max_dice_value,
+            "seed": None if seed is None else seed + replica,
+        }
+        for replica in range(replicas)
+    ]
+
+
+def make_round_shard_tasks(players: List, location: str, winning_score: int = 10,
+                           max_dice_value: int = 6, shards: int = 2,
+                           seed: Optional[int] = None) -> List[Dict]:
+    """Rozdělí jeden round-robin turnaj na bloky kol.
+
+    Zápasy round-robin turnaje na sobě nezávisí, bloky kol lze tedy
+    odehrát odděleně a statistiky hráčů sečíst.
+
+    Args:
+        players (List[Player]): Soupiska.
+        location (str): Místo konání.
+        winning_score (int): Počet bodů k vítězství v zápase.
+        max_dice_value (int): Maximální hodnota kostky.
+        shards (int): Počet bloků.
+        seed (Optional[int]): Výchozí seed (blok i dostane seed + i).
+
+    Returns:
+        List[Dict]: Seznam úloh.
+    """
+    n = len(players)
+    total_rounds = n - 1 if n % 2 == 0 else n
+    shards = max(1, min(shards, total_rounds))
+    bounds = [round(total_rounds * i / shards) for i in range(shards + 1)]
+    roster = roster_to_data(players)
+    return [
+        {
+            "kind": "round_shard",
+            "roster": roster,
+            "tournament_type": "round_robin",
+            "location": location,
+            "winning_score": winning_score,
+            "max_dice_value": max_dice_value,
+            "rounds": [bounds[i], bounds[i + 1]],
+            "seed": None if seed is None else seed + i,
+        }
+        for i in range(shards)
+    ]
+
+
+def run_task(task: Dict) -> Dict:
+    """Odehraje jednu úlohu a vrátí kompaktní výsledek.
+
+    Args:
+        task (Dict): Úloha z `make_replica_tasks` nebo `make_round_shard_tasks`.
+
+    Returns:
+        Dict: {"winner": přezdívka|None, "matches": počet,
+               "standings": [[přezdívka, výhry, zápasy, plus, minus], ...]}
+    """
+    import contextlib
+    import os
+    import random
+    from game import Gender, Match, Player
+    from tournament import TournamentFactory
+
+    if task.get("seed") is not None:
+        random.seed(task["seed"])
+
+    players = [Player(nickname, Gender(gender), state) for nickname, gender, state in task["roster"]]
+
+    with open(os.devnull, mode='w') as devnull, contextlib.redirect_stdout(devnull):
+        tournament = TournamentFactory.create(
+            tournament_type=task["tournament_type"],
+            players=players,
+            location=task["location"],
+            winning_score=task["winning_score"],
+            max_dice_value=task["max_dice_value"],
+            retention="none",
+            seed=task.get("seed")
+        )
+
+        if task["kind"] == "round_shard":
+            start, stop = task["rounds"]
+            matches = 0
+            for round_matches in tournament._generate_round_robin_schedule()[start:stop]:
+                for player1, player2 in round_matches:
+                    Match(player1, player2, tournament.winning_score, tournament.max_dice_value,
+                          stats=tournament.stats).play()
+                    matches += 1
+            winner = None
+        else:
+            tournament.play()
+            matches = tournament.match_stats.count
+            winner = tournament.winner.nickname if tournament.winner else None
+
+    standings = []
+    for player in players:
+        player_stats = tournament.stats[player]
+        standings.append([player.nickname, player_stats.wins, player_stats.count_of_games,
+                          player_stats.score['plus'], player_stats.score['minus']])
+
+    return {
+        "winner": winner,
+        "matches": matches,
+        "standings": standings,
+    }
+
+
+def merge_results(results: List[Dict]) -> Dict:
+    """Sloučí kompaktní výsledky úloh.
+
+    Args:
+        results (List[Dict]): Výsledky z `run_task`.
+
+    Returns:
+        Dict: Souhrnné statistiky hráčů seřazené podle výher a rozdílu skóre.
+    """
+    totals: Dict[str, Dict] = {}
+    matches = 0
+    for result in results:
+        matches += result["matches"]
+        for nickname, wins, games, plus, minus in result["standings"]:
+            stats = totals.setdefault(nickname, {"wins": 0, "games": 0, "score_plus": 0,
+                                                 "score_minus": 0, "titles": 0})
+            stats["wins"] += wins
+            stats["games"] += games
+            stats["score_plus"] += plus
+            stats["score_minus"] += minus
+        if result["winner"] is not None:
+            totals[result["winner"]]["titles"] += 1
+
+    standings = sorted(
+        ({"player": nickname, **stats} for nickname, stats in totals.items()),
+        key=lambda s: (s["wins"], s["score_plus"] - s["score_minus"]),
+        reverse=True
+    )
+    return {"tasks": len(results), "matches": matches, "standings": standings}
+
+
+class _WorkerHandler(socketserver.BaseRequestHandler):
+    """Obsluha jednoho připojeného workera na straně koordinátora."""
+
+    def handle(self):
+        """Rozesílá úlohy workerovi, dokud není vše hotovo nebo se neodpojí."""
+        coordinator: Coordinator = self.server.coordinator
+        sock = self.request
+        sock.settimeout(coordinator.task_timeout)
+
+        try:
+            hello = recv_message(sock)
+        except (OSError, ValueError):
+            return
+        worker_name = hello.get("worker", str(self.client_address))
+
+        coordinator._worker_joined()
+        try:
+            self._serve_tasks(coordinator, sock, worker_name)
+        finally:
+            coordinator._worker_left()
+
+    @staticmethod
+    def _serve_tasks(coordinator: 'Coordinator', sock: socket.socket, worker_name: str):
+        """Posílá workerovi úlohy, dokud není vše hotovo nebo se neodpojí."""
+        while True:
+            task_id = coordinator._next_task()
+            if task_id is None:
+                try:
+                    send_message(sock, {"type": "shutdown"})
+                except OSError:
+                    pass
+                return
+
+            try:
+                send_message(sock, {"type": "task", "task_id": task_id, "task": coordinator.tasks[task_id]})
+                reply = recv_message(sock)
+            except (OSError, ValueError) as e:
+                coordinator._task_lost(task_id, f"{worker_name}: {e}")
+                return
+
+            if reply.get("type") == "result" and reply.get("task_id") == task_id:
+                coordinator._task_done(task_id, reply["result"])
+            else:
+                coordinator._task_lost(task_id, f"{worker_name}: {reply.get('error', 'neplatná odpověď')}")
+
+
+class _CoordinatorServer(socketserver.ThreadingTCPServer):
+    """TCP server koordinátora (vlákno na každého workera)."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class Coordinator:
+    """Rozděluje úlohy workerům a sbírá jejich výsledky."""
+
+    def __init__(self, tasks: List[Dict], host: str = '127.0.0.1', port: int = 0,
+                 max_retries: int = 3, task_timeout: float = 300.0, worker_grace: float = 30.0):
+        """Inicializuje koordinátora a otevře naslouchající socket.
+
+        Args:
+            tasks (List[Dict]): Úlohy k rozeslání.
+            host (str): Adresa pro naslouchání.
+            port (int): Port (0 = libovolný volný).
+            max_retries (int): Kolikrát se úloha zkusí znovu po ztrátě workera.
+            task_timeout (float): Maximální doba (s) na jednu úlohu.
+            worker_grace (float): Jak dlouho (s) čekat na nového workera, když se
+                všichni připojení workeři odpojí a úlohy ještě zbývají.
+
+        Raises:
+            ValueError: Pokud nejsou zadány žádné úlohy.
+        """
+        if not tasks:
+            raise ValueError("Koordinátor potřebuje alespoň jednu úlohu.")
+
+        self.tasks = tasks
+        self.max_retries = max_retries
+        self.task_timeout = task_timeout
+        self.worker_grace = worker_grace
+        self.results: List[Optional[Dict]] = [None] * len(tasks)
+        self.attempts = [0] * len(tasks)
+        self.errors: Dict[int, List[str]] = {}
+        self.failed: List[int] = []
+        self._pending = deque(range(len(tasks)))
+        self._remaining = len(tasks)
+        self._condition = threading.Condition()
+        # Počet připojených workerů a čas, kdy se odpojil poslední z nich (None = někdo je připojen
+        # nebo se ještě nikdo nepřipojil)
+        self.workers = 0
+        self._abandoned_since: Optional[float] = None
+
+        self._server = _CoordinatorServer((host, port), _WorkerHandler)
+        self._server.coordinator = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """Vrací (adresa, port), na kterých koordinátor naslouchá."""
+        return self._server.server_address[:2]
+
+    def _next_task(self) -> Optional[int]:
+        """Vrátí id další úlohy (čeká, dokud nějaká není) nebo None, když je hotovo."""
+        with self._condition:
+            while not self._pending and self._remaining:
+                self._condition.wait()
+            if not self._remaining:
+                return None
+            task_id = self._pending.popleft()
+            self.attempts[task_id] += 1
+            return task_id
+
+    def _task_done(self, task_id: int, result: Dict):
+        """Zaznamená výsledek úlohy."""
+        with self._condition:
+            if self.results[task_id] is None:
+                self.results[task_id] = result
+                self._remaining -= 1
+            self._condition.notify_all()
+
+    def _task_lost(self, task_id: int, error: str):
+        """Vrátí úlohu do fronty (nebo ji označí za neúspěšnou)."""
+        with self._condition:
+            self.errors.setdefault(task_id, []).append(error)
+            if self.attempts[task_id] > self.max_retries:
+                self.failed.append(task_id)
+                self._remaining -= 1
+            else:
+                self._pending.appendleft(task_id)
+            self._condition.notify_all()
+
+    def _worker_joined(self):
+        """Zaznamená připojení workera."""
+        with self._condition:
+            self.workers += 1
+            self._abandoned_since = None
+
+    def _worker_left(self):
+        """Zaznamená odpojení workera (poslední odpojený spustí lhůtu `worker_grace`)."""
+        with self._condition:
+            self.workers -= 1
+            if not self.workers:
+                self._abandoned_since = time.monotonic()
+            self._condition.notify_all()
+
+    def start(self):
+        """Spustí obsluhu workerů na pozadí."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Počká na dokončení všech úloh.
+
+        Args:
+            timeout (Optional[float]): Maximální doba čekání v sekundách.
+
+        Returns:
+            bool: True, pokud byly všechny úlohy dokončeny (nebo definitivně selhaly).
+
+        Raises:
+            ConnectionError: Pokud se odpojili všichni workeři a během
+                `worker_grace` se nepřipojil žádný další.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self._condition:
+            while self._remaining:
+                now = time.monotonic()
+                waits = []
+                if self._abandoned_since is not None:
+                    grace_left = self._abandoned_since + self.worker_grace - now
+                    if grace_left <= 0:
+                        raise ConnectionError(
+                            f"Všichni workeři se odpojili a do {self.worker_grace} s se nepřipojil "
+                            f"žádný další (zbývá {self._remaining} úloh)."
+                        )
+                    waits.append(grace_left)
+                if deadline is not None:
+                    if now >= deadline:
+                        return False
+                    waits.append(deadline - now)
+                self._condition.wait(min(waits) if waits else None)
+        return True
+
+    def close(self):
+        """Zastaví server koordinátora."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread = None
+        self._server.server_close()
+
+    def serve(self, timeout: Optional[float] = None) -> Dict:
+        """Rozešle všechny úlohy, počká na výsledky a vrátí sloučený souhrn.
+
+        Args:
+            timeout (Optional[float]): Maximální doba běhu v sekundách.
+
+        Returns:
+            Dict: Souhrn z `merge_results` doplněný o informace o selháních.
+
+        Raises:
+            TimeoutError: Pokud úlohy nedoběhly v časovém limitu.
+            ConnectionError: Pokud se odpojili všichni workeři (viz `wait`).
+        """
+        self.start()
+        try:
+            if not self.wait(timeout):
+                raise TimeoutError("Distribuovaný výpočet nedoběhl v časovém limitu.")
+            # Krátký čas, aby si připojení workeři stihli převzít zprávu o ukončení
+            time.sleep(0.05)
+        finally:
+            self.close()
+        return self.summary()
+
+    def summary(self) -> Dict:
+        """Vrací sloučené výsledky dokončených úloh a přehled selhání."""
+        summary = merge_results([r for r in self.results if r is not None])
+        summary["failed_tasks"] = sorted(self.failed)
+        summary["retries"] = sum(max(0, a - 1) for a in self.attempts)
+        summary["errors"] = {str(task_id): errors for task_id, errors in self.errors.items()}
+        return summary
+
+
+def run_worker(host: str, port: int, name: Optional[str] = None,
+               connect_timeout: float = 10.0) -> int:
+    """Připojí se ke koordinátorovi a zpracovává úlohy, dokud nedostane pokyn ke konci.
+
+    Args:
+        host (str): Adresa koordinátora.
+        port (int): Port koordinátora.
+        name (Optional[str]): Jméno workera (pro hlášení chyb).
+        connect_timeout (float): Jak dlouho zkoušet připojení.
+
+    Returns:
+        int: Počet zpracovaných úloh.
+
+    Raises:
+        ConnectionError: Pokud se nepodařilo připojit.
+    """
+    deadline = time.monotonic() + connect_timeout
+    while True:
+        try:
+            sock = socket.create_connection((host, port))
+            break
+        except OSError:
+            if time.monotonic() > deadline:
+                raise ConnectionError(f"Nelze se připojit ke koordinátorovi {host}:{port}.")
+            time.sleep(0.1)
+
+    done = 0
+    with sock:
+        send_message(sock, {"type": "ready", "worker": name or socket.gethostname()})
+        while True:
+            try:
+                message = recv_message(sock)
+            except ConnectionError:
+                break
+            if message.get("type") != "task":
+                break
+            try:
+                reply = {"type": "result", "task_id": message["task_id"], "result": run_task(message["task"])}
+            except Exception as e:
+                reply = {"type": "error", "task_id": message["task_id"], "error": f"{type(e).__name__}: {e}"}
+            try:
+                send_message(sock, reply)
+            except OSError:
+                # Koordinátor úlohu mezitím zahodil (timeout) a spojení zavřel
+                break
+            done += 1
+    return done
+
+
+def run_local(tasks: List[Dict], workers: int = 2, timeout: Optional[float] = None,
+              **coordinator_options) -> Dict:
+    """Spustí koordinátora a `workers` workerových procesů na localhostu.
+
+    Místní workeři se po pádu znovu nepřipojí, lhůta `worker_grace` je
+    proto ve výchozím nastavení krátká.
+
+    Args:
+        tasks (List[Dict]): Úlohy k odehrání.
+        workers (int): Počet workerových procesů.
+        timeout (Optional[float]): Maximální doba běhu v sekundách.
+        **coordinator_options: Další parametry pro `Coordinator`.
+
+    Returns:
+        Dict: Sloučený souhrn (viz `Coordinator.serve`).
+
+    Raises:
+        TimeoutError: Pokud úlohy nedoběhly v časovém limitu.
+        ConnectionError: Pokud všichni workeři spadli.
+    """
+    import multiprocessing
+
+    coordinator_options.setdefault("worker_grace", 1.0)
+    coordinator = Coordinator(tasks, host='127.0.0.1', port=0, **coordinator_options)
+    host, port = coordinator.address
+    processes = [
+        multiprocessing.Process(target=run_worker, args=(host, port, f"local-{i}"), daemon=True)
+        for i in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        return coordinator.serve(timeout)
+    finally:
+        for process in processes:
+            process.join(timeout=2)
+            if process.is_alive():
+                process.terminate()
+
+
+def _tasks_from_config(config: Dict) -> List[Dict]:
+    """Sestaví úlohy z konfigurace ve formátu `batch.py`."""
+    from game import load_players
+
+    players = load_players(config.get("players", "players.json"))
+    location = config.get("location", "Distributed")
+    winning_score = config.get("winning_score", 10)
+    max_dice_value = config.get("max_dice_value", 6)
+
+    if config.get("round_shards"):
+        return make_round_shard_tasks(players, location, winning_score, max_dice_value,
+                                      config["round_shards"], config.get("seed"))
+    return make_replica_tasks(players, config.get("tournament_type", "round_robin"), location,
+                              winning_score, max_dice_value, config.get("replicas", 1), config.get("seed"))
+
+
+def main(argv=None) -> int:
+    """Vstupní bod příkazové řádky (role coordinator / worker / local).
+
+    Returns:
+        int: Návratový kód procesu.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Distribuované spouštění turnajů.")
+    subparsers = parser.add_subparsers(dest="role", required=True)
+
+    coordinator_parser = subparsers.add_parser("coordinator", help="rozesílá úlohy workerům")
+    coordinator_parser.add_argument("config", help="JSON konfigurace (klíče jako v batch.py)")
+    coordinator_parser.add_argument("--host", default="0.0.0.0")
+    coordinator_parser.add_argument("--port", type=int, default=5555)
+    coordinator_parser.add_argument("--retries", type=int, default=3)
+    coordinator_parser.add_argument("--task-timeout", type=float, default=300.0)
+    coordinator_parser.add_argument("--worker-grace", type=float, default=30.0,
+                                    help="jak dlouho (s) čekat na nového workera, když se všichni odpojí")
+
+    worker_parser = subparsers.add_parser("worker", help="zpracovává úlohy koordinátora")
+    worker_parser.add_argument("--host", default="127.0.0.1")
+    worker_parser.add_argument("--port", type=int, default=5555)
+    worker_parser.add_argument("--name", default=None)
+
+    local_parser = subparsers.add_parser("local", help="koordinátor i workeři na tomto stroji")
+    local_parser.add_argument("config", help="JSON konfigurace (klíče jako v batch.py)")
+    local_parser.add_argument("--workers", type=int, default=2)
+
+    args = parser.parse_args(argv)
+
+    if args.role == "worker":
+        run_worker(args.host, args.port, args.name)
+        return 0
+
+    from batch import load_config
+    tasks = _tasks_from_config(load_config(args.config))
+
+    try:
+        if args.role == "coordinator":
+            coordinator = Coordinator(tasks, args.host, args.port, args.retries, args.task_timeout,
+                                      args.worker_grace)
+            summary = coordinator.serve()
+        else:
+            summary = run_local(tasks, args.workers)
+    except ConnectionError as e:
+        print(f"Chyba: {e}", file=sys.stderr)
+        return 1
+
+    print(json.dumps(summary, ensure_ascii=False))
+    return 0 if not summary["failed_tasks"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
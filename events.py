@@ -0,0 +1,97 @@
+"""Typované události průběhu turnaje.
+
+`BaseTournament.iter_events()` vrací tyto události postupně, jak turnaj
+probíhá. Konzument (výpis na konzoli, živá tabulka, zapisovač výsledků)
+tak může výsledky zpracovávat průběžně a nemusí čekat na konec turnaje.
+`BaseTournament.play()` je jen jedním z konzumentů - události předává
+`TournamentPrinter.print_event`.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from game import Player, StatsContext
+
+
+@dataclass
+class TournamentStarted:
+    """Začátek turnaje."""
+
+    tournament_type: str
+    title: str
+    location: str
+    num_players: int
+
+
+@dataclass
+class RoundStarted:
+    """Začátek kola (u eliminace i fáze volných losů s číslem 0)."""
+
+    round_num: int
+    round_name: str
+
+
+@dataclass
+class MatchPlayed:
+    """Odehraný zápas včetně záznamu pro výsledkový soubor."""
+
+    round_num: int
+    player1: Player
+    player2: Player
+    score: Tuple[int, int]
+    winner: Player
+    record: Dict = field(repr=False)
+
+
+@dataclass
+class Bye:
+    """Hráč postupuje bez zápasu (volný los)."""
+
+    round_num: int
+    player: Player
+
+
+@dataclass
+class Elimination:
+    """Vyřazení poraženého hráče v eliminačním zápase."""
+
+    round_num: int
+    winner: Player
+    loser: Player
+
+
+@dataclass
+class StandingsSnapshot:
+    """Průběžné pořadí po skončení kola."""
+
+    round_num: int
+    standings: List[Tuple[Player, int, int]]
+    stats: Optional[StatsContext] = field(default=None, repr=False)
+
+
+@dataclass
+class GroupFinished:
+    """Konec skupiny - konečné pořadí skupiny a hráči, kteří postupují."""
+
+    group: str
+    standings: List[Tuple[Player, int, int]]
+    qualified: List[Player]
+    stats: Optional[StatsContext] = field(default=None, repr=False)
+
+
+@dataclass
+class TournamentCancelled:
+    """Turnaj byl přerušen (zrušení nebo časový limit) - dosavadní pořadí a statistiky."""
+
+    reason: str
+    matches_played: int
+    standings: List[Tuple[Player, int, int]]
+    statistics: Dict = field(repr=False)
+    stats: Optional[StatsContext] = field(default=None, repr=False)
+
+
+@dataclass
+class TournamentWon:
+    """Konec turnaje a jeho vítěz."""
+
+    winner: Optional[Player]
+    stats: str = ""
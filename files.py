@@ -2,12 +2,41 @@
 
 Obsahuje funkce pro načítání a ukládání dat do různých formátů souborů:
 - textové soubory
-- JSON
+- JSON (volitelně komprimovaný gzipem, atomický zápis)
+- JSON Lines (jeden JSON objekt na řádek, čtení i zápis po řádcích)
 - CSV
+
+Ke každé funkci pro čtení a zápis existuje i asynchronní varianta
+(přípona `_async`), která práci předá do omezeného poolu vláken, takže
+neblokuje smyčku událostí a souběžné ukládání nepřetíží disk.
 """
 
+import gzip
+import io
 import json
 import csv
+import os
+import tempfile
+import threading
+import uuid
+from functools import partial
+from itertools import islice
+
+# Počet řádků CSV zapisovaných najednou a velikost bufferu souboru
+CSV_CHUNK_SIZE = 1000
+CSV_BUFFER_SIZE = 1024 * 1024
+
+# Hloubka, do které se JSON při zápisu kóduje po jednotlivých prvcích
+JSON_STREAM_DEPTH = 2
+
+# Úroveň komprese gzip - kompromis mezi rychlostí a velikostí souboru
+GZIP_LEVEL = 6
+
+# Maximální počet souběžných I/O operací asynchronních variant
+IO_WORKERS = 4
+
+_io_executor = None
+_io_executor_lock = threading.Lock()
 
 
 def textfile_read(path, encoding='utf-8'):
@@ -44,9 +73,18 @@ def textfile_write(path, data='', encoding='utf-8'):
         file.write(data)
 
 
+def _open_text(path, mode, encoding):
+    """Otevře textový soubor, soubory s příponou `.gz` transparentně přes gzip."""
+    if str(path).endswith('.gz'):
+        return gzip.open(path, mode=mode + 't', encoding=encoding, compresslevel=GZIP_LEVEL)
+    return open(path, mode=mode, encoding=encoding)
+
+
 def jsonfile_read(path, encoding='utf-8'):
     """Načte data z JSON souboru.
 
+    Soubory s příponou `.gz` se dekomprimují průběžně při čtení.
+
     Args:
         path (str): Cesta k JSON souboru.
         encoding (str): Kódování souboru (výchozí: utf-8).
@@ -59,17 +97,23 @@ def jsonfile_read(path, encoding='utf-8'):
         json.JSONDecodeError: Pokud soubor není validní JSON.
         Exception: Pokud došlo k chybě při čtení.
     """
-    with open(path, encoding=encoding) as json_file:
+    with _open_text(path, 'r', encoding) as json_file:
         return json.load(json_file)
 
 
-def jsonfile_write(path, data=None, encoding='utf-8'):
+def jsonfile_write(path, data=None, encoding='utf-8', compact=False):
     """Uloží data do JSON souboru.
 
+    Zápis je atomický - data se nejprve zapíší do dočasného souboru ve stejném
+    adresáři, který se po úspěšném zápisu přejmenuje na cílový. Při pádu
+    uprostřed zápisu tak zůstane původní soubor nepoškozený. Soubory
+    s příponou `.gz` se průběžně komprimují gzipem.
+
     Args:
         path (str): Cesta k JSON souboru.
         data (dict|list): Data k uložení (výchozí: prázdný slovník).
         encoding (str): Kódování souboru (výchozí: utf-8).
+        compact (bool): Zapíše JSON bez mezer za oddělovači (menší soubor).
 
     Raises:
         FileNotFoundError: Pokud není cesta platná.
@@ -78,16 +122,190 @@ def jsonfile_write(path, data=None, encoding='utf-8'):
     """
     if data is None:
         data = {}
-    with open(path, mode='w', encoding=encoding) as json_file:
-        json.dump(data, json_file)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, mode='wb') as raw_file:
+            if str(path).endswith('.gz'):
+                stream = gzip.GzipFile(filename='', mode='wb', fileobj=raw_file, compresslevel=GZIP_LEVEL)
+            else:
+                stream = raw_file
+            json_file = io.TextIOWrapper(stream, encoding=encoding)
+            json_file.writelines(_iter_json_chunks(data, (',', ':') if compact else (', ', ': ')))
+            json_file.flush()
+            json_file.detach()
+            if stream is not raw_file:
+                stream.close()
+            raw_file.flush()
+            os.fsync(raw_file.fileno())
+        os.chmod(tmp_path, _file_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _iter_json_chunks(data, separators, depth=JSON_STREAM_DEPTH):
+    """Postupně kóduje data do JSON po částech.
+
+    Kontejnery do hloubky `depth` se procházejí po prvcích a každý prvek se
+    kóduje rychlým C enkodérem (`json.dumps`). Výstup je shodný s `json.dump`,
+    ale v paměti je najednou jen jeden zakódovaný prvek a kódování je
+    výrazně rychlejší než čistě pythonovský `json.dump` do souboru.
+    """
+    item_separator, key_separator = separators
+    if depth > 0 and isinstance(data, (list, tuple)) and data:
+        yield '['
+        for i, item in enumerate(data):
+            if i:
+                yield item_separator
+            yield from _iter_json_chunks(item, separators, depth - 1)
+        yield ']'
+    elif depth > 0 and isinstance(data, dict) and data and all(isinstance(key, str) for key in data):
+        yield '{'
+        for i, (key, value) in enumerate(data.items()):
+            if i:
+                yield item_separator
+            yield json.dumps(key) + key_separator
+            yield from _iter_json_chunks(value, separators, depth - 1)
+        yield '}'
+    else:
+        yield json.dumps(data, separators=separators)
+
+
+def _file_mode(path):
+    """Vrací práva pro nový soubor (zachová práva existujícího cílového souboru).
+
+    Pro dosud neexistující soubor se práva zjistí ze zkušebního souboru
+    vytvořeného ve stejném adresáři s právy 0o666 - tedy stejně, jako by
+    soubor vytvořil obyčejný `open()` (umask, výchozí ACL adresáře). Umask
+    procesu se nemění, takže zápis neovlivní soubory vytvářené jinými vlákny.
+    """
+    try:
+        return os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        pass
+
+    directory = os.path.dirname(os.path.abspath(path))
+    probe = os.path.join(directory, f".{os.path.basename(path)}.{uuid.uuid4().hex}.mode")
+    fd = os.open(probe, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        return os.fstat(fd).st_mode & 0o777
+    finally:
+        os.close(fd)
+        os.remove(probe)
+
+
+def jsonlfile_iter(path, encoding='utf-8'):
+    """Postupně čte záznamy JSON Lines souboru (jeden JSON na řádek).
+
+    Soubory s příponou `.gz` se dekomprimují průběžně. Prázdné řádky se přeskakují.
+
+    Args:
+        path (str): Cesta k JSONL souboru.
+        encoding (str): Kódování souboru (výchozí: utf-8).
+
+    Yields:
+        dict|list: Data jednoho řádku.
+
+    Raises:
+        FileNotFoundError: Pokud soubor neexistuje.
+        ValueError: Pokud některý řádek není validní JSON (včetně čísla řádku).
+    """
+    with _open_text(path, 'r', encoding) as jsonl_file:
+        for line_num, line in enumerate(jsonl_file, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Řádek {line_num} není validní JSON: {e}")
+
+
+def jsonlfile_read(path, encoding='utf-8'):
+    """Načte všechny záznamy JSON Lines souboru.
+
+    Args:
+        path (str): Cesta k JSONL souboru.
+        encoding (str): Kódování souboru (výchozí: utf-8).
+
+    Returns:
+        list: Seznam záznamů.
+
+    Raises:
+        FileNotFoundError: Pokud soubor neexistuje.
+        ValueError: Pokud některý řádek není validní JSON.
+    """
+    return list(jsonlfile_iter(path, encoding))
+
+
+def jsonlfile_write(path, data=None, encoding='utf-8'):
+    """Uloží záznamy do JSON Lines souboru.
+
+    Data mohou být libovolný iterovatelný objekt (i generátor), zapisují se
+    po řádcích s konstantní spotřebou paměti. Soubory s příponou `.gz` se
+    průběžně komprimují gzipem.
+
+    Args:
+        path (str): Cesta k JSONL souboru.
+        data (Iterable): Záznamy k uložení (výchozí: prázdný seznam).
+        encoding (str): Kódování souboru (výchozí: utf-8).
+
+    Returns:
+        int: Počet zapsaných řádků.
+
+    Raises:
+        FileNotFoundError: Pokud není cesta platná.
+        TypeError: Pokud záznam není JSON serializovatelný.
+    """
+    if data is None:
+        data = []
+
+    count = 0
+    encoder = json.JSONEncoder().encode
+    with _open_text(path, 'w', encoding) as jsonl_file:
+        rows = iter(data)
+        while True:
+            chunk = list(islice(rows, CSV_CHUNK_SIZE))
+            if not chunk:
+                break
+            jsonl_file.write(''.join(encoder(row) + '\n' for row in chunk))
+            count += len(chunk)
+    return count
 
 
-def csvfile_read(path, encoding='utf-8'):
+def csvfile_iter(path, encoding='utf-8', delimiter=';'):
+    """Postupně čte řádky CSV souboru bez načtení celého souboru do paměti.
+
+    Args:
+        path (str): Cesta k CSV souboru.
+        encoding (str): Kódování souboru (výchozí: utf-8).
+        delimiter (str): Oddělovač sloupců (výchozí: ;).
+
+    Yields:
+        dict: Slovník reprezentující jeden řádek CSV.
+
+    Raises:
+        FileNotFoundError: Pokud soubor neexistuje.
+        Exception: Pokud došlo k chybě při čtení.
+    """
+    with open(path, encoding=encoding, newline='') as csv_file:
+        reader = csv.DictReader(csv_file, delimiter=delimiter, quotechar='"')
+        yield from reader
+
+
+def csvfile_read(path, encoding='utf-8', delimiter=';'):
     """Načte data z CSV souboru.
 
     Args:
         path (str): Cesta k CSV souboru.
         encoding (str): Kódování souboru (výchozí: utf-8).
+        delimiter (str): Oddělovač sloupců (výchozí: ;).
 
     Returns:
         list: Seznam slovníků reprezentujících řádky CSV.
@@ -96,40 +314,152 @@ def csvfile_read(path, encoding='utf-8'):
         FileNotFoundError: Pokud soubor neexistuje.
         Exception: Pokud došlo k chybě při čtení.
     """
-    with open(path, encoding=encoding, newline='\n') as csv_file:
-        reader = csv.DictReader(csv_file, delimiter=';', quotechar='"')
-        return [line for line in reader]
+    return list(csvfile_iter(path, encoding, delimiter))
 
 
-def csvfile_write(path, data=None, encoding='utf-8'):
+def csvfile_write(path, data=None, encoding='utf-8', delimiter=';', fieldnames=None,
+                  chunk_size=CSV_CHUNK_SIZE):
     """Uloží data do CSV souboru.
 
+    Data mohou být libovolný iterovatelný objekt (seznam, generátor),
+    zapisují se po dávkách `chunk_size` řádků s konstantní spotřebou paměti.
+
     Args:
         path (str): Cesta k CSV souboru.
-        data (list): Seznam slovníků reprezentujících řádky CSV (výchozí: prázdný seznam).
+        data (Iterable[dict]): Řádky CSV jako slovníky (výchozí: prázdný seznam).
         encoding (str): Kódování souboru (výchozí: utf-8).
+        delimiter (str): Oddělovač sloupců (výchozí: ;, stejně jako při čtení).
+        fieldnames (list): Názvy sloupců (výchozí: klíče prvního řádku).
+        chunk_size (int): Počet řádků zapsaných najednou.
+
+    Returns:
+        int: Počet zapsaných řádků.
 
     Raises:
         FileNotFoundError: Pokud není cesta platná.
-        IndexError: Pokud je seznam dat prázdný.
-        ValueError: Pokud data nejsou validní seznamem slovníků.
+        ValueError: Pokud jsou data prázdná nebo nejsou slovníky.
         Exception: Pokud došlo k chybě při zápisu.
     """
     if data is None:
         data = []
-    
-    if not data:
-        raise ValueError("Data nesmí být prázdné.")
-    
-    if not isinstance(data, list):
+
+    if isinstance(data, (dict, str, bytes)):
         raise ValueError("Data musí být seznam slovníků.")
-    
-    if not isinstance(data[0], dict):
+
+    rows = iter(data)
+    try:
+        first = next(rows)
+    except StopIteration:
+        raise ValueError("Data nesmí být prázdné.")
+
+    if not isinstance(first, dict):
         raise ValueError("Každý prvek dat musí být slovník.")
-    
-    with open(path, mode='w', encoding=encoding, newline='\n') as file:
-        writer = csv.DictWriter(file, fieldnames=list(data[0].keys()))
+
+    if fieldnames is None:
+        fieldnames = list(first.keys())
+
+    count = 1
+    with open(path, mode='w', encoding=encoding, newline='', buffering=CSV_BUFFER_SIZE) as file:
+        writer = csv.DictWriter(file, fieldnames=fieldnames, delimiter=delimiter, quotechar='"')
         writer.writeheader()
-        for row in data:
-            writer.writerow(row)
+        writer.writerow(first)
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            writer.writerows(chunk)
+            count += len(chunk)
+
+    return count
+
+
+def _get_io_executor():
+    """Vrací sdílený pool vláken pro asynchronní I/O (vytvoří ho při prvním použití)."""
+    global _io_executor
+    with _io_executor_lock:
+        if _io_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            _io_executor = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix='files-io')
+        return _io_executor
+
+
+def set_io_workers(workers):
+    """Nastaví počet vláken pro asynchronní I/O.
+
+    Rozpracované operace ve starém poolu doběhnou, nové už půjdou do nového.
 
+    Args:
+        workers (int): Maximální počet souběžných I/O operací.
+
+    Raises:
+        ValueError: Pokud je počet menší než 1.
+    """
+    global _io_executor, IO_WORKERS
+    if workers < 1:
+        raise ValueError("Počet I/O vláken musí být alespoň 1.")
+    with _io_executor_lock:
+        old_executor = _io_executor
+        IO_WORKERS = workers
+        _io_executor = None
+    if old_executor is not None:
+        old_executor.shutdown(wait=False)
+
+
+async def _run_io(func, *args, **kwargs):
+    """Spustí blokující funkci v I/O poolu a počká na výsledek."""
+    import asyncio
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_io_executor(), partial(func, *args, **kwargs))
+
+
+async def textfile_read_async(path, encoding='utf-8'):
+    """Asynchronní varianta `textfile_read`."""
+    return await _run_io(textfile_read, path, encoding)
+
+
+async def textfile_write_async(path, data='', encoding='utf-8'):
+    """Asynchronní varianta `textfile_write`."""
+    return await _run_io(textfile_write, path, data, encoding)
+
+
+async def jsonfile_read_async(path, encoding='utf-8'):
+    """Asynchronní varianta `jsonfile_read`."""
+    return await _run_io(jsonfile_read, path, encoding)
+
+
+async def jsonfile_write_async(path, data=None, encoding='utf-8', compact=False):
+    """Asynchronní varianta `jsonfile_write`.
+
+    Data se serializují až ve vlákně poolu, volající je do dokončení
+    zápisu nemá měnit.
+    """
+    return await _run_io(jsonfile_write, path, data, encoding, compact)
+
+
+async def jsonlfile_read_async(path, encoding='utf-8'):
+    """Asynchronní varianta `jsonlfile_read`."""
+    return await _run_io(jsonlfile_read, path, encoding)
+
+
+async def jsonlfile_write_async(path, data=None, encoding='utf-8'):
+    """Asynchronní varianta `jsonlfile_write`.
+
+    Předaný generátor se prochází ve vlákně poolu, nesmí ho tedy zároveň
+    používat nikdo jiný.
+    """
+    return await _run_io(jsonlfile_write, path, data, encoding)
+
+
+async def csvfile_read_async(path, encoding='utf-8', delimiter=';'):
+    """Asynchronní varianta `csvfile_read`."""
+    return await _run_io(csvfile_read, path, encoding, delimiter)
+
+
+async def csvfile_write_async(path, data=None, encoding='utf-8', delimiter=';', fieldnames=None,
+                              chunk_size=CSV_CHUNK_SIZE):
+    """Asynchronní varianta `csvfile_write`.
+
+    Předaný generátor se prochází ve vlákně poolu, nesmí ho tedy zároveň
+    používat nikdo jiný.
+    """
+    return await _run_io(csvfile_write, path, data, encoding, delimiter, fieldnames, chunk_size)
@@ -1,7 +1,11 @@
 import datetime
+import gc
+import math
 from enum import Enum
-from random import randrange
-from files import jsonfile_read, jsonfile_write
+from functools import lru_cache
+from random import randrange, getrandbits, Random
+from typing import Dict, Tuple
+from files import jsonfile_read, jsonfile_write, jsonlfile_iter, jsonlfile_write, csvfile_iter, csvfile_write
 
 
 class Gender(Enum):
@@ -14,11 +18,12 @@ class Dice:
     """Třída simulující hod kostkou s nastavitelným rozsahem hodnot."""
 
     @staticmethod
-    def roll(max_value=6):
+    def roll(max_value=6, rng=None):
         """Provede hod kostkou.
 
         Args:
             max_value (int): Maximální hodnota (výchozí: 6, musí být 4-9).
+            rng (Random): Vlastní generátor náhodných čísel (výchozí: globální `random`).
 
         Returns:
             int: Náhodné číslo v rozmezí 1 až max_value (včetně).
@@ -28,7 +33,9 @@ class Dice:
         """
         if max_value < 4 or max_value > 9:
             raise ValueError("Maximální hodnota musí být v rozmezí 4 až 9.")
-        return randrange(1, max_value + 1)
+        if rng is None:
+            return randrange(1, max_value + 1)
+        return rng.randrange(1, max_value + 1)
 
 
 class Person:
@@ -74,8 +81,91 @@ class Person:
         return int((datetime.datetime.now() - self._birth).total_seconds())
 
 
+class PlayerStats:
+    """Herní statistiky hráče (počet zápasů, výhry, skóre) v jednom kontextu."""
+
+    __slots__ = ('count_of_games', '_wins', 'score')
+
+    def __init__(self):
+        """Inicializuje nulové statistiky."""
+        self.count_of_games = 0
+        self.wins = 0
+        self.score = {'plus': 0, 'minus': 0}
+
+    @property
+    def wins(self):
+        """Vrací počet výher hráče."""
+        return self._wins
+
+    @wins.setter
+    def wins(self, value):
+        """Nastaví počet výher hráče.
+
+        Args:
+            value (int): Počet výher.
+
+        Raises:
+            ValueError: Pokud value je záporné číslo.
+        """
+        if value < 0:
+            raise ValueError("Property wins must not be a negative value")
+        self._wins = value
+
+    def win_rate(self):
+        """Vrací procento výher hráče.
+
+        Returns:
+            float: Procento výher zaokrouhlené na 2 desetinná místa.
+        """
+        return round(self.wins / self.count_of_games * 100, 2) if self.count_of_games > 0 else 0.0
+
+    def overall_score(self):
+        """Vrací celkové skóre hráče.
+
+        Returns:
+            tuple: Tuple (plus_body, minus_body).
+        """
+        return self.score["plus"], self.score["minus"]
+
+
+class StatsContext:
+    """Statistiky hráčů jednoho turnaje (overlay nad sdílenými instancemi Player).
+
+    Zápasy a turnaj zapisují statistiky sem, ne do hráčů. Jednu načtenou
+    soupisku tak může bez kopírování a zámků používat více turnajů
+    najednou (i v různých vláknech) - každý má svůj kontext.
+    """
+
+    def __init__(self):
+        """Inicializuje prázdný kontext."""
+        self._stats: Dict['Player', PlayerStats] = {}
+
+    def __len__(self):
+        """Vrací počet hráčů, kteří mají v kontextu statistiky."""
+        return len(self._stats)
+
+    def __getitem__(self, player: 'Player') -> PlayerStats:
+        """Vrací statistiky hráče (při prvním přístupu je založí).
+
+        Args:
+            player (Player): Hráč (rozlišuje se instance, ne přezdívka).
+
+        Returns:
+            PlayerStats: Statistiky hráče v tomto kontextu.
+        """
+        stats = self._stats.get(player)
+        if stats is None:
+            stats = self._stats.setdefault(player, PlayerStats())
+        return stats
+
+
 class Player(Person):
-    """Třída reprezentující hráče s informacemi o stavů, hrách, výhrách a skóre."""
+    """Třída reprezentující hráče s informacemi o stavů, hrách, výhrách a skóre.
+
+    Turnaje vedou statistiky hráčů ve vlastním `StatsContext`. Atributy
+    `count_of_games`, `wins` a `score` hráče jsou jeho vlastní statistiky
+    (`stats`), do kterých zapisují jen zápasy hrané bez kontextu.
+    """
 
     def __init__(self, nickname: str, gender: Gender, state: str):
         """Inicializuje hráče.
@@ -87,18 +177,66 @@ class Player(Person):
         """
         super().__init__(nickname, gender)
         self.state = state
-        self.count_of_games = 0
-        self.wins = 0
-        self.score = {'plus': 0, 'minus': 0}
+        self._stats = None
 
     def __str__(self):
         """Vrací textovou reprezentaci hráče."""
         return f'{super().__str__()}, state: {self.state}'
 
+    @classmethod
+    def from_columns(cls, nicknames, genders, states) -> list:
+        """Hromadně vytvoří hráče z již ověřených sloupců (bez validace).
+
+        Rychlá cesta pro načítání velkých soupisek (viz `roster_snapshot`):
+        atributy se nastaví přímo a během vytváření se pozastaví garbage
+        collector. Všichni hráči dostanou stejný čas vzniku.
+
+        Args:
+            nicknames: Přezdívky hráčů.
+            genders: Pohlaví hráčů (instance `Gender`).
+            states: Státy hráčů.
+
+        Returns:
+            list: Seznam instancí třídy Player.
+        """
+        birth = datetime.datetime.now()
+        new = cls.__new__
+        players = []
+        append = players.append
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for nickname, gender, state in zip(nicknames, genders, states):
+                player = new(cls)
+                player.__dict__ = {'nickname': nickname, '_gender': gender, '_birth': birth,
+                                   'state': state, '_stats': None}
+                append(player)
+        finally:
+            if gc_enabled:
+                gc.enable()
+        return players
+
+    @property
+    def stats(self) -> PlayerStats:
+        """Vrací vlastní statistiky hráče (mimo kontext turnaje)."""
+        if self._stats is None:
+            self._stats = PlayerStats()
+        return self._stats
+
+    @property
+    def count_of_games(self):
+        """Vrací počet odehraných zápasů hráče."""
+        return self.stats.count_of_games
+
+    @count_of_games.setter
+    def count_of_games(self, value):
+        """Nastaví počet odehraných zápasů hráče."""
+        self.stats.count_of_games = value
+
     @property
     def wins(self):
         """Vrací počet výher hráče."""
-        return self._wins
+        return self.stats.wins
 
     @wins.setter
     def wins(self, value):
@@ -110,9 +248,12 @@ class Player(Person):
         Raises:
             ValueError: Pokud value je záporné číslo.
         """
-        if value < 0:
-            raise ValueError("Property wins must not be a negative value")
-        self._wins = value
+        self.stats.wins = value
+
+    @property
+    def score(self):
+        """Vrací skóre hráče ve tvaru {'plus': ..., 'minus': ...}."""
+        return self.stats.score
 
     def win_rate(self):
         """Vrací procento výher hráče.
@@ -120,7 +261,7 @@ class Player(Person):
         Returns:
             float: Procento výher zaokrouhlené na 2 desetinná místa.
         """
-        return round(self.wins / self.count_of_games * 100, 2) if self.count_of_games > 0 else 0.0
+        return self.stats.win_rate()
 
     def overall_score(self):
         """Vrací celkové skóre hráče.
@@ -128,13 +269,22 @@ class Player(Person):
         Returns:
             tuple: Tuple (plus_body, minus_body).
         """
-        return self.score["plus"], self.score["minus"]
+        return self.stats.overall_score()
 
 
 class Match:
-    """Třída reprezentující zápas mezi dvěma hráči s logikou hry a ukládáním výsledků."""
+    """Třída reprezentující zápas mezi dvěma hráči s logikou hry a ukládáním výsledků.
+
+    Zápas hází kostkami z vlastního generátoru inicializovaného seedem, je
+    tedy plně určen seedem a nastavením. Historie skóre se proto neukládá,
+    ale při potřebě (`get_history`) se deterministicky přehraje.
+    """
+
+    __slots__ = ('_hplayer', '_gplayer', 'winning_score', 'max_dice_value', '_datetime',
+                 'hp_points', 'gp_points', 'seed', 'stats')
 
-    def __init__(self, house_player: Player, guest_player: Player, winning_score=10, max_dice_value=6):
+    def __init__(self, house_player: Player, guest_player: Player, winning_score=10, max_dice_value=6,
+                 seed=None, stats=None):
         """Inicializuje zápas.
 
         Args:
@@ -142,6 +292,9 @@ class Match:
             guest_player (Player): Hostující hráč.
             winning_score (int): Počet bodů k vítězství (výchozí: 10).
             max_dice_value (int): Maximální hodnota kostky (výchozí: 6).
+            seed (int): Seed generátoru hodů (výchozí: odvozen z globálního `random`).
+            stats (StatsContext): Kontext, do kterého se zapíší statistiky hráčů
+                (výchozí: vlastní statistiky hráčů).
         """
         self.h_player = house_player
         self.g_player = guest_player
@@ -150,7 +303,8 @@ class Match:
         self._datetime = datetime.datetime.now()
         self.hp_points = 0
         self.gp_points = 0
-        self._history = []
+        self.seed = seed if seed is not None else getrandbits(64)
+        self.stats = stats
 
     def __str__(self):
         """Vrací textovou reprezentaci zápasu."""
@@ -196,42 +350,73 @@ class Match:
         else:
             raise TypeError("g_player must be instance of Player")
 
-    def __roll(self):
-        """Provede hod kostkou pro oba hráče.
+    @staticmethod
+    def _roll_point(rng, max_dice_value):
+        """Hází kostkami pro oba hráče, dokud jeden nehodí víc (bez remízy).
 
-        Zajistí, aby oba hráči nehodili stejnou hodnotu (bez remízy).
+        Args:
+            rng (Random): Generátor hodů zápasu.
+            max_dice_value (int): Maximální hodnota kostky.
 
         Returns:
             int: 0 pokud domácí hráč vyhraje, 1 pokud hostující hráč vyhraje.
         """
         while True:
-            hp = Dice.roll(self.max_dice_value)
-            gp = Dice.roll(self.max_dice_value)
+            hp = Dice.roll(max_dice_value, rng)
+            gp = Dice.roll(max_dice_value, rng)
             if hp != gp:
                 break
         return 0 if hp > gp else 1
 
     def play(self):
         """Odehraje zápas mezi dvěma hráči až do dosažení výherního skóre."""
+        # Generátor žije jen po dobu hry - historii lze přehrát ze seedu
+        rng = Random(self.seed)
         while self.hp_points < self.winning_score and self.gp_points < self.winning_score:
-            if self.__roll() == 0:
+            if Match._roll_point(rng, self.max_dice_value) == 0:
                 self.hp_points += 1
             else:
                 self.gp_points += 1
-            self._history.append(self.score())
+        self._update_players()
+
+    def apply_result(self, hp_points: int, gp_points: int):
+        """Zapíše známý výsledek zápasu bez simulace (např. z cache) a započte ho hráčům.
+
+        Výsledek musí odpovídat seedu zápasu, jinak přehraná historie nebude sedět.
+
+        Args:
+            hp_points (int): Body domácího hráče.
+            gp_points (int): Body hostujícího hráče.
 
-        self.h_player.count_of_games += 1
-        self.g_player.count_of_games += 1
+        Raises:
+            ValueError: Pokud skóre není platný konečný výsledek zápasu.
+        """
+        if (max(hp_points, gp_points) != self.winning_score
+                or not 0 <= min(hp_points, gp_points) < self.winning_score):
+            raise ValueError(f"Neplatný výsledek zápasu {hp_points}:{gp_points}.")
+        self.hp_points = hp_points
+        self.gp_points = gp_points
+        self._update_players()
+
+    def _update_players(self):
+        """Započte odehraný zápas do statistik obou hráčů (v kontextu `stats`, je-li zadán)."""
+        if self.stats is None:
+            h_stats, g_stats = self.h_player.stats, self.g_player.stats
+        else:
+            h_stats, g_stats = self.stats[self.h_player], self.stats[self.g_player]
 
-        self.h_player.score['plus'] += self.hp_points
-        self.h_player.score['minus'] += self.gp_points
-        self.g_player.score['plus'] += self.gp_points
-        self.g_player.score['minus'] += self.hp_points
+        h_stats.count_of_games += 1
+        g_stats.count_of_games += 1
+
+        h_stats.score['plus'] += self.hp_points
+        h_stats.score['minus'] += self.gp_points
+        g_stats.score['plus'] += self.gp_points
+        g_stats.score['minus'] += self.hp_points
 
         if self.hp_points > self.gp_points:
-            self.h_player.wins += 1
+            h_stats.wins += 1
         else:
-            self.g_player.wins += 1
+            g_stats.wins += 1
 
     def score(self):
         """Vrací aktuální skóre zápasu.
@@ -244,28 +429,66 @@ class Match:
     def get_history(self):
         """Vrací historii všech kol zápasu.
 
+        Historie se neukládá, ale přehraje ze seedu zápasu (viz `replay_history`).
+
         Returns:
             list: Seznam skóre po každém kole.
         """
-        return self._history
+        return Match.replay_history(self.seed, self.winning_score, self.max_dice_value,
+                                    self.hp_points + self.gp_points)
+
+    @staticmethod
+    def replay_history(seed, winning_score=10, max_dice_value=6, points=None):
+        """Deterministicky přehraje zápas ze seedu a vrátí historii skóre.
+
+        Args:
+            seed (int): Seed zápasu (`Match.seed`).
+            winning_score (int): Počet bodů k vítězství.
+            max_dice_value (int): Maximální hodnota kostky.
+            points (int): Počet odehraných bodů (výchozí: celý zápas).
+
+        Returns:
+            list: Seznam skóre (domácí_body, hostující_body) po každém kole.
+        """
+        rng = Random(seed)
+        hp_points = gp_points = 0
+        history = []
+        while hp_points < winning_score and gp_points < winning_score:
+            if points is not None and len(history) >= points:
+                break
+            if Match._roll_point(rng, max_dice_value) == 0:
+                hp_points += 1
+            else:
+                gp_points += 1
+            history.append((hp_points, gp_points))
+        return history
+
+    def get_result(self):
+        """Vrací výsledek zápasu ve formátu výsledkového souboru.
 
-    def save_match_results(self, filename="results.json"):
+        Returns:
+            dict: Datum, hráči a skóre zápasu.
+        """
+        return {
+            "date": self._datetime.strftime("%Y-%m-%d %H:%M:%S"),
+            "house_player": self.h_player.nickname,
+            "guest_player": self.g_player.nickname,
+            "score": self.score()
+        }
+
+    def save_match_results(self, filename="results.json", database=None):
         """Uloží výsledky zápasu do JSON souboru.
 
         Args:
             filename (str): Název souboru pro uložení (výchozí: results.json).
+            database (ResultsDatabase): Volitelné SQLite úložiště, kam se zápas uloží také.
 
         Raises:
             FileNotFoundError: Pokud není cesta k souboru platná.
             IOError: Pokud došlo k chybě při čtení nebo zápisu.
         """
         try:
-            result = {
-                "date": self._datetime.strftime("%Y-%m-%d %H:%M:%S"),
-                "house_player": self.h_player.nickname,
-                "guest_player": self.g_player.nickname,
-                "score": self.score()
-            }
+            result = self.get_result()
             try:
                 results = jsonfile_read(filename)
             except FileNotFoundError:
@@ -273,15 +496,199 @@ class Match:
             
             results.append(result)
             jsonfile_write(filename, results)
+
+            if database is not None:
+                database.save_match(result)
         except (FileNotFoundError, IOError) as e:
             raise IOError(f"Chyba při ukládání výsledků zápasu: {e}")
 
+    def win_probability(self) -> float:
+        """Vrací přesnou pravděpodobnost výhry domácího hráče z aktuálního skóre.
+
+        Returns:
+            float: Pravděpodobnost v rozmezí 0 až 1.
+        """
+        return MatchPredictor.for_config(self.winning_score, self.max_dice_value).win_probability(self.score())
+
+
+class MatchPredictor:
+    """Přesný analytický model zápasu bez simulace.
+
+    Pro dané `winning_score` a `max_dice_value` spočítá dynamickým
+    programováním pravděpodobnost výhry z libovolného skóre, očekávaný
+    počet zbývajících bodů a rozdělení délky zápasu. Tabulky se počítají
+    jednou pro každou konfiguraci (viz `for_config`), dotazy jsou pak
+    jen vyhledání v tabulce.
+    """
+
+    def __init__(self, winning_score=10, max_dice_value=6):
+        """Inicializuje prediktor a předpočítá tabulky.
+
+        Args:
+            winning_score (int): Počet bodů k vítězství (výchozí: 10).
+            max_dice_value (int): Maximální hodnota kostky (výchozí: 6).
+
+        Raises:
+            ValueError: Pokud je winning_score menší než 1 nebo max_dice_value není 4-9.
+        """
+        if winning_score < 1:
+            raise ValueError("Počet bodů k vítězství musí být alespoň 1.")
+        if max_dice_value < 4 or max_dice_value > 9:
+            raise ValueError("Maximální hodnota musí být v rozmezí 4 až 9.")
+
+        self.winning_score = winning_score
+        self.max_dice_value = max_dice_value
+
+        # Pravděpodobnost, že bod získá domácí hráč (remízy se přehazují)
+        faces = range(1, max_dice_value + 1)
+        house_wins = sum(1 for hp in faces for gp in faces if hp > gp)
+        decisive = sum(1 for hp in faces for gp in faces if hp != gp)
+        self.point_probability = house_wins / decisive
+        # Očekávaný počet hodů (dvojic kostek) na jeden rozhodnutý bod
+        self.rolls_per_point = max_dice_value ** 2 / decisive
+
+        self._win = self._build_win_table()
+        self._expected = self._build_expected_table()
+        self._distributions: Dict[Tuple[int, int], Dict[int, float]] = {}
+
+    @staticmethod
+    def for_config(winning_score=10, max_dice_value=6) -> 'MatchPredictor':
+        """Vrací sdílený (memoizovaný) prediktor pro danou konfiguraci.
+
+        Args:
+            winning_score (int): Počet bodů k vítězství.
+            max_dice_value (int): Maximální hodnota kostky.
+
+        Returns:
+            MatchPredictor: Instance prediktoru s předpočítanými tabulkami.
+        """
+        return _cached_predictor(winning_score, max_dice_value)
+
+    def _build_win_table(self):
+        """Spočítá tabulku pravděpodobností výhry domácího hráče."""
+        n = self.winning_score
+        p = self.point_probability
+        win = [[0.0] * (n + 1) for _ in range(n + 1)]
+        for h in range(n, -1, -1):
+            for g in range(n, -1, -1):
+                if h == n and g < n:
+                    win[h][g] = 1.0
+                elif g == n or h == n:
+                    win[h][g] = 0.0
+                else:
+                    win[h][g] = p * win[h + 1][g] + (1 - p) * win[h][g + 1]
+        return win
+
+    def _build_expected_table(self):
+        """Spočítá tabulku očekávaného počtu zbývajících bodů."""
+        n = self.winning_score
+        p = self.point_probability
+        expected = [[0.0] * (n + 1) for _ in range(n + 1)]
+        for h in range(n - 1, -1, -1):
+            for g in range(n - 1, -1, -1):
+                expected[h][g] = 1 + p * expected[h + 1][g] + (1 - p) * expected[h][g + 1]
+        return expected
+
+    def _check_score(self, score):
+        """Ověří skóre a vrátí ho jako dvojici celých čísel.
+
+        Raises:
+            ValueError: Pokud skóre není dosažitelné v této konfiguraci.
+        """
+        h, g = score
+        n = self.winning_score
+        if h < 0 or g < 0 or h > n or g > n or (h == n and g == n):
+            raise ValueError(f"Neplatné skóre {score} pro zápas do {n} bodů.")
+        return h, g
+
+    def win_probability(self, score=(0, 0)) -> float:
+        """Vrací pravděpodobnost výhry domácího hráče.
+
+        Args:
+            score (tuple): Aktuální skóre (domácí_body, hostující_body), viz `Match.score()`.
+
+        Returns:
+            float: Pravděpodobnost výhry domácího hráče.
+        """
+        h, g = self._check_score(score)
+        return self._win[h][g]
+
+    def expected_remaining_points(self, score=(0, 0)) -> float:
+        """Vrací očekávaný počet zbývajících bodů (kol) zápasu.
+
+        Args:
+            score (tuple): Aktuální skóre (domácí_body, hostující_body).
+
+        Returns:
+            float: Očekávaný počet bodů do konce zápasu.
+        """
+        h, g = self._check_score(score)
+        return self._expected[h][g]
+
+    def expected_remaining_rolls(self, score=(0, 0)) -> float:
+        """Vrací očekávaný počet zbývajících hodů včetně přehazovaných remíz.
+
+        Args:
+            score (tuple): Aktuální skóre (domácí_body, hostující_body).
+
+        Returns:
+            float: Očekávaný počet hodů do konce zápasu.
+        """
+        return self.expected_remaining_points(score) * self.rolls_per_point
+
+    def length_distribution(self, score=(0, 0)) -> Dict[int, float]:
+        """Vrací rozdělení celkové délky zápasu (počtu bodů, viz `match_duration`).
+
+        Args:
+            score (tuple): Aktuální skóre (domácí_body, hostující_body).
+
+        Returns:
+            Dict[int, float]: Slovník délka -> pravděpodobnost (kopie, úpravy
+                neovlivní další volání).
+        """
+        h, g = self._check_score(score)
+        if (h, g) in self._distributions:
+            return dict(self._distributions[(h, g)])
+
+        n = self.winning_score
+        p = self.point_probability
+        q = 1 - p
+        distribution: Dict[int, float] = {}
+
+        if h == n or g == n:
+            distribution[h + g] = 1.0
+        else:
+            need_h = n - h
+            need_g = n - g
+            # Domácí získá poslední bod, host mezitím j bodů (a naopak)
+            for j in range(need_g):
+                length = h + g + need_h + j
+                distribution[length] = distribution.get(length, 0.0) + \
+                    math.comb(need_h - 1 + j, j) * p ** need_h * q ** j
+            for j in range(need_h):
+                length = h + g + need_g + j
+                distribution[length] = distribution.get(length, 0.0) + \
+                    math.comb(need_g - 1 + j, j) * q ** need_g * p ** j
+
+        distribution = dict(sorted(distribution.items()))
+        self._distributions[(h, g)] = distribution
+        return dict(distribution)
+
+
+@lru_cache(maxsize=32)
+def _cached_predictor(winning_score, max_dice_value):
+    """Vytvoří prediktor pro konfiguraci (výsledek je memoizován)."""
+    return MatchPredictor(winning_score, max_dice_value)
+
 
 def load_players(json_file: str):
-    """Načte hráče ze JSON souboru a vytvoří seznam instancí Player.
+    """Načte hráče ze JSON (nebo JSONL či CSV) souboru a vytvoří seznam instancí Player.
+
+    Soubory s příponou `.csv` (oddělovač `;`, sloupce nickname, gender, state)
+    a `.jsonl` / `.jsonl.gz` (jeden hráč na řádek) se čtou postupně po řádcích.
 
     Args:
-        json_file (str): Cesta k JSON souboru s daty o hráčích.
+        json_file (str): Cesta k JSON, JSONL nebo CSV souboru s daty o hráčích.
 
     Returns:
         list: Seznam instancí třídy Player.
@@ -292,15 +699,35 @@ def load_players(json_file: str):
         KeyError: Pokud chybí povinné klíče v datech hráčů.
         ValueError: Pokud je pohlaví hráče neplatné.
     """
+    if json_file.lower().endswith('.csv'):
+        data = csvfile_iter(json_file)
+    elif json_file.lower().endswith(('.jsonl', '.jsonl.gz')):
+        data = jsonlfile_iter(json_file)
+    else:
+        data = jsonfile_read(json_file)
+        if not isinstance(data, list):
+            raise ValueError("JSON soubor musí obsahovat seznam hráčů.")
+
+    return players_from_rows(data)
+
+
+def players_from_rows(rows):
+    """Vytvoří hráče ze záznamů (slovníků s klíči nickname, gender, state).
+
+    Args:
+        rows: Iterovatelná posloupnost záznamů (např. načtený JSON).
+
+    Returns:
+        list: Seznam instancí třídy Player.
+
+    Raises:
+        KeyError: Pokud chybí povinné klíče v datech hráčů.
+        ValueError: Pokud záznam není slovník nebo je pohlaví hráče neplatné.
+    """
     players = []
-    data = jsonfile_read(json_file)
-    
-    if not isinstance(data, list):
-        raise ValueError("JSON soubor musí obsahovat seznam hráčů.")
-    
     required_keys = {'nickname', 'gender', 'state'}
     
-    for i, row in enumerate(data):
+    for i, row in enumerate(rows):
         if not isinstance(row, dict):
             raise ValueError(f"Řádek {i} není slovník.")
         
@@ -316,3 +743,22 @@ def load_players(json_file: str):
         players.append(Player(row['nickname'], gender, row['state']))
     
     return players
+
+
+def save_players(path: str, players):
+    """Uloží hráče do JSON, JSONL nebo CSV souboru (podle přípony) ve formátu pro `load_players`.
+
+    Args:
+        path (str): Cesta k výstupnímu souboru.
+        players (Iterable[Player]): Hráči k uložení.
+
+    Raises:
+        ValueError: Pokud je seznam hráčů prázdný (CSV).
+    """
+    rows = ({"nickname": p.nickname, "gender": p.gender.value, "state": p.state} for p in players)
+    if path.lower().endswith('.csv'):
+        csvfile_write(path, rows, fieldnames=["nickname", "gender", "state"])
+    elif path.lower().endswith(('.jsonl', '.jsonl.gz')):
+        jsonlfile_write(path, rows)
+    else:
+        jsonfile_write(path, list(rows))
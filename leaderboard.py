@@ -0,0 +1,210 @@
+"""Kariérní žebříček hráčů přes všechny turnaje (SQLite, pouze stdlib `sqlite3`).
+
+Na rozdíl od `results_db.ResultsDatabase.leaderboard`, který součty
+počítá agregací nad všemi uloženými turnaji, drží `Leaderboard` pro
+každého hráče přímo průběžné součty (turnaje, zápasy, výhry, body,
+tituly). Po skončení turnaje se součty jeho hráčů jen přičtou
+(`INSERT ... ON CONFLICT DO UPDATE`) - aktualizace stojí O(počet hráčů
+turnaje) a historie se nikdy znovu neprochází.
+
+Každý turnaj se započte nejvýše jednou: jeho otisk (hash informací
+o turnaji a konečného pořadí) se ukládá v tabulce `events` a opakované
+započtení stejných výsledků se přeskočí.
+
+Indexy nad výhrami, tituly a úspěšností drží dotazy na prvních N hráčů
+rychlé i pro miliony hráčů, dotaz na jednoho hráče jde přes primární klíč.
+"""
+
+import hashlib
+import json
+import sqlite3
+from typing import Dict, List, Optional
+from files import jsonfile_read
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS career (
+    nickname TEXT PRIMARY KEY,
+    state TEXT,
+    tournaments INTEGER NOT NULL DEFAULT 0,
+    games INTEGER NOT NULL DEFAULT 0,
+    wins INTEGER NOT NULL DEFAULT 0,
+    score_plus INTEGER NOT NULL DEFAULT 0,
+    score_minus INTEGER NOT NULL DEFAULT 0,
+    titles INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS events (
+    event_key TEXT PRIMARY KEY,
+    date TEXT,
+    location TEXT,
+    type TEXT,
+    winner TEXT
+) WITHOUT ROWID;
+"""
+
+# Pořadí žebříčku -> výraz pro ORDER BY (každé má vlastní index)
+ORDERS = {
+    "wins": "wins DESC, score_plus - score_minus DESC",
+    "titles": "titles DESC, wins DESC",
+    "win_rate": "CAST(wins AS REAL) / games DESC, games DESC",
+}
+
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_career_wins ON career(wins DESC, score_plus - score_minus DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_career_titles ON career(titles DESC, wins DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_career_win_rate ON career(CAST(wins AS REAL) / games DESC, games DESC)",
+]
+
+COLUMNS = "nickname, state, tournaments, games, wins, score_plus, score_minus, titles"
+
+
+def event_key(results: Dict) -> str:
+    """Vrací otisk výsledků turnaje (stejné výsledky = stejný otisk).
+
+    Args:
+        results (Dict): Výsledky ve formátu `BaseTournament.get_results()`.
+
+    Returns:
+        str: Hexadecimální SHA-256 informací o turnaji a konečného pořadí.
+    """
+    payload = {"info": results["tournament_info"], "standings": results["final_standings"]}
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class Leaderboard:
+    """Průběžně aktualizovaný kariérní žebříček hráčů."""
+
+    def __init__(self, path: str = "leaderboard.db"):
+        """Otevře (nebo založí) žebříček.
+
+        Args:
+            path (str): Cesta k souboru databáze (":memory:" pro dočasný žebříček).
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        with self._conn:
+            for statement in INDEXES:
+                self._conn.execute(statement)
+
+    def __enter__(self):
+        """Umožňuje použití v bloku with."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Při opuštění bloku with uzavře databázi."""
+        self.close()
+
+    def __len__(self):
+        """Vrací počet hráčů v žebříčku."""
+        return self._conn.execute("SELECT COUNT(*) FROM career").fetchone()[0]
+
+    def close(self):
+        """Uzavře spojení s databází."""
+        self._conn.close()
+
+    def record(self, results: Dict) -> bool:
+        """Přičte výsledky skončeného turnaje ke kariérním součtům hráčů.
+
+        Args:
+            results (Dict): Výsledky ve formátu `BaseTournament.get_results()`.
+
+        Returns:
+            bool: False, pokud už byl turnaj započten dříve (nic se nezmění).
+        """
+        info = results["tournament_info"]
+        winner = results["winner"]["nickname"] if results.get("winner") else None
+
+        with self._conn:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO events (event_key, date, location, type, winner) VALUES (?, ?, ?, ?, ?)",
+                (event_key(results), info["date"], info["location"], info["type"], winner)
+            )
+            if cursor.rowcount == 0:
+                return False
+
+            self._conn.executemany(
+                f"INSERT INTO career ({COLUMNS}) VALUES (?, ?, 1, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(nickname) DO UPDATE SET "
+                "state = COALESCE(excluded.state, state), "
+                "tournaments = tournaments + 1, "
+                "games = games + excluded.games, "
+                "wins = wins + excluded.wins, "
+                "score_plus = score_plus + excluded.score_plus, "
+                "score_minus = score_minus + excluded.score_minus, "
+                "titles = titles + excluded.titles",
+                (
+                    (s["player"], s.get("state"), s["games"], s["wins"],
+                     s["score_plus"], s["score_minus"], int(s["player"] == winner))
+                    for s in results["final_standings"]
+                )
+            )
+        return True
+
+    def import_file(self, filename: str) -> bool:
+        """Započte výsledky ze souboru vytvořeného `save_tournament_results`.
+
+        Args:
+            filename (str): Cesta k výsledkovému souboru.
+
+        Returns:
+            bool: False, pokud už byl turnaj započten dříve.
+        """
+        return self.record(jsonfile_read(filename))
+
+    @staticmethod
+    def _row_to_dict(row) -> Dict:
+        """Převede řádek tabulky career na slovník s odvozenými hodnotami."""
+        nickname, state, tournaments, games, wins, score_plus, score_minus, titles = row
+        return {
+            "nickname": nickname,
+            "state": state,
+            "tournaments": tournaments,
+            "games": games,
+            "wins": wins,
+            "losses": games - wins,
+            "score_plus": score_plus,
+            "score_minus": score_minus,
+            "score_difference": score_plus - score_minus,
+            "titles": titles,
+            "win_rate": round(wins / games * 100, 2) if games > 0 else 0.0
+        }
+
+    def top(self, limit: int = 10, order: str = "wins") -> List[Dict]:
+        """Vrací prvních `limit` hráčů žebříčku.
+
+        Args:
+            limit (int): Maximální počet hráčů.
+            order (str): Řazení - "wins" (výhry, pak rozdíl skóre), "titles" nebo "win_rate".
+
+        Returns:
+            List[Dict]: Kariérní statistiky hráčů v pořadí žebříčku.
+
+        Raises:
+            ValueError: Pokud je řazení neznámé.
+        """
+        if order not in ORDERS:
+            raise ValueError(f"Neznámé řazení '{order}'. Podporované: {', '.join(ORDERS)}")
+        where = "WHERE games > 0 " if order == "win_rate" else ""
+        rows = self._conn.execute(
+            f"SELECT {COLUMNS} FROM career {where}ORDER BY {ORDERS[order]} LIMIT ?", (limit,)
+        )
+        return [self._row_to_dict(row) for row in rows]
+
+    def player(self, nickname: str) -> Optional[Dict]:
+        """Vrací kariérní statistiky jednoho hráče.
+
+        Args:
+            nickname (str): Přezdívka hráče.
+
+        Returns:
+            Optional[Dict]: Statistiky hráče, nebo None, pokud v žebříčku není.
+        """
+        row = self._conn.execute(f"SELECT {COLUMNS} FROM career WHERE nickname = ?", (nickname,)).fetchone()
+        return self._row_to_dict(row) if row is not None else None
+
+    def tournaments(self) -> int:
+        """Vrací počet započtených turnajů."""
+        return self._conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
@@ -0,0 +1,191 @@
+"""Párování průběžně přicházejících hráčů podle ratingu.
+
+`Matchmaker` drží čekající hráče v přihrádkách (buckets) podle ratingu
+o šířce `bucket_width` bodů. Příchozí hráč se porovná jen s přihrádkami
+v dosahu `max_gap` (od nejbližší), počet prohledaných přihrádek tedy
+nezávisí na počtu čekajících hráčů.
+
+Přihrádka drží hráče ve frontě (podle pořadí příchodu) a zároveň
+seřazené podle ratingu (k = počet hráčů v přihrádce):
+
+- leží-li všichni hráči přihrádky v dosahu, vybere se nejdéle čekající
+  (amortizovaně O(1) - fronta je `deque` s líným mazáním)
+- v okrajové přihrádce (v dosahu jen zčásti) se rozsah kompatibilních
+  ratingů najde půlením intervalu a vybere se hráč s nejbližším ratingem
+  (O(log k))
+- zařazení i odchod hráče vkládá/maže v seřazeném seznamu - hledání je
+  O(log k), posun prvků seznamu O(k) (jedno `memmove`, přihrádky jsou
+  díky omezené šířce malé)
+
+Odchod hráče z fronty záznam ze seznamu podle ratingu rovnou odstraní;
+z fronty podle příchodu se vyřadí líně a fronta se zkompaktní, jakmile
+v ní převáží odešlí hráči. Přihrádky tak při střídání příchodů
+a odchodů nerostou.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+from game import Player
+
+
+class _Bucket:
+    """Přihrádka čekajících hráčů - fronta podle příchodu a seznam podle ratingu."""
+
+    def __init__(self):
+        """Inicializuje prázdnou přihrádku."""
+        # Pořadové číslo zařazení -> čekající hráč
+        self.players: Dict[int, Player] = {}
+        # Pořadová čísla zařazení podle příchodu (i odešlých hráčů - maže se líně)
+        self.queue: Deque[int] = deque()
+        # Seřazené dvojice (rating, pořadové číslo zařazení)
+        self.by_rating: List[Tuple[float, int]] = []
+
+    def __len__(self):
+        """Vrací počet hráčů v přihrádce."""
+        return len(self.players)
+
+    def add(self, player: Player, rating: float, ticket: int):
+        """Zařadí hráče do přihrádky."""
+        self.players[ticket] = player
+        self.queue.append(ticket)
+        insort(self.by_rating, (rating, ticket))
+
+    def remove(self, rating: float, ticket: int) -> Player:
+        """Vyjme hráče z přihrádky a vrátí ho."""
+        del self.by_rating[bisect_left(self.by_rating, (rating, ticket))]
+        player = self.players.pop(ticket)
+        # Odešlí hráči tvoří nejvýše polovinu fronty
+        if len(self.queue) > 2 * len(self.players):
+            self.queue = deque(t for t in self.queue if t in self.players)
+        return player
+
+    def first(self) -> int:
+        """Vrací pořadové číslo nejdéle čekajícího hráče (přihrádka nesmí být prázdná)."""
+        while self.queue[0] not in self.players:
+            self.queue.popleft()
+        return self.queue[0]
+
+    def pick(self, rating: float, max_gap: float) -> Optional[int]:
+        """Vybere hráče v dosahu `max_gap` od ratingu.
+
+        Returns:
+            Optional[int]: Pořadové číslo zařazení vybraného hráče, nebo None.
+        """
+        low, high = rating - max_gap, rating + max_gap
+        if low <= self.by_rating[0][0] and self.by_rating[-1][0] <= high:
+            return self.first()
+
+        start = bisect_left(self.by_rating, (low, 0))
+        end = bisect_right(self.by_rating, (high, float('inf')))
+        if start >= end:
+            return None
+        nearest = min(max(bisect_left(self.by_rating, (rating, 0)), start), end - 1)
+        if nearest > start and rating - self.by_rating[nearest - 1][0] <= self.by_rating[nearest][0] - rating:
+            nearest -= 1
+        return self.by_rating[nearest][1]
+
+
+class Matchmaker:
+    """Fronta čekajících hráčů s párováním podle ratingu."""
+
+    def __init__(self, bucket_width: float = 50, max_gap: float = 200):
+        """Inicializuje prázdnou frontu.
+
+        Args:
+            bucket_width (float): Šířka přihrádky v bodech ratingu.
+            max_gap (float): Maximální rozdíl ratingů spárovaných hráčů.
+
+        Raises:
+            ValueError: Pokud šířka přihrádky není kladná nebo je rozdíl záporný.
+        """
+        if bucket_width <= 0 or max_gap < 0:
+            raise ValueError("Šířka přihrádky musí být kladná a maximální rozdíl nezáporný.")
+
+        self.bucket_width = bucket_width
+        self.max_gap = max_gap
+        self._buckets: Dict[int, _Bucket] = {}
+        # Hráč -> (rating, pořadové číslo zařazení) aktuálního čekání
+        self._waiting: Dict[Player, Tuple[float, int]] = {}
+        self._ticket = 0
+
+    def __len__(self):
+        """Vrací počet čekajících hráčů."""
+        return len(self._waiting)
+
+    def __contains__(self, player: Player):
+        """Vrací True, pokud hráč čeká ve frontě."""
+        return player in self._waiting
+
+    def _bucket(self, rating: float) -> int:
+        """Vrací číslo přihrádky pro rating."""
+        return int(rating // self.bucket_width)
+
+    def add(self, player: Player, rating: float) -> Optional[Player]:
+        """Zařadí hráče, nebo mu rovnou najde soupeře.
+
+        Args:
+            player (Player): Příchozí hráč.
+            rating (float): Aktuální rating hráče.
+
+        Returns:
+            Optional[Player]: Spárovaný soupeř (oba pak frontu opouští),
+                nebo None, pokud hráč zůstal čekat.
+
+        Raises:
+            ValueError: Pokud hráč už ve frontě čeká.
+        """
+        if player in self._waiting:
+            raise ValueError(f"Hráč '{player.nickname}' už čeká ve frontě.")
+
+        opponent = self._find_opponent(rating)
+        if opponent is not None:
+            self.remove(opponent)
+            return opponent
+
+        self._ticket += 1
+        self._waiting[player] = (rating, self._ticket)
+        self._buckets.setdefault(self._bucket(rating), _Bucket()).add(player, rating, self._ticket)
+        return None
+
+    def remove(self, player: Player) -> bool:
+        """Vyřadí hráče z fronty (odchod bez zápasu).
+
+        Args:
+            player (Player): Hráč.
+
+        Returns:
+            bool: True, pokud hráč ve frontě čekal.
+        """
+        waiting = self._waiting.pop(player, None)
+        if waiting is None:
+            return False
+        rating, ticket = waiting
+        bucket_id = self._bucket(rating)
+        bucket = self._buckets[bucket_id]
+        bucket.remove(rating, ticket)
+        if not bucket:
+            del self._buckets[bucket_id]
+        return True
+
+    def clear(self):
+        """Vyprázdní frontu."""
+        self._buckets.clear()
+        self._waiting.clear()
+
+    def _find_opponent(self, rating: float) -> Optional[Player]:
+        """Najde soupeře v nejbližší přihrádce, která má hráče v dosahu `max_gap`."""
+        if not self._waiting:
+            return None
+
+        center = self._bucket(rating)
+        reach = int(self.max_gap // self.bucket_width) + 1
+        for distance in range(reach + 1):
+            for bucket_id in ((center,) if distance == 0 else (center - distance, center + distance)):
+                bucket = self._buckets.get(bucket_id)
+                if bucket is None:
+                    continue
+                ticket = bucket.pick(rating, self.max_gap)
+                if ticket is not None:
+                    return bucket.players[ticket]
+        return None
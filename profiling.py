@@ -0,0 +1,335 @@
+"""Profilování simulace.
+
+`CpuProfiler` zaznamená profil `cProfile` jen kolem simulace
+(`BaseTournament.play(profile=...)`, klíč "profile" v `batch.py`) a uloží
+ho jako `.pstats` (pro `python -m pstats`, snakeviz, ...) a jako sbalené
+zásobníky (`.folded`, jeden řádek "a;b;c mikrosekundy") pro flamegraph::
+
+    with CpuProfiler("turnaj.pstats"):
+        tournament.play()
+
+`cProfile` sleduje jen vlákno, které profil spustilo. Kód běžící na
+pracovních vláknech (skupiny turnaje `group_knockout`) se obalí
+`profile_worker()` - vlákno dostane vlastní profil, který se při uložení
+sloučí s hlavním.
+
+`MemoryMonitor` sleduje paměť turnaje přes `tracemalloc`. Je to
+`CancellationToken` - předává se do `BaseTournament.play()` /
+`iter_events()` jako token pro zrušení:
+
+- na začátku každého kola uloží, kolik paměti turnaj drží, špičku
+  v uplynulém kole a místa v kódu, kde alokace za kolo nejvíc narostly
+  (např. `matches`, `_detailed_results` nebo historie zápasu)
+- po každé události porovná aktuálně alokovanou paměť s limitem; po
+  jeho překročení turnaj skončí událostí `TournamentCancelled`
+  s dosavadním pořadím a statistikami
+
+Sledování je opt-in - `tracemalloc` běží jen uvnitř bloku with::
+
+    with MemoryMonitor(limit_mb=512) as monitor:
+        tournament.play(monitor)
+    monitor.print_report()
+"""
+
+import cProfile
+import contextlib
+import os
+import pstats
+import threading
+import tracemalloc
+from typing import Dict, List, Optional, Tuple
+from cancellation import CancellationToken
+from events import RoundStarted
+
+MB = 1024 * 1024
+
+# Právě běžící profiler (pro profily pracovních vláken)
+_active_profiler: Optional['CpuProfiler'] = None
+
+# Větve zásobníku kratší než tato doba (v mikrosekundách) se do .folded nezapisují
+MIN_FOLDED_US = 1
+
+
+def _frame_name(func: Tuple[str, int, str]) -> str:
+    """Vrací název funkce pro sbalený zásobník, např. "play (game.py:382)"."""
+    filename, lineno, name = func
+    if filename == '~':
+        return name.replace(';', ',')
+    return f"{name} ({os.path.basename(filename)}:{lineno})"
+
+
+def write_collapsed(stats: pstats.Stats, path: str):
+    """Zapíše profil jako sbalené zásobníky pro flamegraph.
+
+    `cProfile` neukládá celé zásobníky, jen hrany volající -> volaná.
+    Zásobníky se proto rekonstruují průchodem grafu volání od kořenů
+    a čas funkce se mezi volající dělí v poměru jejich kumulovaného času.
+    Rekurzivní volání (funkce už v zásobníku) se nerozbalují.
+
+    Args:
+        stats (pstats.Stats): Profil.
+        path (str): Cesta výstupního souboru.
+    """
+    callees: Dict = {}
+    for func, (_, _, _, _, callers) in stats.stats.items():
+        for caller, (_, _, _, edge_ct) in callers.items():
+            callees.setdefault(caller, []).append((func, edge_ct))
+    roots = [func for func, (_, _, _, _, callers) in stats.stats.items() if not callers]
+
+    lines: Dict[str, int] = {}
+    # (funkce, zásobník, čas funkce v tomto zásobníku)
+    pending = [(func, (func,), stats.stats[func][3]) for func in roots]
+    while pending:
+        func, stack, time_on_path = pending.pop()
+        _, _, total_tt, total_ct, _ = stats.stats[func]
+        factor = time_on_path / total_ct if total_ct > 0 else 0.0
+
+        self_us = round(total_tt * factor * 1_000_000)
+        if self_us >= MIN_FOLDED_US:
+            key = ';'.join(map(_frame_name, stack))
+            lines[key] = lines.get(key, 0) + self_us
+
+        for callee, edge_ct in callees.get(func, ()):
+            child_time = edge_ct * factor
+            if callee not in stack and child_time * 1_000_000 >= MIN_FOLDED_US:
+                pending.append((callee, stack + (callee,), child_time))
+
+    with open(path, mode='w', encoding='utf-8') as file:
+        for key, us in sorted(lines.items()):
+            file.write(f"{key} {us}\n")
+
+
+class CpuProfiler:
+    """Profil `cProfile` bloku kódu uložený jako .pstats a .folded."""
+
+    def __init__(self, path: str):
+        """Inicializuje profiler.
+
+        Args:
+            path (str): Cesta souboru .pstats; sbalené zásobníky se uloží
+                vedle něj s příponou .folded.
+        """
+        self.path = path
+        self.collapsed_path = (path[:-len(".pstats")] if path.endswith(".pstats") else path) + ".folded"
+        self._profile = cProfile.Profile()
+        self._thread_profiles: List[cProfile.Profile] = []
+        self._thread_id: Optional[int] = None
+        self._previous: Optional['CpuProfiler'] = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        """Začne profilovat aktuální vlákno."""
+        global _active_profiler
+        self._previous, _active_profiler = _active_profiler, self
+        self._thread_id = threading.get_ident()
+        self._profile.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Ukončí profilování a uloží oba výstupy."""
+        global _active_profiler
+        self._profile.disable()
+        _active_profiler = self._previous
+        self.save()
+
+    @contextlib.contextmanager
+    def thread(self):
+        """Profiluje blok kódu na pracovním vlákně (profil se sloučí s hlavním).
+
+        Na vlákně, které spustilo hlavní profil, nedělá nic.
+        """
+        if threading.get_ident() == self._thread_id:
+            yield
+            return
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Jiný profil už běží (od Pythonu 3.12 sleduje hlavní profil všechna vlákna)
+            yield
+            return
+        try:
+            yield
+        finally:
+            profile.disable()
+            with self._lock:
+                self._thread_profiles.append(profile)
+
+    def save(self):
+        """Uloží profil (.pstats) a sbalené zásobníky (.folded)."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        stats = self.stats()
+        stats.dump_stats(self.path)
+        write_collapsed(stats, self.collapsed_path)
+
+    def stats(self) -> pstats.Stats:
+        """Vrací zaznamenaný profil včetně pracovních vláken (např. pro `print_stats`)."""
+        stats = pstats.Stats(self._profile)
+        for profile in self._thread_profiles:
+            stats.add(profile)
+        return stats
+
+
+def profile_worker():
+    """Vrací kontext, který profiluje pracovní vlákno, pokud právě běží `CpuProfiler`.
+
+    Returns:
+        Kontextový manažer (bez běžícího profileru nedělá nic).
+    """
+    profiler = _active_profiler
+    return profiler.thread() if profiler is not None else contextlib.nullcontext()
+
+
+class MemoryMonitor(CancellationToken):
+    """Token pro zrušení, který sleduje paměť turnaje a hlídá paměťový limit."""
+
+    def __init__(self, limit_mb: Optional[float] = None, top: int = 5, timeout: Optional[float] = None):
+        """Inicializuje monitor (sledování začne až `start()` / blokem with).
+
+        Args:
+            limit_mb (Optional[float]): Paměťový limit v MB (None = bez limitu).
+            top (int): Počet míst s největším nárůstem alokací, které se uloží pro každé kolo.
+            timeout (Optional[float]): Časový limit v sekundách (jako u `CancellationToken`).
+
+        Raises:
+            ValueError: Pokud limit není kladný nebo je časový limit záporný.
+        """
+        super().__init__(timeout)
+        if limit_mb is not None and limit_mb <= 0:
+            raise ValueError("Paměťový limit musí být kladný.")
+
+        self.limit_mb = limit_mb
+        self.limit = int(limit_mb * MB) if limit_mb is not None else None
+        self.top = top
+        self.rounds: List[Dict] = []
+        self.peak = 0
+        self._round = 0
+        self._sites: Dict = {}
+        self._started = False
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        """Spustí sledování paměti pro blok with."""
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Uzavře poslední kolo a ukončí sledování."""
+        self.stop()
+
+    def start(self) -> 'MemoryMonitor':
+        """Spustí `tracemalloc` (pokud neběží) a začne první fázi (přípravu turnaje).
+
+        Returns:
+            MemoryMonitor: Tento monitor.
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started = True
+        tracemalloc.reset_peak()
+        self._sites = self._allocation_sites()
+        return self
+
+    def stop(self):
+        """Uzavře rozběhnuté kolo a zastaví `tracemalloc`, pokud ho spustil tento monitor."""
+        if not tracemalloc.is_tracing():
+            return
+        with self._lock:
+            self._close_round()
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    @property
+    def cancelled(self) -> bool:
+        """True, pokud byl překročen paměťový limit, token zrušen nebo vypršel časový limit."""
+        if self.reason is None and self.limit is not None and tracemalloc.get_traced_memory()[0] > self.limit:
+            self.cancel(f"Překročen paměťový limit {self.limit_mb} MB")
+        return super().cancelled
+
+    def observe(self, event):
+        """Na začátku nového kola uzavře měření předchozího kola.
+
+        Skupiny turnaje `group_knockout` hlásí kola z více vláken - kolo
+        se uzavře jen jednou, při prvním vyšším čísle kola.
+
+        Args:
+            event: Událost z modulu `events`.
+        """
+        if not isinstance(event, RoundStarted) or event.round_num <= self._round:
+            return
+        with self._lock:
+            if event.round_num > self._round and tracemalloc.is_tracing():
+                self._close_round()
+                self._round = event.round_num
+
+    @staticmethod
+    def _allocation_sites() -> Dict:
+        """Vrací alokovanou paměť a počet bloků podle místa v kódu (soubor, řádek).
+
+        Ukládají se jen součty za řádky, ne celý snímek - snímek by sám
+        zabíral paměť, kterou monitor měří.
+        """
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ))
+        return {
+            (stat.traceback[0].filename, stat.traceback[0].lineno): (stat.size, stat.count)
+            for stat in snapshot.statistics('lineno')
+        }
+
+    def _close_round(self):
+        """Uloží paměť a největší nárůsty alokací rozběhnutého kola a začne nové měření."""
+        current, peak = tracemalloc.get_traced_memory()
+        sites = self._allocation_sites()
+
+        growth = []
+        for site, (size, count) in sites.items():
+            old_size, old_count = self._sites.get(site, (0, 0))
+            if size != old_size:
+                growth.append((size - old_size, count - old_count, site))
+        growth.sort(reverse=True)
+
+        self.rounds.append({
+            "round": self._round,
+            "current": current,
+            "peak": peak,
+            "top": [
+                {"site": f"{os.path.basename(filename)}:{lineno}", "size_diff": size_diff, "count_diff": count_diff}
+                for size_diff, count_diff, (filename, lineno) in growth[:self.top]
+            ]
+        })
+        self.peak = max(self.peak, peak)
+        self._sites = sites
+        tracemalloc.reset_peak()
+
+    def report(self) -> Dict:
+        """Vrací souhrn měření.
+
+        Returns:
+            Dict: Limit a špička v bajtech, důvod přerušení a měření
+                jednotlivých kol (kolo 0 = příprava turnaje).
+        """
+        return {
+            "limit": self.limit,
+            "peak": self.peak,
+            "cancelled": self.reason,
+            "rounds": self.rounds
+        }
+
+    def print_report(self):
+        """Vypíše špičky paměti a místa s největším nárůstem alokací po kolech."""
+        print("\n" + "="*60)
+        print(f"PAMĚŤ TURNAJE - špička {self.peak / MB:.2f} MB"
+              + (f" (limit {self.limit_mb} MB)" if self.limit is not None else ""))
+        print("="*60)
+        for measurement in self.rounds:
+            label = f"Kolo {measurement['round']}" if measurement["round"] else "Příprava"
+            print(f"{label}: drženo {measurement['current'] / MB:.2f} MB, špička {measurement['peak'] / MB:.2f} MB")
+            for site in measurement["top"]:
+                print(f"    {site['site']:<30} {site['size_diff'] / 1024:+10.1f} KiB  {site['count_diff']:+d} bloků")
+        if self.reason is not None:
+            print(f"Přerušeno: {self.reason}")
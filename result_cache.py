@@ -0,0 +1,393 @@
+"""Cache výsledků deterministických (seedovaných) turnajů.
+
+Turnaj se stejnou soupiskou, typem, nastavením zápasu a seedem dopadne
+vždy stejně, není tedy nutné ho simulovat znovu. `ResultCache` drží
+výsledky ve dvou vrstvách:
+
+- paměťová LRU vrstva (omezená počtem záznamů)
+- disková vrstva v adresáři (omezená celkovou velikostí, vyřazuje
+  nejdéle nepoužité soubory)
+
+Klíč je stabilní hash všech vstupů včetně otisku zdrojového kódu
+simulace, takže při změně čehokoliv (hráči, parametry, seed, kód)
+se starý záznam prostě přestane používat.
+
+`PairResultCache` cachuje výsledky jednotlivých dvojic seedovaného
+round-robin turnaje. Po přidání nebo odebrání hráče se tak simulují
+jen zápasy nových dvojic, ostatní se převezmou z cache.
+"""
+
+import ast
+import hashlib
+import json
+import os
+import random
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from files import jsonfile_read, jsonfile_write
+
+# Moduly simulace - do otisku se započtou i všechny lokální moduly, které (tranzitivně) importují;
+# patří sem i tento modul, protože `run_cached` určuje, jak se turnaj odehraje
+SIMULATION_MODULES = ("game.py", "tournament.py", "result_cache.py")
+
+_code_fingerprint_value: Optional[str] = None
+
+
+def simulation_modules() -> List[str]:
+    """Vrací moduly, na kterých závisí výsledky simulace.
+
+    Importy se hledají staticky (`ast`) - od `SIMULATION_MODULES` přes
+    všechny importované moduly, které leží ve stejném adresáři. Změna
+    např. pomocných kritérií pořadí (`tournament_stats.py`) nebo párování
+    žebříčku (`matchmaking.py`) tak zneplatní cache bez ručního seznamu.
+
+    Returns:
+        List[str]: Seřazené názvy souborů modulů.
+    """
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    found = set()
+    pending = list(SIMULATION_MODULES)
+    while pending:
+        module = pending.pop()
+        if module in found:
+            continue
+        found.add(module)
+        with open(os.path.join(base_dir, module), mode='rb') as file:
+            tree = ast.parse(file.read(), filename=module)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                candidate = name.split('.')[0] + ".py"
+                if os.path.isfile(os.path.join(base_dir, candidate)):
+                    pending.append(candidate)
+    return sorted(found)
+
+
+def code_fingerprint() -> str:
+    """Vrací otisk zdrojového kódu simulace.
+
+    Returns:
+        str: SHA-256 obsahu modulů ze `simulation_modules()`.
+    """
+    global _code_fingerprint_value
+    if _code_fingerprint_value is None:
+        digest = hashlib.sha256()
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        for module in simulation_modules():
+            digest.update(module.encode('utf-8'))
+            with open(os.path.join(base_dir, module), mode='rb') as file:
+                digest.update(file.read())
+        _code_fingerprint_value = digest.hexdigest()
+    return _code_fingerprint_value
+
+
+def make_key(players: List, tournament_type: str, location: str,
+             winning_score: int, max_dice_value: int, seed: int, retention: str = "all") -> str:
+    """Sestaví stabilní klíč cache ze všech vstupů turnaje.
+
+    Args:
+        players (List[Player]): Soupiska v pořadí, v jakém vstupuje do turnaje.
+        tournament_type (str): Typ turnaje (viz `TournamentFactory`).
+        location (str): Místo konání turnaje.
+        winning_score (int): Počet bodů k vítězství v zápase.
+        max_dice_value (int): Maximální hodnota kostky.
+        seed (int): Seed generátoru náhodných čísel.
+        retention (str): Politika uchovávání zápasů (mění obsah výsledků).
+
+    Returns:
+        str: Hexadecimální SHA-256 klíč.
+    """
+    payload = {
+        "code": code_fingerprint(),
+        "players": [[p.nickname, p.gender.value, p.state] for p in players],
+        "type": tournament_type.lower().strip(),
+        "location": location.strip(),
+        "winning_score": winning_score,
+        "max_dice_value": max_dice_value,
+        "seed": seed,
+        "retention": str(retention),
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class ResultCache:
+    """Dvouvrstvá (paměť + disk) LRU cache výsledků turnajů."""
+
+    def __init__(self, cache_dir: Optional[str] = None, max_entries: int = 128,
+                 max_disk_bytes: int = 256 * 1024 * 1024):
+        """Inicializuje cache.
+
+        Args:
+            cache_dir (Optional[str]): Adresář diskové vrstvy (None = jen paměť).
+            max_entries (int): Maximální počet záznamů v paměťové vrstvě.
+            max_disk_bytes (int): Maximální celková velikost diskové vrstvy v bajtech.
+
+        Raises:
+            ValueError: Pokud jsou limity menší než 1.
+        """
+        if max_entries < 1 or max_disk_bytes < 1:
+            raise ValueError("Limity cache musí být kladné.")
+
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_disk_bytes = max_disk_bytes
+        self._memory: "OrderedDict[str, Dict]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def __len__(self):
+        """Vrací počet záznamů v paměťové vrstvě."""
+        return len(self._memory)
+
+    def _path(self, key: str) -> str:
+        """Vrací cestu k souboru záznamu na disku."""
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Vrátí uložené výsledky, nebo None.
+
+        Vrácený slovník je sdílený s cache a nemá se měnit.
+
+        Args:
+            key (str): Klíč z `make_key`.
+
+        Returns:
+            Optional[Dict]: Výsledky turnaje (viz `BaseTournament.get_results`).
+        """
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return self._memory[key]
+
+        if self.cache_dir is not None:
+            path = self._path(key)
+            try:
+                results = jsonfile_read(path)
+            except (FileNotFoundError, ValueError):
+                results = None
+            if results is not None:
+                # Aktualizace času posledního použití pro LRU na disku
+                os.utime(path)
+                self._remember(key, results)
+                self.hits += 1
+                return results
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, results: Dict):
+        """Uloží výsledky do obou vrstev cache.
+
+        Args:
+            key (str): Klíč z `make_key`.
+            results (Dict): Výsledky turnaje.
+        """
+        self._remember(key, results)
+        if self.cache_dir is not None:
+            jsonfile_write(self._path(key), results)
+            self._evict_disk()
+
+    def clear(self):
+        """Vyprázdní obě vrstvy cache."""
+        self._memory.clear()
+        if self.cache_dir is not None:
+            for path, _, _ in self._disk_entries():
+                os.remove(path)
+
+    def _remember(self, key: str, results: Dict):
+        """Vloží záznam do paměťové vrstvy a vyřadí nejstarší."""
+        self._memory[key] = results
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_entries(self) -> List[Tuple[str, int, float]]:
+        """Vrací seznam (cesta, velikost, čas použití) souborů diskové vrstvy."""
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith('.json'):
+                    stat = entry.stat()
+                    entries.append((entry.path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _evict_disk(self):
+        """Smaže nejdéle nepoužité soubory, dokud není splněn limit velikosti."""
+        entries = self._disk_entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_disk_bytes:
+            return
+
+        entries.sort(key=lambda entry: entry[2])
+        for path, size, _ in entries:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+
+class PairResultCache:
+    """Cache výsledků dvojic hráčů pro seedovaný round-robin turnaj.
+
+    Výsledek zápasu dvojice je v seedovaném turnaji určen seedem turnaje,
+    přezdívkami obou hráčů a nastavením zápasu (viz
+    `BaseTournament._match_seed`), nezávisí tedy na zbytku soupisky ani na
+    pořadí v rozpisu. Cache je vázaná na seed a nastavení; klíčem záznamu je
+    dvojice (domácí, host) a hodnotou konečné skóre.
+    """
+
+    def __init__(self, seed: int, winning_score: int = 10, max_dice_value: int = 6):
+        """Inicializuje prázdnou cache.
+
+        Args:
+            seed (int): Seed turnaje.
+            winning_score (int): Počet bodů k vítězství v zápase.
+            max_dice_value (int): Maximální hodnota kostky.
+
+        Raises:
+            ValueError: Pokud seed není zadán.
+        """
+        if seed is None:
+            raise ValueError("Cache dvojic vyžaduje seedovaný turnaj.")
+
+        self.seed = seed
+        self.winning_score = winning_score
+        self.max_dice_value = max_dice_value
+        self._results: Dict[Tuple[str, str], Tuple[int, int]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        """Vrací počet uložených dvojic."""
+        return len(self._results)
+
+    def settings(self) -> Dict:
+        """Vrací nastavení, pro které výsledky v cache platí."""
+        return {
+            "code": code_fingerprint(),
+            "seed": self.seed,
+            "winning_score": self.winning_score,
+            "max_dice_value": self.max_dice_value,
+        }
+
+    def get(self, house: str, guest: str) -> Optional[Tuple[int, int]]:
+        """Vrátí uložené skóre zápasu dvojice, nebo None.
+
+        Args:
+            house (str): Přezdívka domácího hráče.
+            guest (str): Přezdívka hostujícího hráče.
+
+        Returns:
+            Optional[Tuple[int, int]]: Skóre (domácí, host).
+        """
+        score = self._results.get((house, guest))
+        if score is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return score
+
+    def put(self, house: str, guest: str, score: Tuple[int, int]):
+        """Uloží skóre zápasu dvojice.
+
+        Args:
+            house (str): Přezdívka domácího hráče.
+            guest (str): Přezdívka hostujícího hráče.
+            score (Tuple[int, int]): Skóre (domácí, host).
+        """
+        self._results[(house, guest)] = (score[0], score[1])
+
+    def save(self, path: str):
+        """Uloží cache do JSON souboru (přípona `.gz` = komprese).
+
+        Args:
+            path (str): Cesta k souboru.
+        """
+        jsonfile_write(path, {
+            "settings": self.settings(),
+            "pairs": [[house, guest, h, g] for (house, guest), (h, g) in self._results.items()]
+        }, compact=True)
+
+    @classmethod
+    def load(cls, path: str) -> 'PairResultCache':
+        """Načte cache uloženou metodou `save`.
+
+        Args:
+            path (str): Cesta k souboru.
+
+        Returns:
+            PairResultCache: Načtená cache.
+
+        Raises:
+            FileNotFoundError: Pokud soubor neexistuje.
+            ValueError: Pokud cache vznikla jinou verzí kódu simulace.
+        """
+        data = jsonfile_read(path)
+        settings = data["settings"]
+        if settings["code"] != code_fingerprint():
+            raise ValueError("Cache dvojic vznikla jinou verzí kódu simulace.")
+
+        cache = cls(settings["seed"], settings["winning_score"], settings["max_dice_value"])
+        cache._results = {(house, guest): (h, g) for house, guest, h, g in data["pairs"]}
+        return cache
+
+
+def run_cached(cache: ResultCache, players: List, tournament_type: str, location: str,
+               winning_score: int = 10, max_dice_value: int = 6,
+               seed: int = 0, retention=None) -> Tuple[Dict, bool]:
+    """Vrátí výsledky seedovaného turnaje z cache, nebo ho odehraje a uloží.
+
+    Args:
+        cache (ResultCache): Cache výsledků.
+        players (List[Player]): Soupiska (čerstvě načtení hráči).
+        tournament_type (str): Typ turnaje.
+        location (str): Místo konání turnaje.
+        winning_score (int): Počet bodů k vítězství v zápase.
+        max_dice_value (int): Maximální hodnota kostky.
+        seed (int): Seed turnaje (předá se turnaji, viz `BaseTournament`).
+        retention: Politika uchovávání zápasů (viz `RetentionPolicy`, výchozí: "all").
+
+    Returns:
+        Tuple[Dict, bool]: Výsledky turnaje a příznak, zda pochází z cache.
+
+    Raises:
+        ValueError: Pokud seed není zadán (nedeterministický běh nelze cachovat).
+    """
+    if seed is None:
+        raise ValueError("Cachovat lze jen turnaje se zadaným seedem.")
+
+    from tournament import TournamentFactory, RetentionPolicy
+
+    retention = RetentionPolicy.parse(retention)
+    key = make_key(players, tournament_type, location, winning_score, max_dice_value, seed, retention)
+    results = cache.get(key)
+    if results is not None:
+        return results, True
+
+    # Seed turnaje určuje všechny zápasy; globální `random` jen jako pojistka pro ostatní losování
+    random.seed(seed)
+    tournament = TournamentFactory.create(
+        tournament_type=tournament_type,
+        players=players,
+        location=location,
+        winning_score=winning_score,
+        max_dice_value=max_dice_value,
+        retention=retention,
+        seed=seed
+    )
+    tournament.play()
+    results = tournament.get_results()
+    cache.put(key, results)
+    return results, False
@@ -0,0 +1,437 @@
+"""Binární archiv výsledků zápasů s indexem podle hráčů.
+
+Místo opakovaného parsování všech `tournament_*.json` souborů se zápasy
+ukládají do jednoho souboru záznamů pevné délky, který se čte přes
+`mmap`. Dotaz "všechny zápasy hráče X" nebo "vzájemné zápasy A a B" tak
+čte jen stránky s relevantními záznamy.
+
+Formát záznamu (little-endian, 19 bajtů)::
+
+    event_id  u32   index turnaje v tabulce událostí
+    round     u16   číslo kola
+    house     u32   index domácího hráče v tabulce přezdívek
+    guest     u32   index hostujícího hráče
+    h_score   u16   body domácího hráče
+    g_score   u16   body hostujícího hráče
+    winner    u8    0 = domácí, 1 = host
+
+Index vedle archivu (`<archiv>.idx.*`) je také binární a jen se připisuje:
+
+- `.idx.players` - přezdívky (UTF-8, jedna na řádek), pořadí = id hráče
+- `.idx.events` - turnaje (JSON, jeden na řádek)
+- `.idx.seg.N` - segmenty seřazených klíčů `id_hráče << 32 | číslo_záznamu`
+  (u64); zápasy hráče se v segmentu najdou půlením intervalu nad mmap
+- `.idx` - malý manifest (počty, velikosti souborů, seznam segmentů)
+
+`flush()` zapíše jen nové přezdívky, turnaje a jeden segment s klíči
+přidanými od minulého uložení. Segmenty se slučují podle velikosti
+(každý je alespoň dvakrát větší než následující), je jich tedy
+O(log n) a každý klíč se přepíše O(log n)-krát. Otevření archivu čte jen
+manifest, přezdívky a turnaje, ne seznamy záznamů.
+"""
+
+import heapq
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Optional
+from files import jsonfile_read, jsonfile_write
+
+MAGIC = b'OGSARC01'
+RECORD = struct.Struct('<IHIIHHB')
+# Nejvyšší hodnota kola a skóre, která se vejde do pole u16
+MAX_FIELD = 0xFFFF
+POSTING = struct.Struct('<Q')
+INDEX_VERSION = 2
+
+
+class _Segment:
+    """Jeden seřazený segment klíčů indexu (čtený přes mmap)."""
+
+    def __init__(self, path: str):
+        """Namapuje segment ze souboru."""
+        self.path = path
+        self.count = os.path.getsize(path) // POSTING.size
+        with open(path, mode='rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _key(self, i: int) -> int:
+        """Vrací i-tý klíč segmentu."""
+        return POSTING.unpack_from(self._mmap, i * POSTING.size)[0]
+
+    def range(self, player_id: int) -> range:
+        """Vrací rozsah pozic s klíči hráče (půlení intervalu)."""
+        lo = bisect_left(range(self.count), player_id << 32, key=self._key)
+        hi = bisect_left(range(lo, self.count), (player_id + 1) << 32, key=self._key) + lo
+        return range(lo, hi)
+
+    def record_nums(self, player_id: int) -> Iterator[int]:
+        """Postupně vrací čísla záznamů hráče (vzestupně)."""
+        for i in self.range(player_id):
+            yield self._key(i) & 0xFFFFFFFF
+
+    def keys(self) -> array:
+        """Vrací všechny klíče segmentu (pro slučování)."""
+        keys = array('Q')
+        keys.frombytes(self._mmap[:])
+        if sys.byteorder == 'big':
+            keys.byteswap()
+        return keys
+
+    def close(self):
+        """Uzavře mmap segmentu."""
+        self._mmap.close()
+
+
+class ResultsArchive:
+    """Append-only archiv zápasů čtený přes mmap."""
+
+    def __init__(self, path: str):
+        """Otevře (nebo založí) archiv.
+
+        Args:
+            path (str): Cesta k datovému souboru archivu.
+
+        Raises:
+            ValueError: Pokud soubor není archiv výsledků nebo má index nepodporovanou verzi.
+        """
+        self.path = path
+        self.index_path = path + '.idx'
+        self._players_path = self.index_path + '.players'
+        self._events_path = self.index_path + '.events'
+
+        if not os.path.exists(path):
+            with open(path, mode='wb') as file:
+                file.write(MAGIC)
+
+        with open(path, mode='rb') as file:
+            if file.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"Soubor '{path}' není archiv výsledků.")
+
+        try:
+            manifest = jsonfile_read(self.index_path)
+        except FileNotFoundError:
+            manifest = {"version": INDEX_VERSION, "count": 0, "players_size": 0,
+                        "events_size": 0, "segments": [], "next_segment": 0}
+        if manifest.get("version") != INDEX_VERSION:
+            raise ValueError(f"Index archivu '{self.index_path}' má nepodporovanou verzi.")
+
+        self._count: int = manifest["count"]
+        self._next_segment: int = manifest["next_segment"]
+
+        # Data zapsaná po posledním uložení manifestu nejsou v indexu - zahodí se
+        self._truncate(path, len(MAGIC) + self._count * RECORD.size)
+        self._truncate(self._players_path, manifest["players_size"])
+        self._truncate(self._events_path, manifest["events_size"])
+
+        with open(self._players_path, mode='rb') as file:
+            self._players: List[str] = file.read().decode('utf-8').split('\n')[:-1]
+        self._player_ids: Dict[str, int] = {name: i for i, name in enumerate(self._players)}
+        with open(self._events_path, mode='rb') as file:
+            self._events: List[Dict] = [json.loads(line) for line in file]
+        self._saved_players = len(self._players)
+        self._saved_events = len(self._events)
+
+        self._segments: List[_Segment] = [
+            _Segment(f"{self.index_path}.seg.{number}") for number in manifest["segments"]
+        ]
+        self._segment_numbers: List[int] = list(manifest["segments"])
+        # Klíče přidané od posledního uložení (id hráče -> čísla záznamů)
+        self._pending: Dict[int, List[int]] = {}
+
+        self._writer = open(path, mode='ab')
+        self._mmap: Optional[mmap.mmap] = None
+        self._mapped_count = 0
+
+    @staticmethod
+    def _truncate(path: str, size: int):
+        """Zkrátí (nebo založí) soubor na danou velikost."""
+        if not os.path.exists(path):
+            open(path, mode='wb').close()
+        if os.path.getsize(path) != size:
+            with open(path, mode='r+b') as file:
+                file.truncate(size)
+
+    def __len__(self):
+        """Vrací počet záznamů v archivu."""
+        return self._count
+
+    def __enter__(self):
+        """Umožňuje použití v bloku with."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Při opuštění bloku with uloží index a uzavře archiv."""
+        self.close()
+
+    def _player_id(self, nickname: str) -> int:
+        """Vrací index hráče v tabulce přezdívek (případně ho založí).
+
+        Raises:
+            ValueError: Pokud přezdívka obsahuje konec řádku.
+        """
+        player_id = self._player_ids.get(nickname)
+        if player_id is None:
+            if '\n' in nickname:
+                raise ValueError("Přezdívka v archivu nesmí obsahovat konec řádku.")
+            player_id = len(self._players)
+            self._players.append(nickname)
+            self._player_ids[nickname] = player_id
+        return player_id
+
+    def add_event(self, location: str, date: str, tournament_type: str) -> int:
+        """Zaregistruje turnaj (událost) a vrátí jeho id.
+
+        Args:
+            location (str): Místo konání.
+            date (str): Datum turnaje.
+            tournament_type (str): Typ turnaje.
+
+        Returns:
+            int: Id události pro `append_match`.
+        """
+        self._events.append({"location": location, "date": date, "type": tournament_type})
+        return len(self._events) - 1
+
+    def append_match(self, event_id: int, round_num: int, house: str, guest: str,
+                     house_score: int, guest_score: int):
+        """Připojí jeden zápas na konec archivu.
+
+        Args:
+            event_id (int): Id události z `add_event`.
+            round_num (int): Číslo kola.
+            house (str): Přezdívka domácího hráče.
+            guest (str): Přezdívka hostujícího hráče.
+            house_score (int): Body domácího hráče.
+            guest_score (int): Body hostujícího hráče.
+
+        Raises:
+            ValueError: Pokud událost neexistuje, skóre nemá vítěze nebo se kolo
+                či skóre nevejde do záznamu (0 až `MAX_FIELD`).
+        """
+        if not 0 <= event_id < len(self._events):
+            raise ValueError(f"Neznámá událost {event_id}.")
+        if house_score == guest_score:
+            raise ValueError("Zápas musí mít vítěze.")
+        if not all(0 <= value <= MAX_FIELD for value in (round_num, house_score, guest_score)):
+            raise ValueError(f"Číslo kola i skóre musí být v rozmezí 0 až {MAX_FIELD}.")
+
+        record_num = self._count
+        house_id, guest_id = self._player_id(house), self._player_id(guest)
+        self._writer.write(RECORD.pack(
+            event_id, round_num, house_id, guest_id,
+            house_score, guest_score, 0 if house_score > guest_score else 1
+        ))
+        self._pending.setdefault(house_id, []).append(record_num)
+        if guest_id != house_id:
+            self._pending.setdefault(guest_id, []).append(record_num)
+        self._count += 1
+
+    def append_results(self, results: Dict) -> int:
+        """Připojí všechny zápasy z výsledků turnaje.
+
+        Args:
+            results (Dict): Výsledky ve formátu `BaseTournament.get_results()`.
+
+        Returns:
+            int: Id nové události.
+        """
+        info = results["tournament_info"]
+        event_id = self.add_event(info["location"], info["date"], info["type"])
+        for match in results["matches"]:
+            self.append_match(
+                event_id, match["round"],
+                match["player1"]["nickname"], match["player2"]["nickname"],
+                match["final_score"]["player1"], match["final_score"]["player2"]
+            )
+        return event_id
+
+    def import_file(self, filename: str) -> int:
+        """Připojí zápasy z uloženého souboru `tournament_*.json`.
+
+        Args:
+            filename (str): Cesta k výsledkovému souboru.
+
+        Returns:
+            int: Id nové události.
+        """
+        return self.append_results(jsonfile_read(filename))
+
+    def _write_segment(self, number: int, keys) -> _Segment:
+        """Zapíše seřazené klíče do segmentu a namapuje ho."""
+        segment_path = f"{self.index_path}.seg.{number}"
+        keys = array('Q', keys)
+        if sys.byteorder == 'big':
+            keys.byteswap()
+        with open(segment_path, mode='wb') as file:
+            keys.tofile(file)
+        return _Segment(segment_path)
+
+    def _append_lines(self, path: str, lines: List[str]) -> int:
+        """Připíše řádky na konec souboru a vrátí jeho novou velikost."""
+        with open(path, mode='ab') as file:
+            file.write(''.join(line + '\n' for line in lines).encode('utf-8'))
+            return file.tell()
+
+    def flush(self):
+        """Zapíše rozpracovaná data a uloží index (jen nové položky, viz popis modulu)."""
+        self._writer.flush()
+        players_size = self._append_lines(self._players_path, self._players[self._saved_players:])
+        events_size = self._append_lines(
+            self._events_path, [json.dumps(event, ensure_ascii=False) for event in self._events[self._saved_events:]]
+        )
+        self._saved_players = len(self._players)
+        self._saved_events = len(self._events)
+
+        obsolete = []
+        if self._pending:
+            keys = sorted(player_id << 32 | record_num
+                          for player_id, record_nums in self._pending.items() for record_num in record_nums)
+            self._pending = {}
+            self._segments.append(self._write_segment(self._next_segment, keys))
+            self._segment_numbers.append(self._next_segment)
+            self._next_segment += 1
+
+            # Sloučení segmentů podobné velikosti (každý je alespoň 2× větší než následující)
+            while len(self._segments) >= 2 and self._segments[-2].count < 2 * self._segments[-1].count:
+                older, newer = self._segments[-2:]
+                merged = self._write_segment(self._next_segment, heapq.merge(older.keys(), newer.keys()))
+                obsolete.extend((older, newer))
+                self._segments[-2:] = [merged]
+                self._segment_numbers[-2:] = [self._next_segment]
+                self._next_segment += 1
+
+        jsonfile_write(self.index_path, {
+            "version": INDEX_VERSION,
+            "count": self._count,
+            "players_size": players_size,
+            "events_size": events_size,
+            "segments": self._segment_numbers,
+            "next_segment": self._next_segment
+        })
+
+        # Sloučené segmenty se smažou až po uložení manifestu, který na ně už neodkazuje
+        for segment in obsolete:
+            segment.close()
+            os.remove(segment.path)
+
+    def close(self):
+        """Uloží index a uzavře archiv."""
+        if self._writer.closed:
+            return
+        self.flush()
+        self._writer.close()
+        for segment in self._segments:
+            segment.close()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def _map(self) -> Optional[mmap.mmap]:
+        """Vrací mmap pokrývající všechny dosud zapsané záznamy."""
+        if self._mapped_count != self._count or self._mmap is None:
+            self._writer.flush()
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+            if self._count:
+                with open(self.path, mode='rb') as file:
+                    self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mapped_count = self._count
+        return self._mmap
+
+    def _read(self, record_num: int) -> Dict:
+        """Načte jeden záznam z mmap a převede ho na slovník."""
+        event_id, round_num, house, guest, h_score, g_score, winner = RECORD.unpack_from(
+            self._mmap, len(MAGIC) + record_num * RECORD.size
+        )
+        house_name = self._players[house]
+        guest_name = self._players[guest]
+        return {
+            "event_id": event_id,
+            "round": round_num,
+            "house_player": house_name,
+            "guest_player": guest_name,
+            "score": (h_score, g_score),
+            "winner": house_name if winner == 0 else guest_name
+        }
+
+    def get(self, record_num: int) -> Dict:
+        """Vrací záznam podle pořadového čísla.
+
+        Raises:
+            IndexError: Pokud záznam neexistuje.
+        """
+        if not 0 <= record_num < self._count:
+            raise IndexError(f"Záznam {record_num} neexistuje.")
+        self._map()
+        return self._read(record_num)
+
+    def event(self, event_id: int) -> Dict:
+        """Vrací popis události (místo, datum, typ)."""
+        return self._events[event_id]
+
+    def players(self) -> List[str]:
+        """Vrací přezdívky všech hráčů v archivu."""
+        return list(self._players)
+
+    def _record_nums(self, player_id: int) -> Iterator[int]:
+        """Postupně vrací čísla záznamů hráče (segmenty, pak neuložené klíče)."""
+        for segment in self._segments:
+            yield from segment.record_nums(player_id)
+        yield from self._pending.get(player_id, ())
+
+    def _record_count(self, player_id: int) -> int:
+        """Vrací počet záznamů hráče (bez čtení čísel záznamů)."""
+        return (sum(len(segment.range(player_id)) for segment in self._segments)
+                + len(self._pending.get(player_id, ())))
+
+    def matches_of(self, nickname: str) -> Iterator[Dict]:
+        """Postupně vrací všechny zápasy hráče.
+
+        Args:
+            nickname (str): Přezdívka hráče.
+
+        Yields:
+            Dict: Záznam zápasu.
+        """
+        player_id = self._player_ids.get(nickname)
+        if player_id is None:
+            return
+        self._map()
+        for record_num in self._record_nums(player_id):
+            yield self._read(record_num)
+
+    def head_to_head(self, player_a: str, player_b: str) -> List[Dict]:
+        """Vrací vzájemné zápasy dvou hráčů.
+
+        Prochází se jen seznam záznamů méně aktivního z obou hráčů.
+
+        Args:
+            player_a (str): Přezdívka prvního hráče.
+            player_b (str): Přezdívka druhého hráče.
+
+        Returns:
+            List[Dict]: Záznamy vzájemných zápasů v pořadí uložení.
+        """
+        a_id = self._player_ids.get(player_a)
+        b_id = self._player_ids.get(player_b)
+        if a_id is None or b_id is None:
+            return []
+
+        if self._record_count(a_id) > self._record_count(b_id):
+            a_id, b_id = b_id, a_id
+
+        mapped = self._map()
+        result = []
+        for record_num in self._record_nums(a_id):
+            offset = len(MAGIC) + record_num * RECORD.size
+            # Porovnání jen id hráčů bez sestavování slovníku
+            _, _, house, guest, _, _, _ = RECORD.unpack_from(mapped, offset)
+            if house == b_id or guest == b_id:
+                result.append(self._read(record_num))
+        return result
@@ -0,0 +1,354 @@
+"""Volitelné úložiště výsledků v SQLite (pouze stdlib `sqlite3`).
+
+Výsledky turnajů (`BaseTournament.get_results`) a samostatných zápasů
+(`Match.get_result`) se ukládají do tabulek:
+
+- tournaments - turnaje (datum, místo, typ, nastavení, vítěz)
+- players     - hráči (přezdívka, pohlaví, stát)
+- matches     - zápasy (turnaj, kolo, hráči, skóre, vítěz, délka)
+- standings   - konečné pořadí hráčů v turnaji
+
+Zápis probíhá dávkově přes `executemany` v jedné transakci (při hromadném
+nahrávání se indexy nad zápasy postaví až na konci), databáze
+běží v režimu WAL a indexy nad hráči, místem a datem drží dotazy typu
+žebříček nebo historie hráče rychlé i nad miliony zápasů.
+"""
+
+import sqlite3
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional
+from files import jsonfile_read
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tournaments (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL,
+    location TEXT NOT NULL,
+    type TEXT NOT NULL,
+    winning_score INTEGER,
+    max_dice_value INTEGER,
+    winner TEXT
+);
+CREATE TABLE IF NOT EXISTS players (
+    id INTEGER PRIMARY KEY,
+    nickname TEXT NOT NULL UNIQUE,
+    gender TEXT,
+    state TEXT
+);
+CREATE TABLE IF NOT EXISTS matches (
+    id INTEGER PRIMARY KEY,
+    tournament_id INTEGER REFERENCES tournaments(id),
+    date TEXT,
+    round INTEGER,
+    house_id INTEGER NOT NULL REFERENCES players(id),
+    guest_id INTEGER NOT NULL REFERENCES players(id),
+    house_score INTEGER NOT NULL,
+    guest_score INTEGER NOT NULL,
+    winner_id INTEGER NOT NULL REFERENCES players(id),
+    duration INTEGER
+);
+CREATE TABLE IF NOT EXISTS standings (
+    tournament_id INTEGER NOT NULL REFERENCES tournaments(id),
+    player_id INTEGER NOT NULL REFERENCES players(id),
+    position INTEGER NOT NULL,
+    wins INTEGER NOT NULL,
+    games INTEGER NOT NULL,
+    score_plus INTEGER NOT NULL,
+    score_minus INTEGER NOT NULL,
+    PRIMARY KEY (tournament_id, player_id)
+);
+"""
+
+# Indexy nad tabulkou zápasů - při hromadném nahrávání se dočasně ruší
+MATCH_INDEXES = {
+    "idx_matches_tournament": "CREATE INDEX IF NOT EXISTS idx_matches_tournament ON matches(tournament_id)",
+    "idx_matches_house": "CREATE INDEX IF NOT EXISTS idx_matches_house ON matches(house_id)",
+    "idx_matches_guest": "CREATE INDEX IF NOT EXISTS idx_matches_guest ON matches(guest_id)",
+    "idx_matches_date": "CREATE INDEX IF NOT EXISTS idx_matches_date ON matches(date)",
+}
+
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_tournaments_location ON tournaments(location)",
+    "CREATE INDEX IF NOT EXISTS idx_tournaments_date ON tournaments(date)",
+    "CREATE INDEX IF NOT EXISTS idx_standings_player ON standings(player_id)",
+] + list(MATCH_INDEXES.values())
+
+# Maximální počet parametrů v jednom dotazu IN (...)
+_IN_CHUNK = 500
+
+
+class ResultsDatabase:
+    """Úložiště výsledků turnajů a zápasů nad SQLite."""
+
+    def __init__(self, path: str = "results.db"):
+        """Otevře (nebo založí) databázi.
+
+        Args:
+            path (str): Cesta k souboru databáze (":memory:" pro dočasnou databázi).
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.execute("PRAGMA cache_size=-65536")
+        self._conn.executescript(SCHEMA)
+        with self._conn:
+            for statement in INDEXES:
+                self._conn.execute(statement)
+        self._player_ids: Dict[str, int] = {}
+
+    def __enter__(self):
+        """Umožňuje použití v bloku with."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Při opuštění bloku with uzavře databázi."""
+        self.close()
+
+    def close(self):
+        """Uzavře spojení s databází."""
+        self._conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        """Transakce, po jejímž selhání se zahodí cache id hráčů.
+
+        Id hráčů založených v odvolané transakci v databázi nejsou, cache
+        by na ně jinak dál odkazovala.
+        """
+        try:
+            with self._conn:
+                yield
+        except BaseException:
+            self._player_ids.clear()
+            raise
+
+    def _ensure_players(self, players: Dict[str, tuple]) -> Dict[str, int]:
+        """Založí chybějící hráče a vrátí mapu přezdívka -> id.
+
+        Args:
+            players (Dict[str, tuple]): Přezdívka -> (pohlaví, stát); neznámé hodnoty jsou None.
+
+        Returns:
+            Dict[str, int]: Id všech předaných hráčů.
+        """
+        missing = [name for name in players if name not in self._player_ids]
+        if missing:
+            self._conn.executemany(
+                "INSERT INTO players (nickname, gender, state) VALUES (?, ?, ?) "
+                "ON CONFLICT(nickname) DO UPDATE SET "
+                "gender = COALESCE(excluded.gender, gender), state = COALESCE(excluded.state, state)",
+                [(name, *players[name]) for name in missing]
+            )
+            for i in range(0, len(missing), _IN_CHUNK):
+                chunk = missing[i:i + _IN_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                for player_id, nickname in self._conn.execute(
+                        f"SELECT id, nickname FROM players WHERE nickname IN ({placeholders})", chunk):
+                    self._player_ids[nickname] = player_id
+
+        return self._player_ids
+
+    def _insert_tournament(self, results: Dict) -> int:
+        """Vloží jeden turnaj (bez commitu) a vrátí jeho id."""
+        info = results["tournament_info"]
+        winner = results.get("winner")
+
+        players = {p["nickname"]: (p.get("gender"), p.get("state")) for p in results.get("players", [])}
+        for match in results.get("matches", []):
+            for key in ("player1", "player2"):
+                nickname = match[key]["nickname"]
+                if nickname not in players:
+                    players[nickname] = (None, match[key].get("state"))
+        for standing in results.get("final_standings", []):
+            if standing["player"] not in players:
+                players[standing["player"]] = (None, standing.get("state"))
+        ids = self._ensure_players(players)
+
+        cursor = self._conn.execute(
+            "INSERT INTO tournaments (date, location, type, winning_score, max_dice_value, winner) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (info["date"], info["location"], info["type"], info.get("winning_score"),
+             info.get("max_dice_value"), winner["nickname"] if winner else None)
+        )
+        tournament_id = cursor.lastrowid
+
+        self._conn.executemany(
+            "INSERT INTO matches (tournament_id, date, round, house_id, guest_id, "
+            "house_score, guest_score, winner_id, duration) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                (tournament_id, info["date"], m.get("round"),
+                 ids[m["player1"]["nickname"]], ids[m["player2"]["nickname"]],
+                 m["final_score"]["player1"], m["final_score"]["player2"],
+                 ids[m["winner"]], m.get("match_duration"))
+                for m in results.get("matches", [])
+            )
+        )
+
+        self._conn.executemany(
+            "INSERT INTO standings (tournament_id, player_id, position, wins, games, score_plus, score_minus) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                (tournament_id, ids[s["player"]], s["position"], s["wins"], s["games"],
+                 s["score_plus"], s["score_minus"])
+                for s in results.get("final_standings", [])
+            )
+        )
+        return tournament_id
+
+    def save_tournament(self, results: Dict) -> int:
+        """Uloží výsledky jednoho turnaje v jedné transakci.
+
+        Args:
+            results (Dict): Výsledky ve formátu `BaseTournament.get_results()`.
+
+        Returns:
+            int: Id turnaje v databázi.
+        """
+        with self._transaction():
+            return self._insert_tournament(results)
+
+    def save_tournaments(self, results_iter: Iterable[Dict], bulk: bool = False) -> List[int]:
+        """Hromadně uloží více turnajů v jedné transakci.
+
+        Args:
+            results_iter (Iterable[Dict]): Výsledky turnajů.
+            bulk (bool): Režim hromadného nahrávání - indexy nad zápasy se po dobu
+                vkládání zruší a na konci postaví znovu. Vyplatí se při nahrávání
+                velkého objemu (např. celé sezóny) vůči velikosti databáze.
+                Zrušení indexů je součástí transakce - po selhání se odvolá i ono.
+
+        Returns:
+            List[int]: Id uložených turnajů.
+        """
+        with self._transaction():
+            if bulk:
+                # DDL by jinak sqlite3 provedl mimo transakci (BEGIN vkládá až před INSERT)
+                # a po selhání by indexy zůstaly zrušené
+                self._conn.execute("BEGIN")
+                for name in MATCH_INDEXES:
+                    self._conn.execute(f"DROP INDEX IF EXISTS {name}")
+            ids = [self._insert_tournament(results) for results in results_iter]
+            if bulk:
+                for statement in MATCH_INDEXES.values():
+                    self._conn.execute(statement)
+            return ids
+
+    def save_matches(self, results_iter: Iterable[Dict]) -> int:
+        """Hromadně uloží samostatné zápasy (mimo turnaj).
+
+        Args:
+            results_iter (Iterable[Dict]): Výsledky ve formátu `Match.get_result()`.
+
+        Returns:
+            int: Počet uložených zápasů.
+        """
+        results = list(results_iter)
+        with self._transaction():
+            players = {}
+            for r in results:
+                players[r["house_player"]] = (None, None)
+                players[r["guest_player"]] = (None, None)
+            ids = self._ensure_players(players)
+            self._conn.executemany(
+                "INSERT INTO matches (tournament_id, date, round, house_id, guest_id, "
+                "house_score, guest_score, winner_id, duration) VALUES (NULL, ?, NULL, ?, ?, ?, ?, ?, ?)",
+                (
+                    (r["date"], ids[r["house_player"]], ids[r["guest_player"]],
+                     r["score"][0], r["score"][1],
+                     ids[r["house_player"] if r["score"][0] > r["score"][1] else r["guest_player"]],
+                     r["score"][0] + r["score"][1])
+                    for r in results
+                )
+            )
+        return len(results)
+
+    def save_match(self, result: Dict):
+        """Uloží jeden samostatný zápas.
+
+        Args:
+            result (Dict): Výsledek ve formátu `Match.get_result()`.
+        """
+        self.save_matches([result])
+
+    def import_file(self, filename: str) -> int:
+        """Uloží výsledky ze souboru vytvořeného `save_tournament_results`.
+
+        Args:
+            filename (str): Cesta k výsledkovému souboru.
+
+        Returns:
+            int: Id turnaje v databázi.
+        """
+        return self.save_tournament(jsonfile_read(filename))
+
+    def leaderboard(self, limit: int = 10, location: Optional[str] = None) -> List[Dict]:
+        """Vrací souhrnný žebříček hráčů přes všechny (nebo vybrané) turnaje.
+
+        Args:
+            limit (int): Maximální počet hráčů.
+            location (Optional[str]): Omezení na místo konání.
+
+        Returns:
+            List[Dict]: Hráči seřazení podle výher a rozdílu skóre.
+        """
+        where = "WHERE t.location = ?" if location is not None else ""
+        params = [location] if location is not None else []
+        rows = self._conn.execute(
+            f"""
+            SELECT p.nickname, p.state, COUNT(*) AS tournaments,
+                   SUM(s.wins) AS wins, SUM(s.games) AS games,
+                   SUM(s.score_plus) AS score_plus, SUM(s.score_minus) AS score_minus,
+                   SUM(t.winner = p.nickname) AS titles
+            FROM standings s
+            JOIN players p ON p.id = s.player_id
+            JOIN tournaments t ON t.id = s.tournament_id
+            {where}
+            GROUP BY s.player_id
+            ORDER BY wins DESC, score_plus - score_minus DESC
+            LIMIT ?
+            """,
+            params + [limit]
+        )
+        columns = [c[0] for c in rows.description]
+        return [dict(zip(columns, row)) for row in rows]
+
+    def player_matches(self, nickname: str, limit: Optional[int] = None) -> List[Dict]:
+        """Vrací zápasy hráče od nejnovějších.
+
+        Args:
+            nickname (str): Přezdívka hráče.
+            limit (Optional[int]): Maximální počet zápasů (None = všechny).
+
+        Returns:
+            List[Dict]: Zápasy s přezdívkami hráčů, skóre a délkou zápasu.
+        """
+        rows = self._conn.execute(
+            """
+            SELECT m.tournament_id, m.date, m.round, h.nickname AS house_player,
+                   g.nickname AS guest_player, m.house_score, m.guest_score,
+                   w.nickname AS winner, m.duration
+            FROM players p
+            JOIN matches m ON m.house_id = p.id OR m.guest_id = p.id
+            JOIN players h ON h.id = m.house_id
+            JOIN players g ON g.id = m.guest_id
+            JOIN players w ON w.id = m.winner_id
+            WHERE p.nickname = ?
+            ORDER BY m.id DESC
+            LIMIT ?
+            """,
+            (nickname, -1 if limit is None else limit)
+        )
+        columns = [c[0] for c in rows.description]
+        return [dict(zip(columns, row)) for row in rows]
+
+    def count(self, table: str) -> int:
+        """Vrací počet řádků v tabulce.
+
+        Raises:
+            ValueError: Pokud tabulka není součástí schématu.
+        """
+        if table not in ("tournaments", "players", "matches", "standings"):
+            raise ValueError(f"Neznámá tabulka '{table}'.")
+        return self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
@@ -0,0 +1,199 @@
+"""Generátor syntetických soupisek hráčů pro zátěžové testy.
+
+Vytvoří soupisku libovolného počtu hráčů (i desítky milionů) ve formátu,
+který umí načíst `load_players`:
+
+- `.json` - seznam objektů (jako `players.json`)
+- `.jsonl` / `.jsonl.gz` - jeden hráč na řádek
+- `.csv` - oddělovač `;`, sloupce nickname, gender, state
+
+Hráči se generují po dávkách a rovnou zapisují na disk, spotřeba paměti
+je tedy konstantní. Přezdívky jsou unikátní (vyslovitelné jméno +
+pořadové číslo), pohlaví jsou platné hodnoty `Gender` a státy se losují
+podle zadaných vah. Se stejným seedem vznikne vždy stejná soupiska.
+
+Spuštění::
+
+    python roster_generator.py roster.jsonl --count 1000000 --seed 42 --states CZE=3,SVK=1,POL=1
+"""
+
+import json
+import random
+import sys
+from itertools import accumulate, islice, product
+from typing import Dict, Iterator, Optional, Sequence, Union
+from game import Gender
+from files import jsonlfile_write, csvfile_write
+
+# Státy hráčů z `players.json` - výchozí (rovnoměrné) rozložení
+DEFAULT_STATES = ("AUS", "CAN", "CZE", "FIN", "FRA", "GER", "JAP", "POL", "RUS", "SPA", "SVK", "SWE", "USA")
+
+# Slabiky pro skládání vyslovitelných přezdívek
+SYLLABLES = ("ka", "lo", "mi", "ra", "ne", "to", "va", "ji", "ho", "su", "de", "ba", "ze", "ly", "po", "fi")
+
+# Všechna dvou- a tříslabičná jména (losují se po celých dávkách)
+NAMES = tuple(''.join(parts).capitalize()
+              for k in (2, 3) for parts in product(SYLLABLES, repeat=k))
+
+FORMATS = (".json", ".jsonl", ".jsonl.gz", ".csv")
+
+# Počet hráčů generovaných najednou
+CHUNK_SIZE = 10000
+
+
+def parse_states(spec: str) -> Dict[str, float]:
+    """Převede textový zápis rozložení států na slovník vah.
+
+    Args:
+        spec (str): Např. "CZE=3,SVK=1" (váhy) nebo "CZE,SVK" (rovnoměrně).
+
+    Returns:
+        Dict[str, float]: Stát -> váha.
+
+    Raises:
+        ValueError: Pokud zápis není platný.
+    """
+    states = {}
+    for item in spec.split(','):
+        state, _, weight = item.strip().partition('=')
+        if not state:
+            raise ValueError(f"Neplatné rozložení států: '{spec}'.")
+        try:
+            states[state] = float(weight) if weight else 1.0
+        except ValueError:
+            raise ValueError(f"Neplatná váha státu '{state}': '{weight}'.")
+    return states
+
+
+def generate_players(count: int, seed: Optional[int] = None,
+                     states: Union[Dict[str, float], Sequence[str], None] = None,
+                     female_ratio: float = 0.5) -> Iterator[Dict]:
+    """Postupně generuje záznamy hráčů.
+
+    Args:
+        count (int): Počet hráčů.
+        seed (Optional[int]): Seed generátoru (None = pokaždé jiná soupiska).
+        states: Slovník stát -> váha, seznam států (rovnoměrně), nebo None (`DEFAULT_STATES`).
+        female_ratio (float): Podíl hráček (0-1).
+
+    Yields:
+        Dict: Záznam hráče s klíči nickname, gender, state.
+
+    Raises:
+        ValueError: Pokud jsou parametry mimo rozsah.
+    """
+    if count < 0:
+        raise ValueError("Počet hráčů nesmí být záporný.")
+    if not 0 <= female_ratio <= 1:
+        raise ValueError("Podíl hráček musí být v rozmezí 0 až 1.")
+
+    if states is None:
+        states = DEFAULT_STATES
+    if isinstance(states, dict):
+        state_names, weights = list(states), list(states.values())
+    else:
+        state_names, weights = list(states), [1.0] * len(states)
+    if not state_names or any(w < 0 for w in weights) or sum(weights) <= 0:
+        raise ValueError("Rozložení států musí obsahovat alespoň jeden stát s kladnou váhou.")
+    cum_weights = list(accumulate(weights))
+
+    rng = random.Random(seed)
+    genders = (Gender.female.value, Gender.male.value)
+    gender_weights = (female_ratio, 1.0)
+
+    for start in range(0, count, CHUNK_SIZE):
+        size = min(CHUNK_SIZE, count - start)
+        chunk = zip(
+            range(start + 1, start + size + 1),
+            rng.choices(NAMES, k=size),
+            rng.choices(genders, cum_weights=gender_weights, k=size),
+            rng.choices(state_names, cum_weights=cum_weights, k=size)
+        )
+        # Jméno jen z písmen + číslo hráče => přezdívky jsou unikátní
+        for number, name, gender, state in chunk:
+            yield {"nickname": f"{name}{number}", "gender": gender, "state": state}
+
+
+def _write_json_array(path: str, rows: Iterator[Dict]) -> int:
+    """Zapíše záznamy jako JSON seznam (jeden objekt na řádek) s konstantní pamětí."""
+    count = 0
+    encoder = json.JSONEncoder().encode
+    with open(path, mode='w', encoding='utf-8') as file:
+        file.write('[')
+        while True:
+            chunk = list(islice(rows, CHUNK_SIZE))
+            if not chunk:
+                break
+            separator = '\n  ' if count == 0 else ',\n  '
+            file.write(separator + ',\n  '.join(encoder(row) for row in chunk))
+            count += len(chunk)
+        file.write('\n]\n')
+    return count
+
+
+def write_roster(path: str, count: int, seed: Optional[int] = None,
+                 states: Union[Dict[str, float], Sequence[str], None] = None,
+                 female_ratio: float = 0.5) -> int:
+    """Vygeneruje soupisku a zapíše ji do souboru (formát podle přípony).
+
+    Args:
+        path (str): Výstupní soubor (.json, .jsonl, .jsonl.gz nebo .csv).
+        count (int): Počet hráčů.
+        seed (Optional[int]): Seed generátoru.
+        states: Rozložení států (viz `generate_players`).
+        female_ratio (float): Podíl hráček (0-1).
+
+    Returns:
+        int: Počet zapsaných hráčů.
+
+    Raises:
+        ValueError: Pokud je formát neznámý nebo parametry mimo rozsah.
+    """
+    lower_path = path.lower()
+    if not lower_path.endswith(FORMATS):
+        raise ValueError(f"Neznámý formát soupisky '{path}'. Podporované přípony: {', '.join(FORMATS)}")
+    if count < 1:
+        raise ValueError("Soupiska musí obsahovat alespoň 1 hráče.")
+
+    rows = generate_players(count, seed, states, female_ratio)
+    if lower_path.endswith('.csv'):
+        return csvfile_write(path, rows, fieldnames=["nickname", "gender", "state"])
+    if lower_path.endswith('.json'):
+        return _write_json_array(path, rows)
+    return jsonlfile_write(path, rows)
+
+
+def parse_args(argv=None):
+    """Zpracuje argumenty příkazové řádky."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generátor syntetických soupisek hráčů.")
+    parser.add_argument("output", help=f"výstupní soubor ({', '.join(FORMATS)})")
+    parser.add_argument("--count", type=int, required=True, help="počet hráčů")
+    parser.add_argument("--seed", type=int, default=None, help="seed generátoru")
+    parser.add_argument("--states", default=None,
+                        help="rozložení států, např. CZE=3,SVK=1 (výchozí: státy z players.json)")
+    parser.add_argument("--female-ratio", type=float, default=0.5, help="podíl hráček (0-1)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """Vstupní bod generátoru.
+
+    Returns:
+        int: Návratový kód procesu.
+    """
+    args = parse_args(argv)
+    try:
+        states = parse_states(args.states) if args.states else None
+        count = write_roster(args.output, args.count, args.seed, states, args.female_ratio)
+    except ValueError as e:
+        print(f"Chyba: {e}", file=sys.stderr)
+        return 2
+
+    print(f"Vygenerováno {count} hráčů do '{args.output}'")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
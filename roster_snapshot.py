@@ -0,0 +1,225 @@
+"""Binární snímek (snapshot) načtené soupisky pro rychlý start.
+
+`load_players` při každém spuštění znovu parsuje a validuje zdrojový
+soubor a hráče vytváří po jednom. `load_players_cached` místo toho při
+prvním načtení uloží vedle zdrojové soupisky kompaktní binární snímek
+(`<soupiska>.snap`) a při dalších spuštěních načte hráče z něj: jedním
+čtením souboru, dekódováním přezdívek po celých blocích a hromadným
+vytvořením hráčů (`Player.from_columns`).
+
+Formát snímku (little-endian):
+
+- hlavička: magické číslo, verze, velikost a mtime zdrojového souboru,
+  SHA-256 zdrojového souboru, počet hráčů a počet různých států
+- státy a přezdívky jako UTF-8 oddělené znakem NUL
+- pohlaví jako jeden bajt na hráče
+- index státu hráče (`array` 'H', nebo 'I' pro více než 65536 států)
+
+Snímek je platný, pokud zdrojový soubor má stejnou velikost a mtime;
+při změně mtime se porovná hash obsahu (soubor jen "přepsaný" stejnými
+daty se tak znovu neparsuje). Jinak se snímek vytvoří znovu.
+"""
+
+import hashlib
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from typing import List, Optional
+from game import Gender, Player, load_players
+
+MAGIC = b'RSNP'
+VERSION = 1
+
+# magické číslo, verze, velikost zdroje, mtime zdroje (ns), SHA-256 zdroje, počet hráčů, počet států
+HEADER = struct.Struct('<4sHxxQq32sII')
+SECTION = struct.Struct('<Q')
+
+# Pohlaví <-> bajt ve snímku
+GENDERS = (Gender.male, Gender.female)
+GENDER_CODES = {gender: code for code, gender in enumerate(GENDERS)}
+
+SUFFIX = ".snap"
+
+
+def snapshot_path(source: str) -> str:
+    """Vrací výchozí cestu snímku pro zdrojovou soupisku."""
+    return source + SUFFIX
+
+
+def _file_digest(path: str) -> bytes:
+    """Vrací SHA-256 obsahu souboru."""
+    digest = hashlib.sha256()
+    with open(path, mode='rb') as file:
+        for block in iter(lambda: file.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.digest()
+
+
+def write_snapshot(source: str, players: List[Player], path: Optional[str] = None,
+                   source_stat: Optional[os.stat_result] = None, digest: Optional[bytes] = None) -> str:
+    """Uloží snímek soupisky (atomicky).
+
+    Args:
+        source (str): Zdrojový soubor soupisky (jeho velikost, mtime a hash se uloží do hlavičky).
+        players (List[Player]): Hráči načtení ze zdrojového souboru.
+        path (Optional[str]): Cesta snímku (výchozí: `snapshot_path(source)`).
+        source_stat (Optional[os.stat_result]): `os.stat` zdroje pořízený před jeho
+            parsováním (None = zjistí se teď).
+        digest (Optional[bytes]): SHA-256 zdroje spočtený před jeho parsováním
+            (None = spočte se teď).
+
+    Returns:
+        str: Cesta uloženého snímku.
+
+    Raises:
+        ValueError: Pokud přezdívka nebo stát obsahuje znak NUL.
+    """
+    path = path or snapshot_path(source)
+    if source_stat is None:
+        source_stat = os.stat(source)
+    if digest is None:
+        digest = _file_digest(source)
+
+    state_index = {}
+    for player in players:
+        state_index.setdefault(player.state, len(state_index))
+    states = list(state_index)
+    nicknames = [player.nickname for player in players]
+    if any('\0' in text for text in nicknames + states):
+        raise ValueError("Přezdívky a státy ve snímku nesmí obsahovat znak NUL.")
+
+    indexes = array('H' if len(states) <= 0x10000 else 'I', (state_index[player.state] for player in players))
+    if sys.byteorder == 'big':
+        indexes.byteswap()
+    sections = [
+        '\0'.join(states).encode('utf-8'),
+        '\0'.join(nicknames).encode('utf-8'),
+        bytes(GENDER_CODES[player.gender] for player in players),
+        indexes.tobytes(),
+    ]
+    header = HEADER.pack(MAGIC, VERSION, source_stat.st_size, source_stat.st_mtime_ns,
+                         digest, len(players), len(states))
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, mode='wb') as file:
+            file.write(header)
+            for section in sections:
+                file.write(SECTION.pack(len(section)))
+                file.write(section)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    return path
+
+
+def _is_current(header: tuple, source: str, path: str) -> bool:
+    """Ověří, že snímek odpovídá aktuálnímu zdrojovému souboru.
+
+    Při shodě velikosti i mtime se hash nepočítá. Pokud se liší jen mtime
+    a hash sedí, uloží se do snímku nový mtime.
+    """
+    _, _, size, mtime_ns, digest, _, _ = header
+    source_stat = os.stat(source)
+    if source_stat.st_size != size:
+        return False
+    if source_stat.st_mtime_ns == mtime_ns:
+        return True
+    if _file_digest(source) != digest:
+        return False
+
+    with open(path, mode='r+b') as file:
+        file.write(HEADER.pack(*header[:3], source_stat.st_mtime_ns, *header[4:]))
+    return True
+
+
+def read_snapshot(path: str, source: Optional[str] = None) -> Optional[List[Player]]:
+    """Načte hráče ze snímku.
+
+    Args:
+        path (str): Cesta snímku.
+        source (Optional[str]): Zdrojový soubor, vůči kterému se ověří platnost
+            snímku (None = bez ověření).
+
+    Returns:
+        Optional[List[Player]]: Hráči, nebo None, pokud snímek chybí, je
+            poškozený, má jinou verzi nebo neodpovídá zdrojovému souboru.
+    """
+    try:
+        with open(path, mode='rb') as file:
+            data = file.read()
+    except FileNotFoundError:
+        return None
+
+    try:
+        header = HEADER.unpack_from(data)
+        magic, version, _, _, _, count, state_count = header
+        if magic != MAGIC or version != VERSION:
+            return None
+        if source is not None and not _is_current(header, source, path):
+            return None
+
+        view = memoryview(data)
+        offset = HEADER.size
+        sections = []
+        for _ in range(4):
+            (length,) = SECTION.unpack_from(view, offset)
+            offset += SECTION.size
+            sections.append(view[offset:offset + length])
+            offset += length
+
+        states_blob, nicknames_blob, gender_codes, state_codes = sections
+        states = str(states_blob, 'utf-8').split('\0') if state_count else []
+        nicknames = str(nicknames_blob, 'utf-8').split('\0') if count else []
+        indexes = array('H' if state_count <= 0x10000 else 'I')
+        indexes.frombytes(state_codes)
+        if sys.byteorder == 'big':
+            indexes.byteswap()
+        if len(nicknames) != count or len(gender_codes) != count or len(indexes) != count:
+            return None
+        if len(states) != state_count:
+            return None
+        # Neplatné kódy pohlaví a indexy států (poškozený snímek)
+        if count and (max(gender_codes) >= len(GENDERS) or max(indexes) >= state_count):
+            return None
+
+        return Player.from_columns(nicknames, map(GENDERS.__getitem__, gender_codes),
+                                   map(states.__getitem__, indexes))
+    except (struct.error, UnicodeDecodeError, IndexError, ValueError):
+        return None
+
+
+def load_players_cached(source: str, path: Optional[str] = None) -> List[Player]:
+    """Načte soupisku ze snímku, nebo ze zdroje (a snímek vytvoří).
+
+    Args:
+        source (str): Zdrojový soubor soupisky (formáty jako `load_players`).
+        path (Optional[str]): Cesta snímku (výchozí: `snapshot_path(source)`).
+
+    Returns:
+        List[Player]: Hráči soupisky.
+
+    Raises:
+        Výjimky `load_players`, pokud se soupiska čte ze zdroje.
+    """
+    path = path or snapshot_path(source)
+    players = read_snapshot(path, source)
+    if players is None:
+        # Stav zdroje se zjistí před parsováním - změní-li se soubor mezitím,
+        # snímek nese starý stav a příště se zahodí (opačně by platil navždy)
+        source_stat = os.stat(source)
+        digest = _file_digest(source)
+        players = load_players(source)
+        try:
+            write_snapshot(source, players, path, source_stat, digest)
+        except (OSError, ValueError):
+            # Snímek je jen zrychlení - bez něj se soupiska načte i příště
+            pass
+    return players
@@ -0,0 +1,648 @@
+"""Lokální HTTP služba pro simulace na vyžádání (asyncio, jen standardní knihovna).
+
+Endpointy (tělo požadavku i odpovědi je JSON):
+
+- `POST /tournament` - odehraje turnaj nad zaslanou soupiskou a vrátí
+  výsledky ve formátu výsledkového souboru (`get_results`)::
+
+      {"players": [{"nickname": "...", "gender": "man", "state": "CZE"}, ...],
+       "tournament_type": "round_robin", "location": "Praha", "seed": 42,
+       "winning_score": 10, "max_dice_value": 6, "retention": "all",
+       "options": {"num_groups": 4}, "timeout": 2.5}
+
+  `options` smí obsahovat jen volby z `TOURNAMENT_OPTIONS` v jejich
+  rozsahu. Po vypršení `timeout` (sekundy) se turnaj přeruší a vrátí se
+  výsledky odehrané části (`tournament_info.cancelled` obsahuje důvod).
+  Limit platí vždy: bez `timeout` v požadavku se použije
+  `tournament_timeout` serveru a delší limit než `max_tournament_timeout`
+  se zkrátí - klient může limit jen snížit.
+
+- `POST /match` - odehraje jeden zápas dvou hráčů
+  (`{"house": {...}, "guest": {...}, "seed": 1, "winning_score": 10}`)
+- `POST /predict` (nebo `GET /predict?house=3&guest=5&winning_score=10`) -
+  analytická predikce zápasu z daného skóre (`MatchPredictor`)
+- `GET /stats` - latence jednotlivých endpointů, velikosti dávek, zátěž
+- `GET /health`
+
+Vstupy jsou omezené: `winning_score` nejvýše `MAX_WINNING_SCORE`, turnaj
+nejvýše `MAX_PLAYERS` hráčů - větší požadavky se odmítnou se stavem 400.
+
+Souběžné požadavky stejného druhu se sbírají do dávek (nejvýše
+`batch_size` požadavků nebo `batch_delay` sekund) a dávka se odešle do
+poolu workerů jako jedna úloha - režie předání procesu se tak rozloží
+na celou dávku. Turnaje se nedávkují (každý je sám o sobě velká úloha).
+Spojení zůstávají otevřená (HTTP/1.1 keep-alive) a počet současně
+zpracovávaných požadavků omezuje semafor (`max_concurrency`); další
+požadavky čekají ve frontě.
+
+Spuštění::
+
+    python server.py --port 8080 --workers 4 --max-concurrency 64
+"""
+
+import asyncio
+import json
+import sys
+import time
+from collections import deque
+from http import HTTPStatus
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+# Maximální velikost těla požadavku v bajtech
+MAX_BODY_SIZE = 64 * 1024 * 1024
+
+# Maximální počet hlaviček požadavku
+MAX_HEADERS = 100
+
+# Nejvyšší přípustný počet bodů k vítězství (cena predikce i simulace roste se skóre)
+MAX_WINNING_SCORE = 100
+
+# Nejvyšší přípustný počet hráčů turnaje
+MAX_PLAYERS = 1000
+
+# Časový limit turnaje v sekundách, pokud ho klient nezadá, a nejvyšší přípustný limit
+DEFAULT_TOURNAMENT_TIMEOUT = 10.0
+MAX_TOURNAMENT_TIMEOUT = 60.0
+
+# Volby turnaje, které smí klient nastavit: název -> (typ, minimum, maximum)
+TOURNAMENT_OPTIONS = {
+    "games_per_player": (int, 1, 100),
+    "bucket_width": (float, 1, 1000),
+    "max_gap": (float, 0, 10000),
+    "num_groups": (int, 1, 64),
+    "advance": (int, 1, 64),
+}
+
+# Počet posledních měření latence, ze kterých se počítají percentily
+LATENCY_SAMPLES = 2048
+
+ROUTES = {
+    ("POST", "/tournament"): "tournament",
+    ("POST", "/match"): "match",
+    ("POST", "/predict"): "predict",
+    ("GET", "/predict"): "predict",
+}
+
+
+class HTTPError(Exception):
+    """Chyba požadavku, která se vrátí klientovi s daným stavovým kódem."""
+
+    def __init__(self, status: int, message: str):
+        """Inicializuje chybu.
+
+        Args:
+            status (int): HTTP stavový kód.
+            message (str): Popis chyby pro klienta.
+        """
+        super().__init__(message)
+        self.status = status
+
+
+def _winning_score(payload: Dict) -> int:
+    """Vrací počet bodů k vítězství z požadavku.
+
+    Raises:
+        ValueError: Pokud je mimo rozsah 1 až `MAX_WINNING_SCORE`.
+    """
+    winning_score = int(payload.get("winning_score", 10))
+    if not 1 <= winning_score <= MAX_WINNING_SCORE:
+        raise ValueError(f"Počet bodů k vítězství musí být v rozmezí 1 až {MAX_WINNING_SCORE}.")
+    return winning_score
+
+
+def _tournament_options(payload: Dict) -> Dict:
+    """Vrací ověřené volby turnaje z požadavku (`options`).
+
+    Raises:
+        ValueError: Pokud volba není povolená nebo má neplatný typ či hodnotu.
+    """
+    options = payload.get("options") or {}
+    if not isinstance(options, dict):
+        raise ValueError("Volby turnaje musí být JSON objekt.")
+
+    checked = {}
+    for name, value in options.items():
+        if name not in TOURNAMENT_OPTIONS:
+            raise ValueError(f"Nepodporovaná volba turnaje '{name}'. "
+                             f"Povolené volby: {', '.join(TOURNAMENT_OPTIONS)}")
+        kind, low, high = TOURNAMENT_OPTIONS[name]
+        allowed = (int, float) if kind is float else (int,)
+        if isinstance(value, bool) or not isinstance(value, allowed):
+            raise ValueError(f"Volba '{name}' musí být {'číslo' if kind is float else 'celé číslo'}.")
+        if not low <= value <= high:
+            raise ValueError(f"Volba '{name}' musí být v rozmezí {low} až {high}.")
+        checked[name] = kind(value)
+    return checked
+
+
+def _tournament_timeout(payload: Dict, default: float = DEFAULT_TOURNAMENT_TIMEOUT,
+                        maximum: float = MAX_TOURNAMENT_TIMEOUT) -> float:
+    """Vrací časový limit turnaje z požadavku.
+
+    Bez limitu v požadavku platí `default`, delší limit než `maximum` se
+    zkrátí - klient může limit jen snížit.
+
+    Raises:
+        ValueError: Pokud limit není kladné číslo.
+    """
+    timeout = payload.get("timeout")
+    if timeout is None:
+        return default
+    if isinstance(timeout, bool) or not isinstance(timeout, (int, float)) or not timeout > 0:
+        raise ValueError("Časový limit turnaje musí být kladné číslo.")
+    return min(float(timeout), maximum)
+
+
+def _run_tournament(payload: Dict) -> Dict:
+    """Odehraje turnaj z požadavku a vrátí jeho výsledky."""
+    from game import players_from_rows
+    from tournament import TournamentFactory
+
+    if len(payload["players"]) > MAX_PLAYERS:
+        raise ValueError(f"Turnaj může mít nejvýše {MAX_PLAYERS} hráčů.")
+
+    tournament = TournamentFactory.create(
+        payload.get("tournament_type", "round_robin"),
+        players_from_rows(payload["players"]),
+        payload.get("location", "Server"),
+        _winning_score(payload),
+        payload.get("max_dice_value", 6),
+        retention=payload.get("retention"),
+        seed=payload.get("seed"),
+        **_tournament_options(payload)
+    )
+    for _ in tournament.iter_events(timeout=_tournament_timeout(payload)):
+        pass
+    return tournament.get_results()
+
+
+def _run_match(payload: Dict) -> Dict:
+    """Odehraje zápas z požadavku a vrátí jeho výsledek."""
+    from game import Match, StatsContext, players_from_rows
+
+    house, guest = players_from_rows([payload["house"], payload["guest"]])
+    match = Match(house, guest, _winning_score(payload), payload.get("max_dice_value", 6),
+                  payload.get("seed"), StatsContext())
+    match.play()
+    score = match.score()
+    return {
+        "house": house.nickname,
+        "guest": guest.nickname,
+        "score": list(score),
+        "winner": house.nickname if score[0] > score[1] else guest.nickname,
+        "seed": match.seed,
+        "match_duration": score[0] + score[1]
+    }
+
+
+def _run_predict(payload: Dict) -> Dict:
+    """Vrátí analytickou predikci zápasu z daného skóre."""
+    from game import MatchPredictor
+
+    predictor = MatchPredictor.for_config(_winning_score(payload),
+                                          int(payload.get("max_dice_value", 6)))
+    score = (int(payload.get("house", 0)), int(payload.get("guest", 0)))
+    return {
+        "score": list(score),
+        "win_probability": predictor.win_probability(score),
+        "expected_remaining_points": predictor.expected_remaining_points(score),
+        "expected_remaining_rolls": predictor.expected_remaining_rolls(score),
+        "length_distribution": {str(k): v for k, v in predictor.length_distribution(score).items()}
+    }
+
+
+HANDLERS = {
+    "tournament": _run_tournament,
+    "match": _run_match,
+    "predict": _run_predict,
+}
+
+
+def execute_batch(jobs: List[Tuple[str, Dict]]) -> List[Tuple[int, object]]:
+    """Zpracuje dávku požadavků (běží v workeru).
+
+    Funkce je na úrovni modulu, aby ji šlo předat do procesového poolu.
+    Chyba jednoho požadavku neovlivní ostatní požadavky v dávce.
+
+    Args:
+        jobs (List[Tuple[str, Dict]]): Dvojice (druh požadavku, tělo požadavku).
+
+    Returns:
+        List[Tuple[int, object]]: Pro každý požadavek (HTTP stav, výsledek nebo text chyby).
+    """
+    results = []
+    for kind, payload in jobs:
+        try:
+            results.append((200, HANDLERS[kind](payload)))
+        except (KeyError, ValueError, TypeError) as e:
+            results.append((400, f"{type(e).__name__}: {e}"))
+        except Exception as e:
+            results.append((500, f"{type(e).__name__}: {e}"))
+    return results
+
+
+class LatencyStats:
+    """Latence jednoho endpointu (percentily z posledních `LATENCY_SAMPLES` měření)."""
+
+    def __init__(self):
+        """Inicializuje prázdné statistiky."""
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._samples: deque = deque(maxlen=LATENCY_SAMPLES)
+
+    def add(self, elapsed: float, ok: bool = True):
+        """Započte jeden požadavek.
+
+        Args:
+            elapsed (float): Doba zpracování v sekundách.
+            ok (bool): False, pokud požadavek skončil chybou.
+        """
+        self.count += 1
+        self.errors += not ok
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+        self._samples.append(elapsed)
+
+    def to_dict(self) -> Dict:
+        """Vrací statistiky v milisekundách."""
+        samples = sorted(self._samples)
+
+        def percentile(q):
+            return round(samples[min(len(samples) - 1, int(q * len(samples)))] * 1000, 3) if samples else 0.0
+
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "mean_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "p99_ms": percentile(0.99),
+            "max_ms": round(self.max * 1000, 3)
+        }
+
+
+class MicroBatcher:
+    """Sbírá souběžné požadavky do dávek a posílá je do poolu workerů."""
+
+    def __init__(self, executor, batch_size: int = 32, batch_delay: float = 0.005):
+        """Inicializuje dávkovač.
+
+        Args:
+            executor: Pool workerů (`concurrent.futures.Executor`).
+            batch_size (int): Maximální počet požadavků v dávce.
+            batch_delay (float): Jak dlouho (s) čekat na další požadavky do dávky.
+        """
+        self.executor = executor
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.batches = 0
+        self.jobs = 0
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._pending = set()
+
+    async def submit(self, kind: str, payload: Dict) -> Tuple[int, object]:
+        """Zařadí požadavek do dávky a počká na jeho výsledek.
+
+        Returns:
+            Tuple[int, object]: HTTP stav a výsledek (nebo text chyby).
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((kind, payload, future))
+        return await future
+
+    async def run(self):
+        """Smyčka dávkovače (běží jako úloha po celou dobu života serveru)."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.batch_delay
+            while len(batch) < self.batch_size:
+                if self._queue.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    batch.append(self._queue.get_nowait())
+
+            # Dávka běží na pozadí, mezitím se sbírá další
+            task = asyncio.create_task(self._execute(batch))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+    async def _execute(self, batch: List):
+        """Odešle dávku do poolu a rozdá výsledky čekajícím požadavkům."""
+        self.batches += 1
+        self.jobs += len(batch)
+        jobs = [(kind, payload) for kind, payload, _ in batch]
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(self.executor, execute_batch, jobs)
+        except Exception as e:
+            results = [(500, f"{type(e).__name__}: {e}")] * len(batch)
+        for (_, _, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def to_dict(self) -> Dict:
+        """Vrací statistiky dávek."""
+        return {
+            "batches": self.batches,
+            "jobs": self.jobs,
+            "mean_batch_size": round(self.jobs / self.batches, 2) if self.batches else 0.0
+        }
+
+
+class SimulationServer:
+    """HTTP server simulační služby."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8080, workers: Optional[int] = None,
+                 max_concurrency: int = 64, batch_size: int = 32, batch_delay: float = 0.005,
+                 keepalive_timeout: float = 15.0, executor=None,
+                 tournament_timeout: float = DEFAULT_TOURNAMENT_TIMEOUT,
+                 max_tournament_timeout: float = MAX_TOURNAMENT_TIMEOUT):
+        """Inicializuje server (naslouchat začne až `start`).
+
+        Args:
+            host (str): Adresa, na které server naslouchá.
+            port (int): Port (0 = libovolný volný, skutečný je pak v `port`).
+            workers (Optional[int]): Počet procesů poolu (None = počet CPU).
+            max_concurrency (int): Maximální počet současně zpracovávaných požadavků.
+            batch_size (int): Maximální počet požadavků v jedné dávce.
+            batch_delay (float): Jak dlouho (s) čekat na další požadavky do dávky.
+            keepalive_timeout (float): Po jaké době nečinnosti (s) se spojení zavře.
+            executor: Vlastní pool workerů (výchozí: `ProcessPoolExecutor`).
+            tournament_timeout (float): Časový limit turnaje (s), pokud ho klient nezadá.
+            max_tournament_timeout (float): Nejdelší časový limit turnaje (s), který
+                může klient požadovat (nejvýše `MAX_TOURNAMENT_TIMEOUT`).
+
+        Raises:
+            ValueError: Pokud jsou limity neplatné.
+        """
+        if max_concurrency < 1 or batch_size < 1 or batch_delay < 0:
+            raise ValueError("Limit souběžnosti a velikost dávky musí být alespoň 1, prodleva nezáporná.")
+        if not 0 < tournament_timeout <= max_tournament_timeout <= MAX_TOURNAMENT_TIMEOUT:
+            raise ValueError(f"Časové limity turnaje musí splňovat 0 < výchozí <= maximální "
+                             f"<= {MAX_TOURNAMENT_TIMEOUT} s.")
+
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.max_concurrency = max_concurrency
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.keepalive_timeout = keepalive_timeout
+        self.tournament_timeout = tournament_timeout
+        self.max_tournament_timeout = max_tournament_timeout
+        self.executor = executor
+        self._own_executor = executor is None
+        self.latency: Dict[str, LatencyStats] = {}
+        self.in_flight = 0
+        # Obsluha otevřeného spojení -> jeho writer
+        self._connections: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+        self._server = None
+        self._batchers: Dict[str, MicroBatcher] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._started = None
+
+    async def start(self):
+        """Spustí pool workerů, dávkovače a začne naslouchat."""
+        if self.executor is None:
+            from concurrent.futures import ProcessPoolExecutor
+            self.executor = ProcessPoolExecutor(max_workers=self.workers)
+
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        for kind in HANDLERS:
+            batch_size = 1 if kind == "tournament" else self.batch_size
+            self._batchers[kind] = MicroBatcher(self.executor, batch_size, self.batch_delay)
+        self._tasks = [asyncio.create_task(batcher.run()) for batcher in self._batchers.values()]
+
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._started = time.perf_counter()
+
+    async def serve_forever(self):
+        """Spustí server a obsluhuje požadavky až do zrušení."""
+        if self._server is None:
+            await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    @property
+    def connections(self) -> int:
+        """Počet otevřených spojení."""
+        return len(self._connections)
+
+    async def close(self):
+        """Zastaví server, zavře otevřená spojení, dávkovače a (vlastní) pool workerů."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        # Zavřením spojení dostane obsluha konec vstupu a skončí sama
+        for writer in self._connections.values():
+            writer.close()
+        if self._connections:
+            await asyncio.wait(list(self._connections), timeout=self.keepalive_timeout)
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        if self._own_executor and self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    def stats(self) -> Dict:
+        """Vrací provozní statistiky serveru (obsah `GET /stats`)."""
+        return {
+            "uptime": round(time.perf_counter() - self._started, 3) if self._started else 0.0,
+            "connections": self.connections,
+            "in_flight": self.in_flight,
+            "max_concurrency": self.max_concurrency,
+            "batching": {kind: batcher.to_dict() for kind, batcher in self._batchers.items()},
+            "latency": {endpoint: stats.to_dict() for endpoint, stats in sorted(self.latency.items())}
+        }
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Obslouží jedno spojení (i více požadavků díky keep-alive)."""
+        task = asyncio.current_task()
+        self._connections[task] = writer
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(self._read_request(reader), self.keepalive_timeout)
+                except HTTPError as e:
+                    await self._respond(writer, e.status, {"error": str(e)}, False)
+                    break
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    break
+                if request is None:
+                    break
+
+                method, target, keep_alive, body = request
+                start = time.perf_counter()
+                path, status, response = await self._dispatch(method, target, body)
+                self.latency.setdefault(f"{method} {path}", LatencyStats()).add(
+                    time.perf_counter() - start, status < 400)
+                await self._respond(writer, status, response, keep_alive)
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            del self._connections[task]
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader):
+        """Přečte jeden HTTP požadavek.
+
+        Returns:
+            Tuple (metoda, cíl, keep_alive, tělo), nebo None, pokud klient spojení zavřel.
+
+        Raises:
+            HTTPError: Pokud požadavek není platný HTTP/1.x požadavek.
+        """
+        line = await reader.readline()
+        if not line:
+            return None
+        try:
+            method, target, version = line.decode('latin-1').split()
+        except ValueError:
+            raise HTTPError(400, "Neplatný řádek požadavku.")
+        if not version.startswith("HTTP/1."):
+            raise HTTPError(505, f"Nepodporovaná verze protokolu '{version}'.")
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            if len(headers) >= MAX_HEADERS:
+                raise HTTPError(431, "Příliš mnoho hlaviček.")
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            raise HTTPError(400, "Neplatná hlavička Content-Length.")
+        if length > MAX_BODY_SIZE:
+            raise HTTPError(413, f"Tělo požadavku je větší než {MAX_BODY_SIZE} B.")
+        body = await reader.readexactly(length) if length else b''
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+        return method.upper(), target, keep_alive, body
+
+    async def _dispatch(self, method: str, target: str, body: bytes) -> Tuple[str, int, Dict]:
+        """Zpracuje požadavek a vrátí (cestu, stav, tělo odpovědi)."""
+        url = urlsplit(target)
+        path = url.path
+        if path == "/health" and method == "GET":
+            return path, 200, {"status": "ok"}
+        if path == "/stats" and method == "GET":
+            return path, 200, self.stats()
+
+        kind = ROUTES.get((method, path))
+        if kind is None:
+            if any(route_path == path for _, route_path in ROUTES):
+                return path, 405, {"error": f"Metoda {method} není pro {path} podporována."}
+            return "*", 404, {"error": f"Neznámý endpoint '{path}'."}
+
+        if method == "GET":
+            payload = dict(parse_qsl(url.query))
+        else:
+            try:
+                payload = json.loads(body or b'{}')
+            except ValueError as e:
+                return path, 400, {"error": f"Neplatný JSON: {e}"}
+            if not isinstance(payload, dict):
+                return path, 400, {"error": "Tělo požadavku musí být JSON objekt."}
+
+        if kind == "tournament":
+            # Limit služby - klient ho může jen snížit
+            try:
+                payload["timeout"] = _tournament_timeout(payload, self.tournament_timeout,
+                                                         self.max_tournament_timeout)
+            except ValueError as e:
+                return path, 400, {"error": f"ValueError: {e}"}
+
+        async with self._semaphore:
+            self.in_flight += 1
+            try:
+                status, result = await self._batchers[kind].submit(kind, payload)
+            finally:
+                self.in_flight -= 1
+        return path, status, result if status == 200 else {"error": result}
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: int, body: Dict, keep_alive: bool):
+        """Odešle JSON odpověď."""
+        payload = json.dumps(body, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        head = (
+            f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode('latin-1') + payload)
+        await writer.drain()
+
+
+def parse_args(argv=None):
+    """Zpracuje argumenty příkazové řádky."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="HTTP služba pro simulace turnajů a zápasů.")
+    parser.add_argument("--host", default="127.0.0.1", help="adresa, na které server naslouchá")
+    parser.add_argument("--port", type=int, default=8080, help="port serveru")
+    parser.add_argument("--workers", type=int, default=None, help="počet procesů poolu (výchozí: počet CPU)")
+    parser.add_argument("--max-concurrency", type=int, default=64,
+                        help="maximální počet současně zpracovávaných požadavků")
+    parser.add_argument("--batch-size", type=int, default=32, help="maximální velikost dávky")
+    parser.add_argument("--batch-delay", type=float, default=0.005,
+                        help="jak dlouho (s) čekat na další požadavky do dávky")
+    parser.add_argument("--tournament-timeout", type=float, default=DEFAULT_TOURNAMENT_TIMEOUT,
+                        help="časový limit turnaje (s), pokud ho klient nezadá")
+    parser.add_argument("--max-tournament-timeout", type=float, default=MAX_TOURNAMENT_TIMEOUT,
+                        help="nejdelší časový limit turnaje (s), který může klient požadovat")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """Vstupní bod serveru.
+
+    Returns:
+        int: Návratový kód procesu.
+    """
+    args = parse_args(argv)
+    try:
+        server = SimulationServer(args.host, args.port, args.workers, args.max_concurrency,
+                                  args.batch_size, args.batch_delay,
+                                  tournament_timeout=args.tournament_timeout,
+                                  max_tournament_timeout=args.max_tournament_timeout)
+    except ValueError as e:
+        print(f"Chyba: {e}", file=sys.stderr)
+        return 2
+
+    async def run():
+        await server.start()
+        print(f"Server naslouchá na http://{server.host}:{server.port}")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
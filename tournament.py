@@ -4,8 +4,11 @@ Demonstruje abstraktní dědičnost (ABC - Abstract Base Classes):
 - BaseTournament - abstraktní bázová třída
 - RoundRobinTournament - konkrétní implementace round-robin turnaje
 - EliminationTournament - konkrétní implementace eliminačního turnaje
+- LadderTournament - žebříček s průběžně přicházejícími hráči
+- GroupKnockoutTournament - skupiny hrané souběžně na vláknech + vyřazovací fáze
 - TournamentPrinter - pomocná třída pro výstupní zprávy
 - TournamentFactory - tovární třída pro vytváření turnajů
+- RetentionPolicy - politika uchovávání odehraných zápasů v paměti
 
 Výhody tohoto přístupu:
 - Čistější oddělení kódu dle typu turnaje
@@ -16,12 +19,24 @@ Výhody tohoto přístupu:
 - Factory pattern pro snadné vytváření instancí
 """
 
+import asyncio
 import datetime
+import hashlib
 import math
+import random
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Tuple
-from game import Player, Match
-from files import jsonfile_write
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from typing import List, Optional, Dict, Tuple, Iterator, AsyncIterator
+from game import Player, Match, PlayerStats, StatsContext
+from cancellation import CancellationToken
+from files import jsonfile_write, jsonfile_write_async, csvfile_write
+from tournament_stats import OnlineStatistics, HeadToHeadMatrix
+from matchmaking import Matchmaker
+from profiling import CpuProfiler, profile_worker
+from events import (TournamentStarted, RoundStarted, MatchPlayed, Bye, Elimination,
+                    StandingsSnapshot, GroupFinished, TournamentCancelled, TournamentWon)
 
 
 class TournamentPrinter:
@@ -134,35 +149,81 @@ class TournamentPrinter:
         print()
 
     @staticmethod
-    def print_current_standings(standings: List[Tuple], max_display: int = 5):
+    def print_cancelled(reason: str, matches_played: int, standings: List[Tuple],
+                        stats: Optional[StatsContext] = None):
+        """Vytiskne informaci o přerušení turnaje a dosavadní pořadí.
+
+        Args:
+            reason (str): Důvod přerušení.
+            matches_played (int): Počet odehraných zápasů.
+            standings (List[Tuple]): Seznam tuple (hráč, výhry, skóre_rozdíl).
+            stats (Optional[StatsContext]): Statistiky hráčů v turnaji.
+        """
+        print()
+        TournamentPrinter.print_separator()
+        print(f"TURNAJ PRERUSEN: {reason}")
+        print(f"Odehráno zápasů: {matches_played}")
+        TournamentPrinter.print_current_standings(standings, stats=stats)
+        TournamentPrinter.print_separator()
+        print()
+
+    @staticmethod
+    def _player_stats(player: Player, stats: Optional[StatsContext]) -> PlayerStats:
+        """Vrací statistiky hráče z kontextu turnaje (bez kontextu vlastní statistiky hráče)."""
+        return player.stats if stats is None else stats[player]
+
+    @staticmethod
+    def print_current_standings(standings: List[Tuple], max_display: int = 5,
+                                stats: Optional[StatsContext] = None):
         """Vytiskne průběžné pořadí.
         
         Args:
             standings (List[Tuple]): Seznam tuple (hráč, výhry, skóre_rozdíl).
             max_display (int): Maximální počet zobrazených hráčů.
+            stats (Optional[StatsContext]): Statistiky hráčů v turnaji.
         """
         for idx, (player, wins, score_diff) in enumerate(standings[:max_display], 1):
+            score = TournamentPrinter._player_stats(player, stats).score
             print(f"  {idx}. {player.nickname}: {wins} výher, "
-                  f"skóre +{player.score['plus']} -{player.score['minus']}")
+                  f"skóre +{score['plus']} -{score['minus']}")
 
     @staticmethod
-    def print_round_standings(round_num: int, standings: List[Tuple]):
+    def print_round_standings(round_num: int, standings: List[Tuple],
+                              stats: Optional[StatsContext] = None):
         """Vytiskne stav po kole.
         
         Args:
             round_num (int): Číslo kola.
             standings (List[Tuple]): Seznam tuple (hráč, výhry, skóre_rozdíl).
+            stats (Optional[StatsContext]): Statistiky hráčů v turnaji.
         """
         print(f"\n{'-'*70}")
         print(f"Stav po kole {round_num}:")
-        TournamentPrinter.print_current_standings(standings)
+        TournamentPrinter.print_current_standings(standings, stats=stats)
+
+    @staticmethod
+    def print_group_standings(group: str, standings: List[Tuple], qualified: List[Player],
+                              stats: Optional[StatsContext] = None):
+        """Vytiskne konečné pořadí skupiny a postupující hráče.
+
+        Args:
+            group (str): Název skupiny.
+            standings (List[Tuple]): Seznam tuple (hráč, výhry, skóre_rozdíl).
+            qualified (List[Player]): Hráči postupující do vyřazovací fáze.
+            stats (Optional[StatsContext]): Statistiky hráčů v turnaji.
+        """
+        print(f"\n{'-'*70}")
+        print(f"Skupina {group}:")
+        TournamentPrinter.print_current_standings(standings, max_display=len(standings), stats=stats)
+        print(f"  Postupují: {', '.join(p.nickname for p in qualified)}")
 
     @staticmethod
-    def print_final_standings(standings: List[Tuple]):
+    def print_final_standings(standings: List[Tuple], stats: Optional[StatsContext] = None):
         """Vytiskne konečné pořadí.
         
         Args:
             standings (List[Tuple]): Seznam tuple (hráč, výhry, skóre_rozdíl).
+            stats (Optional[StatsContext]): Statistiky hráčů v turnaji.
         """
         print()
         TournamentPrinter.print_separator(80)
@@ -173,10 +234,11 @@ class TournamentPrinter:
         print('-' * 80)
 
         for idx, (player, wins, score_diff) in enumerate(standings, 1):
-            score_str = f"+{player.score['plus']} -{player.score['minus']}"
-            win_rate = player.win_rate()
+            player_stats = TournamentPrinter._player_stats(player, stats)
+            score_str = f"+{player_stats.score['plus']} -{player_stats.score['minus']}"
+            win_rate = player_stats.win_rate()
             print(f"{idx:<6} {player.nickname:<20} {player.state:<10} {wins:<8} "
-                  f"{player.count_of_games:<8} {score_str:<15} {win_rate}%")
+                  f"{player_stats.count_of_games:<8} {score_str:<15} {win_rate}%")
 
         TournamentPrinter.print_separator(80)
         print()
@@ -190,6 +252,36 @@ class TournamentPrinter:
         """
         print(f"✓ Detailní výsledky turnaje uloženy do '{filename}'")
 
+    @staticmethod
+    def print_event(event):
+        """Vytiskne událost turnaje (viz modul `events`).
+
+        Args:
+            event: Událost z `BaseTournament.iter_events()`.
+        """
+        if isinstance(event, TournamentStarted):
+            TournamentPrinter.print_tournament_header(event.title, event.location, event.num_players)
+        elif isinstance(event, RoundStarted):
+            TournamentPrinter.print_round_header(event.round_name)
+        elif isinstance(event, MatchPlayed):
+            TournamentPrinter.print_match_info(event.player1.nickname, event.player2.nickname)
+            TournamentPrinter.print_match_result(
+                event.player1.nickname, event.player2.nickname,
+                event.score[0], event.score[1], event.winner.nickname
+            )
+        elif isinstance(event, Elimination):
+            TournamentPrinter.print_elimination_result(event.winner.nickname, event.loser.nickname)
+        elif isinstance(event, Bye):
+            TournamentPrinter.print_bye_info(event.player.nickname)
+        elif isinstance(event, StandingsSnapshot):
+            TournamentPrinter.print_round_standings(event.round_num, event.standings, event.stats)
+        elif isinstance(event, GroupFinished):
+            TournamentPrinter.print_group_standings(event.group, event.standings, event.qualified, event.stats)
+        elif isinstance(event, TournamentWon):
+            TournamentPrinter.print_winner(event.winner.nickname, event.stats)
+        elif isinstance(event, TournamentCancelled):
+            TournamentPrinter.print_cancelled(event.reason, event.matches_played, event.standings, event.stats)
+
 
 class TournamentFactory:
     """Tovární třída pro vytváření instancí turnajů.
@@ -200,15 +292,18 @@ class TournamentFactory:
 
     @staticmethod
     def create(tournament_type: str, players: List[Player], location: str,
-               winning_score: int = 10, max_dice_value: int = 6) -> 'BaseTournament':
+               winning_score: int = 10, max_dice_value: int = 6, **options) -> 'BaseTournament':
         """Vytvoří instanci turnaje podle typu.
         
         Args:
-            tournament_type (str): Typ turnaje ("round_robin" nebo "elimination").
+            tournament_type (str): Typ turnaje ("round_robin", "elimination", "ladder"
+                nebo "group_knockout").
             players (List[Player]): Seznam hráčů.
             location (str): Místo konání turnaje.
             winning_score (int): Počet bodů k vítězství v zápase.
             max_dice_value (int): Maximální hodnota kostky.
+            **options: Další parametry konstruktoru turnaje (např. `retention`, `seed`,
+                `pair_cache` pro round-robin).
             
         Returns:
             BaseTournament: Instance konkrétního typu turnaje.
@@ -224,13 +319,17 @@ class TournamentFactory:
         tournament_type = tournament_type.lower().strip()
         
         if tournament_type == "round_robin":
-            return RoundRobinTournament(players, location, winning_score, max_dice_value)
+            return RoundRobinTournament(players, location, winning_score, max_dice_value, **options)
         elif tournament_type == "elimination":
-            return EliminationTournament(players, location, winning_score, max_dice_value)
+            return EliminationTournament(players, location, winning_score, max_dice_value, **options)
+        elif tournament_type == "ladder":
+            return LadderTournament(players, location, winning_score, max_dice_value, **options)
+        elif tournament_type == "group_knockout":
+            return GroupKnockoutTournament(players, location, winning_score, max_dice_value, **options)
         else:
             raise ValueError(
                 f"Neznámý typ turnaje: '{tournament_type}'. "
-                f"Podporované typy: 'round_robin', 'elimination'"
+                f"Podporované typy: 'round_robin', 'elimination', 'ladder', 'group_knockout'"
             )
 
     @staticmethod
@@ -240,7 +339,110 @@ class TournamentFactory:
         Returns:
             List[str]: Seznam názvů typů turnajů.
         """
-        return ["round_robin", "elimination"]
+        return ["round_robin", "elimination", "ladder", "group_knockout"]
+
+
+class RetentionPolicy:
+    """Politika uchovávání odehraných zápasů (`matches`, `_detailed_results`).
+
+    Pořadí ani statistiky turnaje na ní nezávisí - počítají se průběžně
+    (viz `Player` a `OnlineStatistics`). Ovlivňuje jen to, které zápasy
+    zůstanou v paměti a ve výsledkovém souboru.
+
+    Režimy (textový zápis pro `parse`):
+        - "all" - ponechá všechny zápasy (výchozí)
+        - "last:K" - ponechá zápasy posledních K kol (žebříček nemá kola,
+          ponechá posledních K zápasů)
+        - "sample:F" - ponechá náhodný podíl F (0-1) zápasů, výběr je určen seedem zápasu
+        - "none" - neponechá žádný zápas, jen souhrnné statistiky
+    """
+
+    MODES = ("all", "last", "sample", "none")
+
+    # Rozsah, do kterého se promítá seed zápasu při výběru vzorku
+    SAMPLE_RESOLUTION = 1 << 32
+
+    def __init__(self, mode: str = "all", value: Optional[float] = None):
+        """Inicializuje politiku.
+
+        Args:
+            mode (str): Režim ("all", "last", "sample", "none").
+            value (Optional[float]): Počet kol (pro "last") nebo podíl zápasů (pro "sample").
+
+        Raises:
+            ValueError: Pokud je režim neznámý nebo hodnota mimo rozsah.
+        """
+        if mode not in self.MODES:
+            raise ValueError(
+                f"Neznámá politika uchovávání: '{mode}'. "
+                f"Podporované režimy: {', '.join(self.MODES)}"
+            )
+        if mode == "last" and (not isinstance(value, int) or value < 1):
+            raise ValueError("Počet uchovávaných kol musí být celé číslo alespoň 1.")
+        if mode == "sample" and (value is None or not 0 < value <= 1):
+            raise ValueError("Podíl uchovávaných zápasů musí být v rozmezí (0, 1].")
+
+        self.mode = mode
+        self.value = value
+
+    def __str__(self):
+        """Vrací textový zápis politiky (viz `parse`)."""
+        return self.mode if self.value is None else f"{self.mode}:{self.value}"
+
+    @classmethod
+    def parse(cls, spec) -> 'RetentionPolicy':
+        """Vytvoří politiku z textového zápisu.
+
+        Args:
+            spec: Textový zápis ("all", "last:3", "sample:0.1", "none"),
+                hotová politika, nebo None (= "all").
+
+        Returns:
+            RetentionPolicy: Politika uchovávání.
+
+        Raises:
+            ValueError: Pokud zápis není platný.
+        """
+        if spec is None:
+            return cls()
+        if isinstance(spec, cls):
+            return spec
+
+        mode, _, value = str(spec).strip().lower().partition(':')
+        if not value:
+            return cls(mode)
+        try:
+            return cls(mode, int(value) if mode == "last" else float(value))
+        except ValueError:
+            raise ValueError(f"Neplatná politika uchovávání: '{spec}'.")
+
+    def keeps(self, match: Match) -> bool:
+        """Rozhodne, zda se má odehraný zápas uchovat.
+
+        Args:
+            match (Match): Odehraný zápas.
+
+        Returns:
+            bool: True, pokud se zápas uchová.
+        """
+        if self.mode == "none":
+            return False
+        if self.mode == "sample":
+            return match.seed % self.SAMPLE_RESOLUTION < self.value * self.SAMPLE_RESOLUTION
+        return True
+
+    def oldest_round(self, round_num: int) -> Optional[int]:
+        """Vrací nejstarší kolo, které se má držet po začátku kola `round_num`.
+
+        Args:
+            round_num (int): Číslo právě začínajícího kola.
+
+        Returns:
+            Optional[int]: Číslo kola, nebo None, pokud se podle kol neprořezává.
+        """
+        if self.mode != "last":
+            return None
+        return round_num - self.value + 1
 
 
 class BaseTournament(ABC):
@@ -251,7 +453,8 @@ class BaseTournament(ABC):
     """
 
     def __init__(self, players: List[Player], location: str,
-                 winning_score: int = 10, max_dice_value: int = 6):
+                 winning_score: int = 10, max_dice_value: int = 6, retention=None,
+                 seed: Optional[int] = None):
         """Inicializuje základní data turnaje.
 
         Args:
@@ -259,9 +462,13 @@ class BaseTournament(ABC):
             location (str): Místo konání turnaje.
             winning_score (int): Počet bodů k vítězství v jednom zápase (výchozí: 10).
             max_dice_value (int): Maximální hodnota kostky (výchozí: 6).
+            retention: Politika uchovávání zápasů (`RetentionPolicy` nebo její
+                textový zápis, výchozí: "all").
+            seed (Optional[int]): Seed turnaje. Je-li zadán, seed každého zápasu
+                se odvodí ze seedu turnaje a přezdívek hráčů (viz `_match_seed`).
 
         Raises:
-            ValueError: Pokud je málo hráčů nebo chybí místo konání.
+            ValueError: Pokud je málo hráčů, chybí místo konání nebo je neplatná politika.
         """
         if len(players) < 2:
             raise ValueError("Turnaj vyžaduje alespoň 2 hráče.")
@@ -273,10 +480,17 @@ class BaseTournament(ABC):
         self.location = location.strip()
         self.winning_score = winning_score
         self.max_dice_value = max_dice_value
+        self.seed = seed
+        self.stats = StatsContext()
         self._datetime = datetime.datetime.now()
-        self.matches: List[Match] = []
+        self.retention = RetentionPolicy.parse(retention)
+        self.matches: deque = deque()
         self.winner: Optional[Player] = None
-        self._detailed_results: List[Dict] = []
+        self._detailed_results: deque = deque()
+        self.match_stats = OnlineStatistics()
+        # Důvod přerušení turnaje (None = nepřerušen) a token právě probíhající simulace
+        self.cancelled: Optional[str] = None
+        self._cancel: Optional[CancellationToken] = None
 
     def __str__(self):
         """Vrací textovou reprezentaci turnaje."""
@@ -284,19 +498,191 @@ class BaseTournament(ABC):
         tournament_type = self.__class__.__name__
         return f"{tournament_type} v {self.location}: {player_names}"
 
-    @abstractmethod
-    def play(self):
-        """Abstraktní metoda pro odehrání turnaje.
+    def play(self, cancel: Optional[CancellationToken] = None, timeout: Optional[float] = None,
+             profile: Optional[str] = None) -> bool:
+        """Odehraje celý turnaj a průběžně vypisuje jeho události na konzoli.
+
+        Args:
+            cancel (Optional[CancellationToken]): Token pro zrušení simulace.
+            timeout (Optional[float]): Časový limit v sekundách (viz `iter_events`).
+            profile (Optional[str]): Cesta souboru .pstats - turnaj se odehraje
+                pod `cProfile` a vedle profilu se uloží sbalené zásobníky (.folded).
 
-        Musí být implementována v podtřídách.
+        Returns:
+            bool: True, pokud turnaj doběhl; False, pokud byl přerušen (pořadí
+                a statistiky pak obsahují odehranou část turnaje).
         """
-        pass
+        if profile is not None:
+            with CpuProfiler(profile):
+                return self.play(cancel, timeout)
+
+        for event in self.iter_events(cancel, timeout):
+            TournamentPrinter.print_event(event)
+        return self.cancelled is None
+
+    def iter_events(self, cancel: Optional[CancellationToken] = None,
+                    timeout: Optional[float] = None) -> Iterator:
+        """Odehrává turnaj postupně a vrací jeho události.
+
+        Další zápas se odehraje, až si konzument vyžádá další událost.
+        Na začátku každého kola se podle politiky uchovávání zahodí
+        zápasy, které už se držet nemají.
+
+        Zrušení tokenu (nebo vypršení limitu) se kontroluje po každé události,
+        tedy na hranicích zápasů a kol. Přerušený turnaj už další zápasy
+        nehraje - jako poslední vrátí událost `TournamentCancelled`. Po
+        události `TournamentWon` je turnaj dohraný a token se už nekontroluje.
+
+        Args:
+            cancel (Optional[CancellationToken]): Token pro zrušení simulace.
+            timeout (Optional[float]): Časový limit v sekundách (vytvoří token,
+                pokud není předán).
+
+        Yields:
+            Událost z modulu `events` (začátek kola, zápas, volný los, ...).
+        """
+        if cancel is None and timeout is not None:
+            cancel = CancellationToken(timeout)
+        self._cancel = cancel
+
+        events = self._generate_events()
+        try:
+            if cancel is None:
+                for event in events:
+                    if isinstance(event, RoundStarted):
+                        self._prune_rounds(event.round_num)
+                    yield event
+                return
+
+            finished = False
+            while finished or not cancel.cancelled:
+                event = next(events, None)
+                if event is None:
+                    return
+                if isinstance(event, RoundStarted):
+                    self._prune_rounds(event.round_num)
+                finished = isinstance(event, TournamentWon)
+                cancel.observe(event)
+                yield event
+        finally:
+            events.close()
+            self._cancel = None
+
+        self.cancelled = cancel.reason
+        yield TournamentCancelled(cancel.reason, self.match_stats.count, self.get_standings(),
+                                  self.match_stats.to_dict(), self.stats)
+
+    def _prune_rounds(self, round_num: int):
+        """Zahodí uchované zápasy kol starších, než dovoluje politika uchovávání.
+
+        Args:
+            round_num (int): Číslo právě začínajícího kola.
+        """
+        oldest = self.retention.oldest_round(round_num)
+        if oldest is None:
+            return
+        while self._detailed_results and self._detailed_results[0]["round"] < oldest:
+            self._detailed_results.popleft()
+            self.matches.popleft()
+
+    async def iter_events_async(self, cancel: Optional[CancellationToken] = None,
+                                timeout: Optional[float] = None) -> AsyncIterator:
+        """Asynchronní varianta `iter_events`.
+
+        Po každé události předá řízení smyčce událostí, aby simulace
+        neblokovala ostatní úlohy.
+
+        Args:
+            cancel (Optional[CancellationToken]): Token pro zrušení simulace.
+            timeout (Optional[float]): Časový limit v sekundách.
+
+        Yields:
+            Událost z modulu `events`.
+        """
+        for event in self.iter_events(cancel, timeout):
+            yield event
+            await asyncio.sleep(0)
 
     @abstractmethod
-    def _print_tournament_header(self):
-        """Abstraktní metoda pro tisk záhlaví turnaje."""
+    def _generate_events(self) -> Iterator:
+        """Abstraktní generátor událostí turnaje.
+
+        Musí být implementován v podtřídách.
+
+        Yields:
+            Událost z modulu `events`.
+        """
         pass
 
+    def _match_seed(self, player1: Player, player2: Player) -> Optional[int]:
+        """Odvodí seed zápasu dvojice ze seedu turnaje.
+
+        Seed nezávisí na pořadí hráčů, zbytku soupisky ani na rozpisu, takže
+        stejná dvojice má ve stejně seedovaném turnaji vždy stejný zápas.
+
+        Args:
+            player1 (Player): První hráč.
+            player2 (Player): Druhý hráč.
+
+        Returns:
+            Optional[int]: 64bitový seed, nebo None pro neseedovaný turnaj.
+        """
+        if self.seed is None:
+            return None
+        first, second = sorted((player1.nickname, player2.nickname))
+        digest = hashlib.blake2b(f"{self.seed}\0{first}\0{second}".encode('utf-8'), digest_size=8)
+        return int.from_bytes(digest.digest(), 'little')
+
+    def _record_match(self, round_num: int, match: Match, match_type: str,
+                      round_name: Optional[str] = None) -> MatchPlayed:
+        """Zaznamená odehraný zápas a vrátí odpovídající událost.
+
+        Zápas se vždy započte do statistik, do `matches` a `_detailed_results`
+        se uloží jen tehdy, pokud ho ponechává politika uchovávání.
+
+        Args:
+            round_num (int): Číslo kola.
+            match (Match): Odehraný zápas.
+            match_type (str): Typ zápasu ("round_robin", "elimination").
+            round_name (Optional[str]): Název kola (jen eliminace).
+
+        Returns:
+            MatchPlayed: Událost se záznamem zápasu.
+        """
+        player1, player2 = match.h_player, match.g_player
+        score = match.score()
+        winner = player1 if score[0] > score[1] else player2
+
+        record = {"round": round_num}
+        if round_name is not None:
+            record["round_name"] = round_name
+        record.update({
+            "match_type": match_type,
+            "player1": {
+                "nickname": player1.nickname,
+                "state": player1.state
+            },
+            "player2": {
+                "nickname": player2.nickname,
+                "state": player2.state
+            },
+            "final_score": {
+                "player1": score[0],
+                "player2": score[1]
+            },
+            "winner": winner.nickname
+        })
+        if match_type == "elimination":
+            record["eliminated"] = (player2 if winner == player1 else player1).nickname
+        record["seed"] = match.seed
+        record["match_duration"] = score[0] + score[1]
+        self.match_stats.add_match(round_num, score)
+        if self.retention.keeps(match):
+            self.matches.append(match)
+            self._detailed_results.append(record)
+
+        return MatchPlayed(round_num, player1, player2, score, winner, record)
+
     def get_standings(self) -> List[Tuple[Player, int, int]]:
         """Vrací pořadí hráčů v turnaji.
 
@@ -305,8 +691,9 @@ class BaseTournament(ABC):
         """
         standings = []
         for player in self.players:
-            score_diff = player.score['plus'] - player.score['minus']
-            standings.append((player, player.wins, score_diff))
+            player_stats = self.stats[player]
+            score_diff = player_stats.score['plus'] - player_stats.score['minus']
+            standings.append((player, player_stats.wins, score_diff))
 
         standings.sort(key=lambda x: (x[1], x[2]), reverse=True)
         return standings
@@ -314,65 +701,183 @@ class BaseTournament(ABC):
     def print_standings(self):
         """Vytiskne tabulku s konečným pořadím hráčů."""
         standings = self.get_standings()
-        TournamentPrinter.print_final_standings(standings)
+        TournamentPrinter.print_final_standings(standings, self.stats)
+
+    def get_results(self) -> Dict:
+        """Sestaví detailní výsledky turnaje ve formátu výsledkového souboru.
+
+        Returns:
+            Dict: Slovník s informacemi o turnaji, hráčích, zápasech a pořadí.
+        """
+        return {
+            "tournament_info": {
+                "date": self._datetime.strftime("%Y-%m-%d %H:%M:%S"),
+                "location": self.location,
+                "type": self._get_tournament_type_name(),
+                "winning_score": self.winning_score,
+                "max_dice_value": self.max_dice_value,
+                "retention": str(self.retention),
+                "seed": self.seed,
+                "cancelled": self.cancelled
+            },
+            "players": [
+                {
+                    "nickname": p.nickname,
+                    "state": p.state,
+                    "gender": p.gender.value
+                }
+                for p in self.players
+            ],
+            "winner": {
+                "nickname": self.winner.nickname,
+                "state": self.winner.state,
+                "total_wins": self.stats[self.winner].wins,
+                "total_games": self.stats[self.winner].count_of_games,
+                "win_rate": self.stats[self.winner].win_rate()
+            } if self.winner else None,
+            "matches": [self._with_score_history(match) for match in self._detailed_results],
+            "final_standings": list(self._iter_standings_rows()),
+            "statistics": {
+                "total_matches": self.match_stats.count,
+                "retained_matches": len(self._detailed_results),
+                "total_rounds": self._get_total_rounds(),
+                "average_match_duration": self.match_stats.mean_duration,
+                **self.match_stats.to_dict()
+            }
+        }
+
+    def _with_score_history(self, match: Dict) -> Dict:
+        """Doplní záznam zápasu o historii skóre přehranou ze seedu.
+
+        Args:
+            match (Dict): Záznam z `_detailed_results`.
+
+        Returns:
+            Dict: Kopie záznamu s klíčem "score_history".
+        """
+        history = Match.replay_history(match["seed"], self.winning_score, self.max_dice_value)
+        return {**match, "score_history": history}
+
+    def _iter_standings_rows(self) -> Iterator[Dict]:
+        """Postupně vrací řádky konečného pořadí.
+
+        Yields:
+            Dict: Pozice, hráč a jeho statistiky.
+        """
+        for idx, (player, wins, _) in enumerate(self.get_standings(), 1):
+            player_stats = self.stats[player]
+            yield {
+                "position": idx,
+                "player": player.nickname,
+                "state": player.state,
+                "wins": wins,
+                "games": player_stats.count_of_games,
+                "score_plus": player_stats.score['plus'],
+                "score_minus": player_stats.score['minus'],
+                "score_difference": player_stats.score['plus'] - player_stats.score['minus'],
+                "win_rate": player_stats.win_rate()
+            }
+
+    def _iter_match_rows(self) -> Iterator[Dict]:
+        """Postupně vrací zápasy jako ploché řádky (pro CSV).
+
+        Yields:
+            Dict: Kolo, hráči, skóre a vítěz zápasu.
+        """
+        for match in self._detailed_results:
+            yield {
+                "round": match["round"],
+                "round_name": match.get("round_name", ""),
+                "match_type": match["match_type"],
+                "player1": match["player1"]["nickname"],
+                "player1_state": match["player1"]["state"],
+                "player2": match["player2"]["nickname"],
+                "player2_state": match["player2"]["state"],
+                "score1": match["final_score"]["player1"],
+                "score2": match["final_score"]["player2"],
+                "winner": match["winner"],
+                "match_duration": match["match_duration"]
+            }
+
+    def export_standings_csv(self, filename: str = "standings.csv") -> int:
+        """Exportuje konečné pořadí do CSV souboru.
+
+        Args:
+            filename (str): Název CSV souboru.
+
+        Returns:
+            int: Počet zapsaných řádků.
+
+        Raises:
+            IOError: Pokud došlo k chybě při zápisu.
+        """
+        try:
+            return csvfile_write(filename, self._iter_standings_rows())
+        except Exception as e:
+            raise IOError(f"Chyba při exportu pořadí: {e}")
+
+    def export_matches_csv(self, filename: str = "matches.csv") -> int:
+        """Exportuje výsledky jednotlivých zápasů do CSV souboru.
+
+        Args:
+            filename (str): Název CSV souboru.
+
+        Returns:
+            int: Počet zapsaných řádků.
+
+        Raises:
+            IOError: Pokud došlo k chybě při zápisu (nebo nebyl odehrán žádný zápas).
+        """
+        try:
+            return csvfile_write(filename, self._iter_match_rows())
+        except Exception as e:
+            raise IOError(f"Chyba při exportu zápasů: {e}")
 
-    def save_tournament_results(self, filename: str = "tournament_results.json"):
+    def save_tournament_results(self, filename: str = "tournament_results.json", database=None,
+                                compact: bool = False, leaderboard=None):
         """Uloží detailní výsledky turnaje do JSON souboru.
 
+        Zápis je atomický; název končící na `.gz` uloží soubor komprimovaný gzipem.
+
         Args:
             filename (str): Název souboru pro uložení (výchozí: tournament_results.json).
+            database (ResultsDatabase): Volitelné SQLite úložiště, kam se výsledky uloží také.
+            compact (bool): Uloží JSON bez mezer za oddělovači.
+            leaderboard (Leaderboard): Volitelný kariérní žebříček, do kterého se turnaj započte.
 
         Raises:
             IOError: Pokud došlo k chybě při ukládání.
         """
         try:
-            tournament_data = {
-                "tournament_info": {
-                    "date": self._datetime.strftime("%Y-%m-%d %H:%M:%S"),
-                    "location": self.location,
-                    "type": self._get_tournament_type_name(),
-                    "winning_score": self.winning_score,
-                    "max_dice_value": self.max_dice_value
-                },
-                "players": [
-                    {
-                        "nickname": p.nickname,
-                        "state": p.state,
-                        "gender": p.gender.value
-                    }
-                    for p in self.players
-                ],
-                "winner": {
-                    "nickname": self.winner.nickname,
-                    "state": self.winner.state,
-                    "total_wins": self.winner.wins,
-                    "total_games": self.winner.count_of_games,
-                    "win_rate": self.winner.win_rate()
-                } if self.winner else None,
-                "matches": self._detailed_results,
-                "final_standings": [
-                    {
-                        "position": idx,
-                        "player": player.nickname,
-                        "state": player.state,
-                        "wins": wins,
-                        "games": player.count_of_games,
-                        "score_plus": player.score['plus'],
-                        "score_minus": player.score['minus'],
-                        "score_difference": player.score['plus'] - player.score['minus'],
-                        "win_rate": player.win_rate()
-                    }
-                    for idx, (player, wins, _) in enumerate(self.get_standings(), 1)
-                ],
-                "statistics": {
-                    "total_matches": len(self.matches),
-                    "total_rounds": self._get_total_rounds(),
-                    "average_match_duration": sum(m['match_duration'] for m in self._detailed_results) / len(self._detailed_results)
-                                              if self._detailed_results else 0
-                }
-            }
+            results = self.get_results()
+            jsonfile_write(filename, results, compact=compact)
+            if database is not None:
+                database.save_tournament(results)
+            if leaderboard is not None:
+                leaderboard.record(results)
+            TournamentPrinter.print_save_confirmation(filename)
+        except Exception as e:
+            raise IOError(f"Chyba při ukládání výsledků turnaje: {e}")
+
+    async def save_tournament_results_async(self, filename: str = "tournament_results.json",
+                                            compact: bool = False):
+        """Asynchronní varianta `save_tournament_results`.
 
-            jsonfile_write(filename, tournament_data)
+        Výsledky se sestaví ve výchozím executoru smyčky (u velkých turnajů
+        se přehrává historie všech uchovaných zápasů) a zápis proběhne
+        v I/O poolu modulu `files`, takže nic z toho neblokuje smyčku událostí.
+        Turnaj se během ukládání nesmí dál hrát.
+
+        Args:
+            filename (str): Název souboru pro uložení.
+            compact (bool): Uloží JSON bez mezer za oddělovači.
+
+        Raises:
+            IOError: Pokud došlo k chybě při ukládání.
+        """
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(None, self.get_results)
+            await jsonfile_write_async(filename, results, compact=compact)
             TournamentPrinter.print_save_confirmation(filename)
         except Exception as e:
             raise IOError(f"Chyba při ukládání výsledků turnaje: {e}")
@@ -397,60 +902,111 @@ class BaseTournament(ABC):
 
 
 class RoundRobinTournament(BaseTournament):
-    """Třída pro turnaj formou 'každý s každým' organizovaný do kol."""
+    """Třída pro turnaj formou 'každý s každým' organizovaný do kol.
 
-    def play(self):
-        """Odehraje turnaj ve formátu každý s každým organizovaný do kol."""
-        self._print_tournament_header()
+    V seedovaném turnaji lze předat `PairResultCache` - zápasy dvojic, které
+    už v cache jsou, se nesimulují, jen se převezme jejich výsledek. Po změně
+    soupisky se tak znovu simulují jen zápasy nových hráčů.
+
+    Výsledky vzájemných zápasů se průběžně zapisují do `head_to_head`
+    (`HeadToHeadMatrix`). Při shodném počtu výher rozhodují o pořadí
+    vzájemné zápasy, pak Sonneborn-Bergerovo skóre a nakonec rozdíl skóre.
+    Matice má n² buněk a vytvoří se až se začátkem turnaje; s
+    `tie_breaks=False` se nevytvoří vůbec a pořadí určí jen výhry a rozdíl skóre.
+    """
+
+    def __init__(self, players: List[Player], location: str,
+                 winning_score: int = 10, max_dice_value: int = 6, retention=None,
+                 seed: Optional[int] = None, pair_cache=None, tie_breaks: bool = True):
+        """Inicializuje turnaj každý s každým.
+
+        Args:
+            players (List[Player]): Seznam hráčů.
+            location (str): Místo konání turnaje.
+            winning_score (int): Počet bodů k vítězství v jednom zápase.
+            max_dice_value (int): Maximální hodnota kostky.
+            retention: Politika uchovávání zápasů (viz `RetentionPolicy`).
+            seed (Optional[int]): Seed turnaje.
+            pair_cache (PairResultCache): Volitelná cache výsledků dvojic.
+            tie_breaks (bool): Rozhodovat shodu výher vzájemnými zápasy a
+                Sonneborn-Bergerovým skóre (vyžaduje matici `head_to_head`).
+
+        Raises:
+            ValueError: Pokud je cache zadána bez seedu turnaje nebo patří
+                k turnaji s jiným seedem či nastavením zápasu, nebo se počet
+                bodů k vítězství nevejde do matice vzájemných zápasů.
+        """
+        super().__init__(players, location, winning_score, max_dice_value, retention, seed)
+        if pair_cache is not None and seed is None:
+            raise ValueError("Cache dvojic lze použít jen v seedovaném turnaji.")
+        if pair_cache is not None and (
+                (pair_cache.seed, pair_cache.winning_score, pair_cache.max_dice_value)
+                != (self.seed, self.winning_score, self.max_dice_value)):
+            raise ValueError("Cache dvojic patří k turnaji s jiným seedem nebo nastavením zápasu.")
+        if tie_breaks:
+            HeadToHeadMatrix.typecode_for(winning_score)
+        self.pair_cache = pair_cache
+        self.tie_breaks = tie_breaks
+        self.head_to_head: Optional[HeadToHeadMatrix] = None
+
+    def _generate_events(self) -> Iterator:
+        """Odehrává turnaj ve formátu každý s každým organizovaný do kol."""
+        yield TournamentStarted("round_robin", "Každý s každým", self.location, len(self.players))
 
         schedule = self._generate_round_robin_schedule()
+        if self.tie_breaks:
+            self.head_to_head = HeadToHeadMatrix(self.players, self.winning_score)
 
         for round_num, round_matches in enumerate(schedule, 1):
-            TournamentPrinter.print_round_header(f"KOLO {round_num}")
+            yield RoundStarted(round_num, f"KOLO {round_num}")
 
             for player1, player2 in round_matches:
-                TournamentPrinter.print_match_info(player1.nickname, player2.nickname)
-                match = Match(player1, player2, self.winning_score, self.max_dice_value)
-                match.play()
-                self.matches.append(match)
-
-                score = match.score()
-                winner = player1 if score[0] > score[1] else player2
-                TournamentPrinter.print_match_result(
-                    player1.nickname, player2.nickname, score[0], score[1], winner.nickname
-                )
-
-                # Uložení detailních informací o zápasu
-                self._detailed_results.append({
-                    "round": round_num,
-                    "match_type": "round_robin",
-                    "player1": {
-                        "nickname": player1.nickname,
-                        "state": player1.state
-                    },
-                    "player2": {
-                        "nickname": player2.nickname,
-                        "state": player2.state
-                    },
-                    "final_score": {
-                        "player1": score[0],
-                        "player2": score[1]
-                    },
-                    "winner": winner.nickname,
-                    "score_history": match.get_history(),
-                    "match_duration": len(match.get_history())
-                })
-
-            # Mezivýsledky po každém kole
-            TournamentPrinter.print_round_standings(round_num, self.get_standings())
+                match = self._play_pair(player1, player2)
+                played = self._record_match(round_num, match, "round_robin")
+                if self.head_to_head is not None:
+                    self.head_to_head.record(played.player1, played.player2, played.score)
+                yield played
+
+            # Mezivýsledky po každém kole (bez pomocných kritérií)
+            yield StandingsSnapshot(round_num, super().get_standings(), self.stats)
 
         self._determine_winner()
+        winner_stats = self.stats[self.winner]
+        stats = f"Výhry: {winner_stats.wins}, Skóre: +{winner_stats.score['plus']} -{winner_stats.score['minus']}"
+        yield TournamentWon(self.winner, stats)
 
-    def _print_tournament_header(self):
-        """Vytiskne záhlaví pro turnaj 'každý s každým'."""
-        TournamentPrinter.print_tournament_header(
-            "Každý s každým", self.location, len(self.players)
-        )
+    def _play_pair(self, player1: Player, player2: Player) -> Match:
+        """Odehraje zápas dvojice (nebo převezme jeho výsledek z cache dvojic).
+
+        V seedovaném turnaji se domácí a hostující hráč určí ze seedu dvojice,
+        ne z rozpisu, aby byl zápas stejný při jakékoliv soupisce.
+
+        Args:
+            player1 (Player): Hráč na prvním místě v rozpisu.
+            player2 (Player): Hráč na druhém místě v rozpisu.
+
+        Returns:
+            Match: Odehraný zápas.
+        """
+        seed = self._match_seed(player1, player2)
+        if seed is None:
+            match = Match(player1, player2, self.winning_score, self.max_dice_value, stats=self.stats)
+            match.play()
+            return match
+
+        house, guest = sorted((player1, player2), key=lambda p: p.nickname)
+        if seed & 1:
+            house, guest = guest, house
+        match = Match(house, guest, self.winning_score, self.max_dice_value, seed, self.stats)
+
+        cached = self.pair_cache.get(house.nickname, guest.nickname) if self.pair_cache is not None else None
+        if cached is None:
+            match.play()
+            if self.pair_cache is not None:
+                self.pair_cache.put(house.nickname, guest.nickname, match.score())
+        else:
+            match.apply_result(*cached)
+        return match
 
     def _generate_round_robin_schedule(self) -> List[List[Tuple[Player, Player]]]:
         """Generuje rozvrh pro turnaj každý s každým rozdělený do kol.
@@ -489,19 +1045,41 @@ class RoundRobinTournament(BaseTournament):
 
         return rounds
 
-    def _determine_winner(self):
-        """Určí vítěze turnaje podle počtu výher."""
-        max_wins = max(player.wins for player in self.players)
-        winners = [player for player in self.players if player.wins == max_wins]
+    def get_standings(self) -> List[Tuple[Player, int, int]]:
+        """Vrací pořadí hráčů včetně pomocných kritérií.
 
-        if len(winners) == 1:
-            self.winner = winners[0]
-        else:
-            # Remíza - vybere hráče s lepším skóre
-            self.winner = max(winners, key=lambda p: p.score['plus'] - p.score['minus'])
+        Hráči se stejným počtem výher se seřadí podle výher ve vzájemných
+        zápasech, pak podle Sonneborn-Bergerova skóre a rozdílu skóre. Bez
+        matice vzájemných zápasů (`tie_breaks=False`) jen podle rozdílu skóre.
+
+        Returns:
+            List[Tuple[Player, int, int]]: Seznam tuple (hráč, výhry, skóre_rozdíl).
+        """
+        standings = super().get_standings()
+        if self.head_to_head is None:
+            return standings
+        wins = [self.stats[player].wins for player in self.head_to_head.players]
+
+        tie_breaks = {}
+        for _, group in groupby(standings, key=lambda x: x[1]):
+            tied = [player for player, _, _ in group]
+            if len(tied) > 1:
+                for player, h2h_wins in self.head_to_head.mini_league(tied).items():
+                    tie_breaks[player] = (h2h_wins, self.head_to_head.sonneborn_berger(player, wins))
+
+        standings.sort(key=lambda x: (x[1], *tie_breaks.get(x[0], (0, 0)), x[2]), reverse=True)
+        return standings
+
+    def _determine_winner(self):
+        """Určí vítěze turnaje - první hráč v pořadí (výhry, vzájemné zápasy, S-B, skóre)."""
+        self.winner = self.get_standings()[0][0]
 
-        stats = f"Výhry: {self.winner.wins}, Skóre: +{self.winner.score['plus']} -{self.winner.score['minus']}"
-        TournamentPrinter.print_winner(self.winner.nickname, stats)
+    def get_results(self) -> Dict:
+        """Sestaví výsledky turnaje doplněné o matici vzájemných zápasů (pokud se vede)."""
+        results = super().get_results()
+        if self.head_to_head is not None:
+            results["head_to_head"] = self.head_to_head.to_dict()
+        return results
 
     def _get_tournament_type_name(self) -> str:
         """Vrací název typu turnaje."""
@@ -516,15 +1094,15 @@ class RoundRobinTournament(BaseTournament):
 class EliminationTournament(BaseTournament):
     """Třída pro turnaj v eliminačním formátu (vyřazovací systém/pavouk)."""
 
-    def play(self):
-        """Odehraje turnaj v eliminačním formátu (pavouk).
+    def _generate_events(self) -> Iterator:
+        """Odehrává turnaj v eliminačním formátu (pavouk).
         
         Správně řeší strukturu pavouka pro libovolný počet hráčů:
         - Vypočítá počet hráčů s volným losem (bye)
         - Bye hráči postupují přímo do dalšího kola
         - Ostatní hrají první kolo
         """
-        self._print_tournament_header()
+        yield TournamentStarted("elimination", "Eliminační systém", self.location, len(self.players))
 
         remaining_players = self.players.copy()
         round_num = 1
@@ -537,12 +1115,12 @@ class EliminationTournament(BaseTournament):
         num_byes = self._calculate_byes(len(remaining_players))
         
         if num_byes > 0:
-            TournamentPrinter.print_round_header("VOLNÉ LOSY")
+            yield RoundStarted(0, "VOLNÉ LOSY")
             bye_players = remaining_players[:num_byes]
             playing_players = remaining_players[num_byes:]
             
             for bye_player in bye_players:
-                TournamentPrinter.print_bye_info(bye_player.nickname)
+                yield Bye(0, bye_player)
             
             remaining_players = playing_players
 
@@ -558,7 +1136,7 @@ class EliminationTournament(BaseTournament):
                 total_in_round = num_playing
             
             round_name = self._get_elimination_round_name(total_in_round)
-            TournamentPrinter.print_round_header(round_name)
+            yield RoundStarted(round_num, round_name)
             
             next_round_players = []
             
@@ -567,51 +1145,23 @@ class EliminationTournament(BaseTournament):
                 if i + 1 >= len(remaining_players):
                     # Lichý hráč - volný los v tomto kole
                     bye_player = remaining_players[i]
-                    TournamentPrinter.print_bye_info(bye_player.nickname)
+                    yield Bye(round_num, bye_player)
                     next_round_players.append(bye_player)
                     break
                 
                 player1 = remaining_players[i]
                 player2 = remaining_players[i + 1]
 
-                TournamentPrinter.print_match_info(player1.nickname, player2.nickname)
-                match = Match(player1, player2, self.winning_score, self.max_dice_value)
+                match = Match(player1, player2, self.winning_score, self.max_dice_value,
+                              self._match_seed(player1, player2), self.stats)
                 match.play()
-                self.matches.append(match)
-
-                score = match.score()
-                winner = player1 if score[0] > score[1] else player2
+                played = self._record_match(round_num, match, "elimination", round_name)
+                winner = played.winner
                 loser = player2 if winner == player1 else player1
-
-                TournamentPrinter.print_match_result(
-                    player1.nickname, player2.nickname, score[0], score[1], winner.nickname
-                )
-                TournamentPrinter.print_elimination_result(winner.nickname, loser.nickname)
+                yield played
+                yield Elimination(round_num, winner, loser)
 
                 next_round_players.append(winner)
-
-                # Uložení detailních informací o zápasu
-                self._detailed_results.append({
-                    "round": round_num,
-                    "round_name": round_name,
-                    "match_type": "elimination",
-                    "player1": {
-                        "nickname": player1.nickname,
-                        "state": player1.state
-                    },
-                    "player2": {
-                        "nickname": player2.nickname,
-                        "state": player2.state
-                    },
-                    "final_score": {
-                        "player1": score[0],
-                        "player2": score[1]
-                    },
-                    "winner": winner.nickname,
-                    "eliminated": loser.nickname,
-                    "score_history": match.get_history(),
-                    "match_duration": len(match.get_history())
-                })
             
             # Přidat bye hráče z prvního kola - PROKLÁDAT s vítězi
             if first_round and bye_players:
@@ -640,7 +1190,7 @@ class EliminationTournament(BaseTournament):
             # Fallback - vybrat prvního
             self.winner = remaining_players[0] if remaining_players else self.players[0]
         
-        TournamentPrinter.print_winner(self.winner.nickname)
+        yield TournamentWon(self.winner)
 
     def _calculate_byes(self, num_players: int) -> int:
         """Vypočítá počet hráčů s volným losem (bye) v prvním kole.
@@ -674,12 +1224,6 @@ class EliminationTournament(BaseTournament):
         
         return num_byes
 
-    def _print_tournament_header(self):
-        """Vytiskne záhlaví pro eliminační turnaj."""
-        TournamentPrinter.print_tournament_header(
-            "Eliminační systém", self.location, len(self.players)
-        )
-
     def _get_elimination_round_name(self, num_players: int) -> str:
         """Vrací název kola podle počtu zbývajících hráčů.
 
@@ -710,3 +1254,391 @@ class EliminationTournament(BaseTournament):
         # Počet kol = log₂(n) zaokrouhleno nahoru
         import math
         return math.ceil(math.log2(n)) if n > 0 else 0
+
+
+class LadderTournament(BaseTournament):
+    """Žebříček (online režim) s průběžně přicházejícími a odcházejícími hráči.
+
+    Hráči se řadí do fronty `Matchmaker` podle Elo ratingu. Jakmile se pro
+    příchozího hráče najde soupeř s blízkým ratingem, zápas se hned odehraje
+    a oba hráči frontu opouští (znovu se mohou přihlásit přes `join`).
+    Pořadí (`get_standings`) je k dispozici kdykoliv během turnaje.
+
+    `play()` / `iter_events()` odehrají ukázkovou session: všichni hráči ze
+    soupisky se přihlásí a po každém zápase se znovu zařadí, dokud nemají
+    `games_per_player` zápasů. Žebříček nemá kola - všechny zápasy jsou v kole 1
+    a politika "last:K" proto ponechá posledních K zápasů.
+    """
+
+    INITIAL_RATING = 1000.0
+    K_FACTOR = 32
+
+    def __init__(self, players: List[Player], location: str,
+                 winning_score: int = 10, max_dice_value: int = 6, retention=None,
+                 seed: Optional[int] = None, games_per_player: int = 3,
+                 bucket_width: float = 50, max_gap: float = 200):
+        """Inicializuje žebříček.
+
+        Args:
+            players (List[Player]): Počáteční soupiska.
+            location (str): Místo konání turnaje.
+            winning_score (int): Počet bodů k vítězství v jednom zápase.
+            max_dice_value (int): Maximální hodnota kostky.
+            retention: Politika uchovávání zápasů (viz `RetentionPolicy`).
+            seed (Optional[int]): Seed turnaje (seedy zápasů se losují z něj).
+            games_per_player (int): Počet zápasů hráče v ukázkové session `play()`.
+            bucket_width (float): Šířka přihrádky ratingu ve frontě.
+            max_gap (float): Maximální rozdíl ratingů spárovaných hráčů.
+
+        Raises:
+            ValueError: Pokud jsou parametry neplatné.
+        """
+        super().__init__(players, location, winning_score, max_dice_value, retention, seed)
+        if games_per_player < 1:
+            raise ValueError("Počet zápasů hráče musí být alespoň 1.")
+
+        self.players = list(players)
+        self.games_per_player = games_per_player
+        self.matchmaker = Matchmaker(bucket_width, max_gap)
+        self.ratings: Dict[Player, float] = {}
+        self._registered = set(self.players)
+        self._rng = random.Random(seed) if seed is not None else None
+
+    def rating(self, player: Player) -> float:
+        """Vrací aktuální rating hráče."""
+        return self.ratings.get(player, self.INITIAL_RATING)
+
+    def join(self, player: Player) -> Optional[MatchPlayed]:
+        """Přihlásí hráče do fronty; při nalezení soupeře hned odehraje zápas.
+
+        Args:
+            player (Player): Příchozí hráč (nový hráč se přidá na soupisku).
+
+        Returns:
+            Optional[MatchPlayed]: Událost odehraného zápasu, nebo None, pokud hráč čeká.
+
+        Raises:
+            ValueError: Pokud hráč už ve frontě čeká.
+        """
+        if player not in self._registered:
+            self._registered.add(player)
+            self.players.append(player)
+
+        opponent = self.matchmaker.add(player, self.rating(player))
+        if opponent is None:
+            return None
+
+        # Domácím hráčem je ten, kdo čekal ve frontě
+        seed = self._rng.getrandbits(64) if self._rng is not None else None
+        match = Match(opponent, player, self.winning_score, self.max_dice_value, seed, self.stats)
+        match.play()
+        played = self._record_match(1, match, "ladder")
+        played.record["ratings"] = self._update_ratings(opponent, player, played.winner is opponent)
+        self._prune_matches()
+        return played
+
+    def _prune_matches(self):
+        """Zahodí uchované zápasy nad okno politiky "last:K".
+
+        Všechny zápasy žebříčku jsou v kole 1, okno se proto počítá
+        v zápasech, ne v kolech.
+        """
+        if self.retention.mode != "last":
+            return
+        while len(self.matches) > self.retention.value:
+            self._detailed_results.popleft()
+            self.matches.popleft()
+
+    def leave(self, player: Player) -> bool:
+        """Odhlásí čekajícího hráče z fronty.
+
+        Args:
+            player (Player): Hráč.
+
+        Returns:
+            bool: True, pokud hráč ve frontě čekal.
+        """
+        return self.matchmaker.remove(player)
+
+    def _update_ratings(self, house: Player, guest: Player, house_won: bool) -> Dict[str, float]:
+        """Aktualizuje Elo ratingy hráčů po zápase.
+
+        Returns:
+            Dict[str, float]: Nové ratingy obou hráčů podle přezdívky.
+        """
+        house_rating, guest_rating = self.rating(house), self.rating(guest)
+        expected = 1 / (1 + 10 ** ((guest_rating - house_rating) / 400))
+        change = self.K_FACTOR * ((1.0 if house_won else 0.0) - expected)
+        self.ratings[house] = house_rating + change
+        self.ratings[guest] = guest_rating - change
+        return {house.nickname: round(self.ratings[house], 2), guest.nickname: round(self.ratings[guest], 2)}
+
+    def get_standings(self) -> List[Tuple[Player, int, int]]:
+        """Vrací aktuální pořadí žebříčku (podle ratingu, pak výher a skóre).
+
+        Returns:
+            List[Tuple[Player, int, int]]: Seznam tuple (hráč, výhry, skóre_rozdíl).
+        """
+        standings = super().get_standings()
+        standings.sort(key=lambda x: (self.rating(x[0]), x[1], x[2]), reverse=True)
+        return standings
+
+    def get_results(self) -> Dict:
+        """Sestaví výsledky turnaje doplněné o konečné ratingy hráčů."""
+        results = super().get_results()
+        results["ratings"] = {
+            player.nickname: round(self.rating(player), 2) for player, _, _ in self.get_standings()
+        }
+        return results
+
+    def _generate_events(self) -> Iterator:
+        """Odehraje ukázkovou session žebříčku nad soupiskou."""
+        yield TournamentStarted("ladder", "Žebříček", self.location, len(self.players))
+
+        arrivals = deque(self.players)
+        while arrivals:
+            played = self.join(arrivals.popleft())
+            if played is None:
+                continue
+            yield played
+            for player in (played.player1, played.player2):
+                if self.stats[player].count_of_games < self.games_per_player:
+                    arrivals.append(player)
+
+        # Konec session - kdo nenašel soupeře, odchází
+        self.matchmaker.clear()
+        self._determine_winner()
+        winner_stats = self.stats[self.winner]
+        yield TournamentWon(
+            self.winner,
+            f"Rating: {self.rating(self.winner):.0f}, Výhry: {winner_stats.wins}, "
+            f"Zápasy: {winner_stats.count_of_games}"
+        )
+
+    def _determine_winner(self):
+        """Určí vítěze žebříčku (první v aktuálním pořadí)."""
+        self.winner = self.get_standings()[0][0]
+
+    def _get_tournament_type_name(self) -> str:
+        """Vrací název typu turnaje."""
+        return "ladder"
+
+    def _get_total_rounds(self) -> int:
+        """Žebříček nemá kola - všechny zápasy patří do kola 1."""
+        return 1
+
+
+class GroupKnockoutTournament(BaseTournament):
+    """Turnaj se skupinami (každý s každým) a vyřazovací fází.
+
+    Hráči se rozdělí do skupin postupně podle pořadí na soupisce (1. hráč do
+    skupiny A, 2. do B, ...). Skupiny se odehrají souběžně na pracovních
+    vláknech - každá jako `RoundRobinTournament` s vlastním seedem. Simulace
+    je čistě pythonová a vázaná na CPU, vlákna ji kvůli GIL nezrychlí;
+    souběh slouží jen ke společnému rušení (token) a sdílení kontextu
+    statistik. Všechny skupiny zapisují do kontextu statistik tohoto
+    turnaje; jejich hráči se nepřekrývají, takže to nevyžaduje zámky.
+    Seedy skupin i pavouka se určí na volajícím vlákně ještě před
+    spuštěním skupin (v neseedovaném turnaji z globálního `random`), vlákna
+    tak nesdílí globální generátor a výsledek závisí jen na `random.seed`. Prvních `advance` hráčů každé
+    skupiny (podle `get_standings`) postupuje do nasazeného pavouka, který
+    odehraje `EliminationTournament`.
+
+    Kola vyřazovací fáze navazují na kola skupin, všechny zápasy jsou tak
+    v jednom výsledkovém souboru s jednoznačným číslem kola. Zápasy skupin
+    mají v záznamu navíc klíč "group".
+    """
+
+    def __init__(self, players: List[Player], location: str,
+                 winning_score: int = 10, max_dice_value: int = 6, retention=None,
+                 seed: Optional[int] = None, num_groups: int = 4, advance: int = 2,
+                 max_workers: Optional[int] = None):
+        """Inicializuje turnaj a rozdělí hráče do skupin.
+
+        Args:
+            players (List[Player]): Seznam hráčů (pořadí určuje rozdělení do skupin).
+            location (str): Místo konání turnaje.
+            winning_score (int): Počet bodů k vítězství v jednom zápase.
+            max_dice_value (int): Maximální hodnota kostky.
+            retention: Politika uchovávání zápasů (viz `RetentionPolicy`).
+            seed (Optional[int]): Seed turnaje (seedy skupin a pavouka se odvodí z něj).
+            num_groups (int): Počet skupin.
+            advance (int): Počet hráčů, kteří postupují z každé skupiny.
+            max_workers (Optional[int]): Počet vláken pro skupiny (None = výchozí).
+
+        Raises:
+            ValueError: Pokud se hráči nedají rozdělit do skupin nebo postup nedává smysl.
+        """
+        super().__init__(players, location, winning_score, max_dice_value, retention, seed)
+        if num_groups < 1 or len(players) < 2 * num_groups:
+            raise ValueError("Každá skupina musí mít alespoň 2 hráče.")
+        smallest = len(players) // num_groups
+        if not 1 <= advance <= smallest or advance * num_groups < 2:
+            raise ValueError(f"Z každé skupiny musí postupovat 1 až {smallest} hráčů "
+                             f"a do vyřazovací fáze alespoň 2 hráči.")
+
+        self.num_groups = num_groups
+        self.advance = advance
+        self.max_workers = max_workers
+        self.groups: Dict[str, List[Player]] = {}
+        for idx, player in enumerate(players):
+            self.groups.setdefault(self._group_name(idx % num_groups), []).append(player)
+        self.qualified: Dict[str, List[Player]] = {}
+        # Hráč -> číslo kola, ve kterém vypadl z vyřazovací fáze (vítěz má nejvyšší)
+        self._knockout_rounds: Dict[Player, int] = {}
+
+    @staticmethod
+    def _group_name(index: int) -> str:
+        """Vrací název skupiny (A, B, ..., po Z čísla)."""
+        return chr(ord('A') + index) if index < 26 else str(index + 1)
+
+    def _stage_seed(self, stage: str) -> int:
+        """Odvodí seed skupiny nebo pavouka ze seedu turnaje.
+
+        V neseedovaném turnaji se seed vylosuje z globálního `random` - volá
+        se proto jen na vlákně, které turnaj odehrává.
+
+        Args:
+            stage (str): Označení části turnaje (např. "group:A", "knockout").
+
+        Returns:
+            int: 64bitový seed.
+        """
+        if self.seed is None:
+            return random.getrandbits(64)
+        digest = hashlib.blake2b(f"{self.seed}\0{stage}".encode('utf-8'), digest_size=8)
+        return int.from_bytes(digest.digest(), 'little')
+
+    def _play_group(self, group: RoundRobinTournament) -> List[MatchPlayed]:
+        """Odehraje skupinu (na pracovním vlákně) a vrátí její zápasy."""
+        with profile_worker():
+            return [event for event in group.iter_events(self._cancel) if isinstance(event, MatchPlayed)]
+
+    @staticmethod
+    def _seed_bracket(seeds: List[Player], num_byes: int) -> List[Player]:
+        """Seřadí nasazené hráče do pavouka.
+
+        Nejvýše nasazení dostanou volný los, ostatní hrají první kolo
+        nejlepší proti nejhoršímu (2. proti předposlednímu, ...).
+
+        Args:
+            seeds (List[Player]): Hráči seřazení podle nasazení.
+            num_byes (int): Počet volných losů.
+
+        Returns:
+            List[Player]: Pořadí hráčů pro `EliminationTournament`.
+        """
+        bracket = seeds[:num_byes]
+        rest = seeds[num_byes:]
+        for i in range(len(rest) // 2):
+            bracket.extend((rest[i], rest[-1 - i]))
+        return bracket
+
+    def _generate_events(self) -> Iterator:
+        """Odehraje skupiny souběžně na vláknech a poté vyřazovací fázi."""
+        yield TournamentStarted("group_knockout", "Skupiny a vyřazovací fáze", self.location, len(self.players))
+
+        # Seedy všech částí turnaje se určí předem na tomto vlákně
+        knockout_seed = self._stage_seed("knockout")
+        groups = {}
+        for name, group_players in self.groups.items():
+            group = RoundRobinTournament(group_players, self.location, self.winning_score, self.max_dice_value,
+                                         self.retention, self._stage_seed(f"group:{name}"))
+            group.stats = self.stats
+            groups[name] = group
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            played = list(executor.map(self._play_group, groups.values()))
+
+        # Kolo N skupinové fáze = kolo N všech skupin
+        rounds: Dict[int, List[MatchPlayed]] = {}
+        for name, events in zip(groups, played):
+            for event in events:
+                event.record["group"] = name
+                rounds.setdefault(event.round_num, []).append(event)
+        retained = []
+        for group in groups.values():
+            self.match_stats.merge(group.match_stats)
+            retained.extend(zip(group._detailed_results, group.matches))
+        retained.sort(key=lambda item: item[0]["round"])
+        for record, match in retained:
+            self._detailed_results.append(record)
+            self.matches.append(match)
+
+        for round_num in sorted(rounds):
+            yield RoundStarted(round_num, f"SKUPINY - KOLO {round_num}")
+            yield from rounds[round_num]
+
+        tiers = [[] for _ in range(self.advance)]
+        for name, group in groups.items():
+            standings = group.get_standings()
+            self.qualified[name] = [player for player, _, _ in standings[:self.advance]]
+            for place, row in enumerate(standings[:self.advance]):
+                tiers[place].append(row)
+            yield GroupFinished(name, standings, self.qualified[name], self.stats)
+
+        # Nasazení: nejdřív vítězové skupin, pak druzí, ...; uvnitř podle výher a skóre
+        seeds = []
+        for tier in tiers:
+            tier.sort(key=lambda x: (x[1], x[2]), reverse=True)
+            seeds.extend(player for player, _, _ in tier)
+
+        knockout = EliminationTournament(seeds, self.location, self.winning_score, self.max_dice_value,
+                                         seed=knockout_seed)
+        knockout.players = self._seed_bracket(seeds, knockout._calculate_byes(len(seeds)))
+        knockout.stats = self.stats
+        offset = max(rounds)
+
+        for event in knockout.iter_events():
+            if isinstance(event, (TournamentStarted, TournamentWon)):
+                continue
+            event.round_num += offset
+            if isinstance(event, MatchPlayed):
+                event.record["round"] = event.round_num
+                self.match_stats.add_match(event.round_num, event.score)
+                if self.retention.keeps(knockout.matches[-1]):
+                    self._detailed_results.append(event.record)
+                    self.matches.append(knockout.matches[-1])
+            elif isinstance(event, Elimination):
+                self._knockout_rounds[event.loser] = event.round_num
+            yield event
+
+        self.winner = knockout.winner
+        self._knockout_rounds[self.winner] = self._get_total_rounds() + 1
+        winner_stats = self.stats[self.winner]
+        yield TournamentWon(
+            self.winner,
+            f"Výhry: {winner_stats.wins}, Skóre: +{winner_stats.score['plus']} -{winner_stats.score['minus']}"
+        )
+
+    def get_standings(self) -> List[Tuple[Player, int, int]]:
+        """Vrací pořadí: nejdřív podle postupu ve vyřazovací fázi, pak podle výher a skóre.
+
+        Returns:
+            List[Tuple[Player, int, int]]: Seznam tuple (hráč, výhry, skóre_rozdíl).
+        """
+        standings = super().get_standings()
+        standings.sort(key=lambda x: (self._knockout_rounds.get(x[0], 0), x[1], x[2]), reverse=True)
+        return standings
+
+    def get_results(self) -> Dict:
+        """Sestaví výsledky turnaje doplněné o složení skupin a postupující hráče."""
+        results = super().get_results()
+        results["groups"] = [
+            {
+                "group": name,
+                "players": [player.nickname for player in group_players],
+                "qualified": [player.nickname for player in self.qualified.get(name, [])]
+            }
+            for name, group_players in self.groups.items()
+        ]
+        return results
+
+    def _get_tournament_type_name(self) -> str:
+        """Vrací název typu turnaje."""
+        return "group_knockout"
+
+    def _get_total_rounds(self) -> int:
+        """Vrací počet kol skupinové a vyřazovací fáze."""
+        group_rounds = max(len(p) - 1 if len(p) % 2 == 0 else len(p) for p in self.groups.values())
+        return group_rounds + math.ceil(math.log2(self.advance * self.num_groups))
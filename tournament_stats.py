@@ -0,0 +1,284 @@
+"""Průběžné (online) statistiky turnaje.
+
+Statistiky se aktualizují po každém odehraném zápase v konstantním čase
+a paměti nezávislé na počtu zápasů, takže je turnaj umí vykázat i bez
+uchovávání detailních záznamů zápasů.
+
+Sledované hodnoty:
+
+- délka zápasu (počet odehraných bodů) - průměr a rozptyl Welfordovým
+  algoritmem, minimum a maximum
+- histogram rozdílu skóre na konci zápasu
+- výhry domácích a hostujících hráčů (podíl výher hosta = "upset rate")
+- počet zápasů a bodů v jednotlivých kolech
+
+`HeadToHeadMatrix` drží výsledky vzájemných zápasů round-robin turnaje
+v husté matici n×n (pole `array`) - kdo koho porazil a o kolik bodů.
+Vzájemný zápas se dohledá v O(1) a pomocná kritéria pořadí (vzájemné
+zápasy, Sonneborn-Berger) se počítají bez procházení záznamů zápasů.
+"""
+
+import base64
+import math
+from array import array
+from itertools import compress
+from typing import Dict, List, Optional, Tuple
+
+
+class OnlineStatistics:
+    """Akumulátor statistik zápasů aktualizovaný po každém zápase."""
+
+    def __init__(self):
+        """Inicializuje prázdné statistiky."""
+        self.count = 0
+        self.total_points = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self.min_duration = None
+        self.max_duration = None
+        self.margins: Dict[int, int] = {}
+        self.house_wins = 0
+        self.guest_wins = 0
+        self.rounds: Dict[int, list] = {}
+
+    def __len__(self):
+        """Vrací počet započtených zápasů."""
+        return self.count
+
+    def add_match(self, round_num: int, score: Tuple[int, int]):
+        """Započte odehraný zápas.
+
+        Args:
+            round_num (int): Číslo kola.
+            score (Tuple[int, int]): Konečné skóre (domácí, host).
+        """
+        duration = score[0] + score[1]
+
+        # Welfordův algoritmus - numericky stabilní průměr a rozptyl
+        self.count += 1
+        self.total_points += duration
+        delta = duration - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (duration - self._mean)
+
+        if self.min_duration is None or duration < self.min_duration:
+            self.min_duration = duration
+        if self.max_duration is None or duration > self.max_duration:
+            self.max_duration = duration
+
+        margin = abs(score[0] - score[1])
+        self.margins[margin] = self.margins.get(margin, 0) + 1
+
+        if score[0] > score[1]:
+            self.house_wins += 1
+        else:
+            self.guest_wins += 1
+
+        round_stats = self.rounds.get(round_num)
+        if round_stats is None:
+            self.rounds[round_num] = [1, duration]
+        else:
+            round_stats[0] += 1
+            round_stats[1] += duration
+
+    def merge(self, other: 'OnlineStatistics'):
+        """Přičte statistiky jiného akumulátoru (např. z paralelně hrané skupiny).
+
+        Args:
+            other (OnlineStatistics): Statistiky ke sloučení.
+        """
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self._mean, self._m2 = other._mean, other._m2
+            self.min_duration, self.max_duration = other.min_duration, other.max_duration
+        else:
+            # Chanova varianta Welfordova algoritmu pro spojení dvou částí
+            count = self.count + other.count
+            delta = other._mean - self._mean
+            self._m2 += other._m2 + delta * delta * self.count * other.count / count
+            self._mean += delta * other.count / count
+            self.min_duration = min(self.min_duration, other.min_duration)
+            self.max_duration = max(self.max_duration, other.max_duration)
+
+        self.count += other.count
+        self.total_points += other.total_points
+        self.house_wins += other.house_wins
+        self.guest_wins += other.guest_wins
+        for margin, n in other.margins.items():
+            self.margins[margin] = self.margins.get(margin, 0) + n
+        for round_num, (matches, points) in other.rounds.items():
+            round_stats = self.rounds.setdefault(round_num, [0, 0])
+            round_stats[0] += matches
+            round_stats[1] += points
+
+    @property
+    def mean_duration(self) -> float:
+        """Průměrná délka zápasu v bodech (0 bez zápasů)."""
+        return self.total_points / self.count if self.count else 0
+
+    @property
+    def variance(self) -> float:
+        """Výběrový rozptyl délky zápasu (0 pro méně než 2 zápasy)."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def upset_rate(self) -> float:
+        """Podíl zápasů vyhraných hostujícím hráčem v procentech."""
+        return round(self.guest_wins / self.count * 100, 2) if self.count else 0.0
+
+    def to_dict(self) -> Dict:
+        """Vrací statistiky jako slovník pro výsledkový soubor.
+
+        Returns:
+            Dict: Statistiky délky zápasů, rozdílů skóre, výher domácích/hostů a kol.
+        """
+        return {
+            "match_duration": {
+                "mean": self.mean_duration,
+                "variance": self.variance,
+                "stdev": math.sqrt(self.variance),
+                "min": self.min_duration,
+                "max": self.max_duration
+            },
+            "margin_histogram": {str(margin): self.margins[margin] for margin in sorted(self.margins)},
+            "house_wins": self.house_wins,
+            "guest_wins": self.guest_wins,
+            "upset_rate": self.upset_rate,
+            "rounds": [
+                {
+                    "round": round_num,
+                    "matches": matches,
+                    "points": points,
+                    "average_duration": points / matches
+                }
+                for round_num, (matches, points) in sorted(self.rounds.items())
+            ]
+        }
+
+
+class HeadToHeadMatrix:
+    """Matice výsledků vzájemných zápasů (kdo koho porazil a o kolik).
+
+    Buňka [i, j] obsahuje rozdíl skóre zápasu z pohledu hráče i: kladný,
+    pokud i vyhrál, záporný, pokud prohrál, a 0, pokud spolu nehráli
+    (zápas nemůže skončit remízou). Šířka buňky se volí podle počtu bodů
+    k vítězství: do 127 bodů jeden bajt (`array` 'b'), do 32767 dva ('h'),
+    jinak čtyři ('i').
+    """
+
+    # Typy buněk od nejužšího: (typecode, nejvyšší rozdíl skóre)
+    TYPECODES = (('b', 0x7F), ('h', 0x7FFF), ('i', 0x7FFFFFFF))
+
+    def __init__(self, players: List, winning_score: int = 10):
+        """Inicializuje prázdnou matici.
+
+        Args:
+            players (List[Player]): Hráči turnaje (pořadí určuje indexy v matici).
+            winning_score (int): Počet bodů k vítězství (určuje šířku buňky).
+
+        Raises:
+            ValueError: Pokud se rozdíl skóre nevejde ani do nejširší buňky.
+        """
+        self.players = list(players)
+        self.size = len(self.players)
+        self._index = {player: i for i, player in enumerate(self.players)}
+        self.typecode = self.typecode_for(winning_score)
+        self._margins = array(self.typecode, bytes(self.size * self.size * array(self.typecode).itemsize))
+
+    @classmethod
+    def typecode_for(cls, winning_score: int) -> str:
+        """Vrací nejužší typ buňky pro daný počet bodů k vítězství.
+
+        Raises:
+            ValueError: Pokud se rozdíl skóre nevejde ani do nejširší buňky.
+        """
+        for typecode, limit in cls.TYPECODES:
+            if winning_score <= limit:
+                return typecode
+        raise ValueError(f"Matice vzájemných zápasů podporuje nejvýše {cls.TYPECODES[-1][1]} "
+                         f"bodů k vítězství.")
+
+    def record(self, player1, player2, score: Tuple[int, int]):
+        """Zapíše výsledek zápasu.
+
+        Args:
+            player1 (Player): Domácí hráč.
+            player2 (Player): Hostující hráč.
+            score (Tuple[int, int]): Konečné skóre (domácí, host).
+        """
+        i, j = self._index[player1], self._index[player2]
+        margin = score[0] - score[1]
+        self._margins[i * self.size + j] = margin
+        self._margins[j * self.size + i] = -margin
+
+    def result(self, player, opponent) -> int:
+        """Vrací rozdíl skóre vzájemného zápasu z pohledu hráče (0 = nehráli)."""
+        return self._margins[self._index[player] * self.size + self._index[opponent]]
+
+    def winner(self, player, opponent) -> Optional[object]:
+        """Vrací vítěze vzájemného zápasu, nebo None, pokud spolu nehráli."""
+        margin = self.result(player, opponent)
+        if margin == 0:
+            return None
+        return player if margin > 0 else opponent
+
+    def _row(self, player) -> array:
+        """Vrací řádek matice hráče (výsledky proti všem soupeřům)."""
+        start = self._index[player] * self.size
+        return self._margins[start:start + self.size]
+
+    def mini_league(self, players: List) -> Dict[object, int]:
+        """Spočítá výhry ve vzájemných zápasech skupiny hráčů (např. se stejným počtem výher).
+
+        Args:
+            players (List[Player]): Hráči skupiny.
+
+        Returns:
+            Dict[Player, int]: Počet výher každého hráče proti ostatním ze skupiny.
+        """
+        indexes = [self._index[player] for player in players]
+        result = {}
+        for player, i in zip(players, indexes):
+            start = i * self.size
+            result[player] = sum(1 for j in indexes if self._margins[start + j] > 0)
+        return result
+
+    def sonneborn_berger(self, player, wins: List[int]) -> int:
+        """Spočítá Sonneborn-Bergerovo skóre - součet výher soupeřů, které hráč porazil.
+
+        Args:
+            player (Player): Hráč.
+            wins (List[int]): Počty výher hráčů v pořadí `players`.
+
+        Returns:
+            int: Sonneborn-Bergerovo skóre.
+        """
+        return sum(compress(wins, (margin > 0 for margin in self._row(player))))
+
+    def to_dict(self) -> Dict:
+        """Vrací matici v kompaktním tvaru pro export (buňky jako base64).
+
+        Returns:
+            Dict: Přezdívky hráčů, typ buňky a obsah matice.
+        """
+        return {
+            "players": [player.nickname for player in self.players],
+            "typecode": self.typecode,
+            "margins": base64.b64encode(self._margins.tobytes()).decode('ascii')
+        }
+
+    @staticmethod
+    def decode(data: Dict) -> List[List[int]]:
+        """Rozbalí exportovanou matici (`to_dict`) na seznam řádků.
+
+        Args:
+            data (Dict): Exportovaná matice.
+
+        Returns:
+            List[List[int]]: Řádky matice v pořadí `data["players"]`.
+        """
+        margins = array(data["typecode"])
+        margins.frombytes(base64.b64decode(data["margins"]))
+        size = len(data["players"])
+        return [margins[i * size:(i + 1) * size].tolist() for i in range(size)]
@@ -187,6 +187,1550 @@ def test_factory():
         return False
 
 
+def test_batch():
+    """Testuje neinteraktivní dávkové spouštění turnajů."""
+    print("\n" + "="*70)
+    print("TEST 5: Davkove spousteni")
+    print("="*70)
+
+    from batch import expand_jobs, run_batch
+
+    jobs = expand_jobs({
+        "tournament_type": "elimination",
+        "winning_score": 2,
+        "replicas": 2,
+        "seed": 7,
+        "jobs": [{"name": "a"}, {"name": "b", "seeds": [7, 8]}]
+    })
+    assert [job["seeds"] for job in jobs] == [[7, 8], [7, 8]]
+
+    summary = run_batch(jobs)
+    print(f"Souhrn: {summary['succeeded']}/{summary['runs']} behu")
+    assert summary["failed"] == 0
+    assert summary["runs"] == 4
+
+    # Stejný seed musí dát stejného vítěze
+    winners = [run["winner"] for run in summary["results"]]
+    assert winners[:2] == winners[2:]
+
+    # Seed úlohy se předá turnaji - replika odpovídá přímo seedovanému turnaji
+    from batch import run_replica
+    from game import load_players
+    from tournament import TournamentFactory
+    job = expand_jobs({"tournament_type": "group_knockout", "winning_score": 3, "seed": 5,
+                       "output_format": "none"})[0]
+    record = run_replica(job, 0)
+    direct = TournamentFactory.create("group_knockout", load_players(job["players"]), job["location"], 3,
+                                      job["max_dice_value"], seed=5)
+    list(direct.iter_events())
+    results = direct.get_results()
+    assert (record["winner"], record["rounds"]) == (results["winner"]["nickname"],
+                                                   results["statistics"]["total_rounds"])
+
+    try:
+        expand_jobs({"output_format": "xml"})
+        assert False, "expand_jobs měl vyhodit ValueError"
+    except ValueError as e:
+        print(f"OK - Očekávaná výjimka: {e}")
+
+    # Chybné typy hodnot se ohlásí jako ValueError, ne TypeError při běhu
+    for invalid in ({"seed": "7"}, {"replicas": 2.5}, {"jobs": [{"seeds": [1, "x"]}]}, {"compact": 1}):
+        try:
+            expand_jobs(invalid)
+            assert False, f"Konfigurace {invalid} mela byt odmitnuta"
+        except ValueError:
+            pass
+
+    # Přepínač příkazové řádky přebije i hodnotu zadanou v úloze
+    import contextlib
+    import io
+    import os
+    import tempfile
+    from batch import main as batch_main
+    jobs = expand_jobs({"output_dir": "a", "jobs": [{}, {"output_dir": "b"}]}, {"output_dir": "cli"})
+    assert [job["output_dir"] for job in jobs] == ["cli", "cli"]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config = os.path.join(tmp_dir, "config.json")
+        with open(config, mode='w', encoding='utf-8') as file:
+            file.write('{"seed": 1, "replicas": "3"}')
+        with contextlib.redirect_stderr(io.StringIO()) as stderr:
+            assert batch_main([config]) == 2
+        assert "replicas" in stderr.getvalue()
+
+    print("\nOK - Test davkoveho spousteni byl uspesny!")
+    return True
+
+
+def test_match_predictor():
+    """Testuje analytický prediktor zápasu proti simulaci."""
+    print("\n" + "="*70)
+    print("TEST 6: Prediktor zapasu")
+    print("="*70)
+
+    import random
+    from game import Match, MatchPredictor, Player, Gender
+
+    predictor = MatchPredictor.for_config(winning_score=3, max_dice_value=6)
+    assert predictor is MatchPredictor.for_config(3, 6)
+    assert predictor.win_probability((0, 0)) == 0.5
+    assert predictor.win_probability((3, 1)) == 1.0
+
+    distribution = predictor.length_distribution()
+    assert abs(sum(distribution.values()) - 1.0) < 1e-12
+    mean_length = sum(length * prob for length, prob in distribution.items())
+    assert abs(mean_length - predictor.expected_remaining_points()) < 1e-12
+
+    # Úprava vráceného slovníku nepoškodí zapamatované rozdělení
+    distribution.clear()
+    assert abs(sum(predictor.length_distribution().values()) - 1.0) < 1e-12
+
+    random.seed(1)
+    durations = []
+    for _ in range(2000):
+        match = Match(Player("A", Gender.male, "CZE"), Player("B", Gender.female, "SVK"), 3)
+        match.play()
+        durations.append(len(match.get_history()))
+    simulated = sum(durations) / len(durations)
+    print(f"Ocekavana delka: {mean_length:.3f}, simulovana: {simulated:.3f}")
+    assert abs(simulated - mean_length) < 0.1
+
+    print("\nOK - Test prediktoru byl uspesny!")
+    return True
+
+
+def test_result_cache():
+    """Testuje cache výsledků seedovaných turnajů."""
+    print("\n" + "="*70)
+    print("TEST 7: Cache vysledku")
+    print("="*70)
+
+    import tempfile
+    from result_cache import ResultCache, make_key, run_cached, simulation_modules
+
+    # Otisk kódu zahrnuje i moduly importované simulací (pomocná kritéria, párování)
+    assert {"game.py", "tournament.py", "tournament_stats.py", "matchmaking.py"} <= set(simulation_modules())
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = ResultCache(cache_dir, max_entries=1)
+
+        first, cached = run_cached(cache, load_players("players.json"), "elimination", "Praha", 3, 6, seed=11)
+        assert not cached
+
+        second, cached = run_cached(cache, load_players("players.json"), "elimination", "Praha", 3, 6, seed=11)
+        assert cached
+        assert second["final_standings"] == first["final_standings"]
+
+        # Jiný seed = jiný klíč
+        players = load_players("players.json")
+        assert make_key(players, "elimination", "Praha", 3, 6, 11) != \
+            make_key(players, "elimination", "Praha", 3, 6, 12)
+
+        # Po vyřazení z paměti se záznam načte z disku
+        run_cached(cache, load_players("players.json"), "elimination", "Praha", 3, 6, seed=12)
+        third, cached = run_cached(ResultCache(cache_dir), load_players("players.json"),
+                                   "elimination", "Praha", 3, 6, seed=11)
+        assert cached
+        assert third["winner"]["nickname"] == first["winner"]["nickname"]
+        print(f"Zasahy: {cache.hits}, minuti: {cache.misses}")
+
+    # Seed se předá turnaji - uložený výsledek odpovídá seedovanému turnaji (i u skupin na vláknech)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        results, _ = run_cached(ResultCache(cache_dir), load_players("players.json"), "group_knockout",
+                                "Praha", 3, 6, seed=11)
+        direct = TournamentFactory.create("group_knockout", load_players("players.json"), "Praha", 3, 6, seed=11)
+        list(direct.iter_events())
+        assert results["matches"] == direct.get_results()["matches"]
+
+    print("\nOK - Test cache vysledku byl uspesny!")
+    return True
+
+
+def test_results_archive():
+    """Testuje binární archiv výsledků s indexem podle hráčů."""
+    print("\n" + "="*70)
+    print("TEST 8: Archiv vysledku")
+    print("="*70)
+
+    import os
+    import tempfile
+    from results_archive import ResultsArchive
+
+    tournament = RoundRobinTournament(load_players("players.json")[:4], "Praha", winning_score=2)
+    tournament.play()
+    results = tournament.get_results()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "archive.bin")
+        with ResultsArchive(path) as archive:
+            archive.append_results(results)
+            archive.append_results(results)
+
+        archive = ResultsArchive(path)
+        assert len(archive) == 2 * len(results["matches"])
+
+        nickname = results["players"][0]["nickname"]
+        history = list(archive.matches_of(nickname))
+        assert len(history) == 2 * 3
+        assert all(nickname in (m["house_player"], m["guest_player"]) for m in history)
+
+        other = results["players"][1]["nickname"]
+        head_to_head = archive.head_to_head(nickname, other)
+        assert len(head_to_head) == 2
+        assert head_to_head[0]["winner"] in (nickname, other)
+        assert archive.event(head_to_head[1]["event_id"])["location"] == "Praha"
+        archive.close()
+
+        # Více uložení - segmenty indexu se slučují, dotazy vidí uložené i neuložené zápasy
+        with ResultsArchive(path) as archive:
+            for i in range(6):
+                archive.append_results(results)
+                if i < 5:
+                    archive.flush()
+            assert len(list(archive.matches_of(nickname))) == 8 * 3
+            assert len(archive._segments) <= 3
+        archive = ResultsArchive(path)
+        history = list(archive.matches_of(nickname))
+        assert len(history) == 8 * 3 and len(archive.head_to_head(nickname, other)) == 8
+        assert [m["event_id"] for m in history] == sorted(m["event_id"] for m in history)
+        assert list(archive.matches_of("Nikdo")) == [] and archive.head_to_head(nickname, "Nikdo") == []
+
+        # Neuložené zápasy (pád před flush) se při dalším otevření zahodí
+        archive.append_results(results)
+        archive._writer.flush()
+        assert len(ResultsArchive(path)) == 8 * len(results["matches"])
+
+        # Kolo ani skóre nad rozsah u16 se nezapíše a archiv zůstane beze změny
+        with ResultsArchive(path) as archive:
+            count, event_id = len(archive), archive.add_event("Brno", "2026-01-01", "round_robin")
+            for args in ((70000, 10, 5), (1, 70000, 5), (1, -1, 5)):
+                try:
+                    archive.append_match(event_id, args[0], "Nekdo", "Jiny", *args[1:])
+                    assert False, f"Zapas {args} mel byt odmitnut"
+                except ValueError:
+                    pass
+            assert len(archive) == count and "Nekdo" not in archive.players()
+        print(f"Zapasy hrace {nickname}: {len(history)}, vzajemne: {len(head_to_head)}")
+
+    print("\nOK - Test archivu vysledku byl uspesny!")
+    return True
+
+
+def test_results_database():
+    """Testuje SQLite úložiště výsledků."""
+    print("\n" + "="*70)
+    print("TEST 9: SQLite uloziste")
+    print("="*70)
+
+    import os
+    import tempfile
+    from game import Match
+    from results_db import ResultsDatabase
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with ResultsDatabase(os.path.join(tmp_dir, "results.db")) as database:
+            tournament = RoundRobinTournament(load_players("players.json")[:5], "Praha", winning_score=2)
+            tournament.play()
+            tournament.save_tournament_results(os.path.join(tmp_dir, "rr.json"), database=database)
+            database.save_tournaments([tournament.get_results()] * 2, bulk=True)
+
+            elimination = EliminationTournament(load_players("players.json")[:5], "Brno", winning_score=2)
+            elimination.play()
+            database.save_tournament(elimination.get_results())
+
+            players = load_players("players.json")
+            match = Match(players[0], players[1], winning_score=2)
+            match.play()
+            match.save_match_results(os.path.join(tmp_dir, "match.json"), database=database)
+
+            assert database.count("tournaments") == 4
+            assert database.count("matches") == 3 * 10 + 4 + 1
+            assert database.count("players") == 5
+
+            leaderboard = database.leaderboard(limit=3, location="Praha")
+            assert len(leaderboard) == 3
+            assert leaderboard[0]["tournaments"] == 3
+            assert leaderboard[0]["wins"] >= leaderboard[1]["wins"]
+
+            history = database.player_matches(players[0].nickname)
+            assert history[0]["tournament_id"] is None
+            assert history[0]["duration"] == sum(match.score())
+
+            # Neúspěšné uložení nezanechá v cache id hráčů, kteří v databázi nejsou
+            broken = elimination.get_results()
+            broken["players"] = [{"nickname": "Novy A"}, {"nickname": "Novy B"}]
+            broken["matches"] = [dict(m, winner="Neznamy") for m in broken["matches"]]
+            try:
+                database.save_tournament(broken)
+                assert False, "Ulozeni melo selhat"
+            except KeyError:
+                pass
+            assert database.count("players") == 5
+            database.save_tournament(dict(broken, matches=[]))
+            assert database.count("players") == 7
+
+            # Neúspěšné hromadné nahrání odvolá i zrušení indexů nad zápasy
+            from results_db import MATCH_INDEXES
+            try:
+                database.save_tournaments([tournament.get_results(), broken], bulk=True)
+                assert False, "Hromadne ulozeni melo selhat"
+            except KeyError:
+                pass
+            indexes = {name for (name,) in database._conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'matches'")}
+            assert set(MATCH_INDEXES) <= indexes
+            assert database.count("tournaments") == 5
+            print(f"Vedouci hrac: {leaderboard[0]['nickname']} ({leaderboard[0]['wins']} vyher)")
+
+    print("\nOK - Test SQLite uloziste byl uspesny!")
+    return True
+
+
+def test_csv_streaming():
+    """Testuje proudový import/export CSV (hráči, pořadí, zápasy)."""
+    print("\n" + "="*70)
+    print("TEST 10: CSV import/export")
+    print("="*70)
+
+    import os
+    import tempfile
+    from files import csvfile_iter, csvfile_read, csvfile_write
+    from game import save_players
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Zápis z generátoru a zpětné čtení
+        path = os.path.join(tmp_dir, "rows.csv")
+        written = csvfile_write(path, ({"id": i, "name": f"row {i}"} for i in range(2500)), chunk_size=1000)
+        assert written == 2500
+        rows = csvfile_iter(path)
+        assert next(rows) == {"id": "0", "name": "row 0"}
+        assert len(csvfile_read(path)) == 2500
+
+        try:
+            csvfile_write(path, iter([]))
+            assert False, "csvfile_write měl vyhodit ValueError"
+        except ValueError as e:
+            print(f"OK - Očekávaná výjimka: {e}")
+
+        # Hráči přes CSV
+        players_path = os.path.join(tmp_dir, "players.csv")
+        save_players(players_path, load_players("players.json"))
+        players = load_players(players_path)
+        assert [p.nickname for p in players] == [p.nickname for p in load_players("players.json")]
+
+        tournament = EliminationTournament(players, "Brno", winning_score=2)
+        tournament.play()
+        assert tournament.export_standings_csv(os.path.join(tmp_dir, "standings.csv")) == len(players)
+        assert tournament.export_matches_csv(os.path.join(tmp_dir, "matches.csv")) == len(players) - 1
+        standings = csvfile_read(os.path.join(tmp_dir, "standings.csv"))
+        assert standings[0]["position"] == "1"
+
+    print("\nOK - Test CSV importu/exportu byl uspesny!")
+    return True
+
+
+def test_json_output():
+    """Testuje komprimovaný a atomický zápis JSON výsledků."""
+    print("\n" + "="*70)
+    print("TEST 11: Komprimovany a atomicky JSON")
+    print("="*70)
+
+    import gzip
+    import os
+    import tempfile
+    from files import jsonfile_read, jsonfile_write
+
+    tournament = RoundRobinTournament(load_players("players.json"), "Praha", winning_score=3)
+    tournament.play()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        plain = os.path.join(tmp_dir, "results.json")
+        packed = os.path.join(tmp_dir, "results.json.gz")
+        tournament.save_tournament_results(plain)
+        tournament.save_tournament_results(packed, compact=True)
+
+        with gzip.open(packed, "rt", encoding="utf-8") as file:
+            assert ", " not in file.read(200)
+        assert jsonfile_read(packed) == jsonfile_read(plain)
+        assert os.path.getsize(packed) < os.path.getsize(plain) / 3
+        print(f"Velikost: {os.path.getsize(plain)} B -> {os.path.getsize(packed)} B")
+
+        # Neúspěšný zápis nesmí poškodit původní soubor
+        try:
+            jsonfile_write(plain, {"data": object()})
+            assert False, "jsonfile_write měl vyhodit TypeError"
+        except TypeError as e:
+            print(f"OK - Očekávaná výjimka: {e}")
+        assert jsonfile_read(plain)["tournament_info"]["location"] == "Praha"
+        # Po neúspěšném zápisu nezůstal dočasný soubor
+        assert sorted(os.listdir(tmp_dir)) == ["results.json", "results.json.gz"]
+
+        # Nový soubor má stejná práva jako soubor vytvořený open(), existující si práva ponechá
+        reference = os.path.join(tmp_dir, "reference.json")
+        open(reference, "w").close()
+        created = os.path.join(tmp_dir, "created.json")
+        jsonfile_write(created, {})
+        assert os.stat(created).st_mode & 0o777 == os.stat(reference).st_mode & 0o777
+        os.chmod(plain, 0o640)
+        jsonfile_write(plain, {})
+        assert os.stat(plain).st_mode & 0o777 == 0o640
+        assert sorted(os.listdir(tmp_dir)) == ["created.json", "reference.json", "results.json", "results.json.gz"]
+
+    print("\nOK - Test JSON vystupu byl uspesny!")
+    return True
+
+
+def test_async_io():
+    """Testuje asynchronní varianty souborových funkcí."""
+    print("\n" + "="*70)
+    print("TEST 12: Asynchronni I/O")
+    print("="*70)
+
+    import asyncio
+    import os
+    import tempfile
+    import files
+
+    tournaments = []
+    for i in range(6):
+        tournament = EliminationTournament(load_players("players.json"), f"Mesto {i}", winning_score=2)
+        tournament.play()
+        tournaments.append(tournament)
+
+    async def run(tmp_dir):
+        await asyncio.gather(*(
+            t.save_tournament_results_async(os.path.join(tmp_dir, f"t{i}.json.gz"))
+            for i, t in enumerate(tournaments)
+        ))
+        loaded = await asyncio.gather(*(
+            files.jsonfile_read_async(os.path.join(tmp_dir, f"t{i}.json.gz")) for i in range(len(tournaments))
+        ))
+        await files.textfile_write_async(os.path.join(tmp_dir, "note.txt"), "hotovo")
+        text = await files.textfile_read_async(os.path.join(tmp_dir, "note.txt"))
+        await files.csvfile_write_async(os.path.join(tmp_dir, "rows.csv"), ({"i": i} for i in range(5)))
+        rows = await files.csvfile_read_async(os.path.join(tmp_dir, "rows.csv"))
+        return loaded, text, rows
+
+    files.set_io_workers(2)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        loaded, text, rows = asyncio.run(run(tmp_dir))
+
+    assert [r["tournament_info"]["location"] for r in loaded] == [t.location for t in tournaments]
+    assert text == "hotovo"
+
+    # Výsledky se sestavují mimo vlákno smyčky událostí
+    import threading
+    builders = []
+    original_get_results = tournaments[0].get_results
+
+    def recording_get_results():
+        builders.append(threading.current_thread())
+        return original_get_results()
+
+    tournaments[0].get_results = recording_get_results
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        asyncio.run(tournaments[0].save_tournament_results_async(os.path.join(tmp_dir, "t.json")))
+    assert builders and builders[0] is not threading.main_thread()
+    assert len(rows) == 5
+
+    print("\nOK - Test asynchronniho I/O byl uspesny!")
+    return True
+
+
+def test_distributed():
+    """Testuje distribuované spouštění (koordinátor + workeři na localhostu)."""
+    print("\n" + "="*70)
+    print("TEST 13: Distribuovane spousteni")
+    print("="*70)
+
+    import socket
+    import threading
+    import distributed
+
+    players = load_players("players.json")
+
+    tasks = distributed.make_replica_tasks(players, "elimination", "Praha", 2, 6, replicas=4, seed=3)
+    summary = distributed.run_local(tasks, workers=2, timeout=60)
+    assert summary["tasks"] == 4
+    assert summary["matches"] == 4 * (len(players) - 1)
+    assert sum(s["titles"] for s in summary["standings"]) == 4
+
+    # Worker, který spadne uprostřed úlohy - úloha se musí zopakovat jinde
+    coordinator = distributed.Coordinator(
+        distributed.make_round_shard_tasks(players, "Brno", 2, 6, shards=3, seed=5), task_timeout=10
+    )
+    coordinator.start()
+    host, port = coordinator.address
+    with socket.create_connection((host, port)) as crashing:
+        distributed.send_message(crashing, {"type": "ready", "worker": "crash"})
+        distributed.recv_message(crashing)
+
+    worker = threading.Thread(target=distributed.run_worker, args=(host, port, "ok"))
+    worker.start()
+    assert coordinator.wait(60)
+    coordinator.close()
+    worker.join()
+
+    summary = coordinator.summary()
+    print(f"Opakovani: {summary['retries']}, chyby: {summary['errors']}")
+    assert summary["retries"] == 1
+    assert summary["failed_tasks"] == []
+    assert summary["matches"] == len(players) * (len(players) - 1) // 2
+
+    # Jediný worker spadne a žádný další se nepřipojí - koordinátor skončí chybou, nečeká navždy
+    coordinator = distributed.Coordinator(tasks, task_timeout=10, worker_grace=0.2)
+    host, port = coordinator.address
+
+    def crash():
+        with socket.create_connection((host, port)) as dying:
+            distributed.send_message(dying, {"type": "ready", "worker": "dying"})
+            distributed.recv_message(dying)
+
+    threading.Timer(0.1, crash).start()
+    try:
+        coordinator.serve(timeout=30)
+        assert False, "Koordinator mel skoncit chybou"
+    except ConnectionError as e:
+        print(f"Bez workeru: {e}")
+    assert coordinator.errors and all(result is None for result in coordinator.results)
+
+    # Zopakovaná úloha se seedem dá stejný výsledek i u skupin hraných na vláknech
+    task = distributed.make_replica_tasks(players, "group_knockout", "Praha", 3, 6, replicas=1, seed=9)[0]
+    assert distributed.run_task(task) == distributed.run_task(task)
+
+    # Koordinátor zahodí úlohu a zavře spojení - worker skončí bez výjimky
+    import struct
+    with socket.create_server(("127.0.0.1", 0)) as server:
+        host, port = server.getsockname()
+        worker_result = []
+        worker = threading.Thread(
+            target=lambda: worker_result.append(distributed.run_worker(host, port, "late"))
+        )
+        worker.start()
+        connection, _ = server.accept()
+        distributed.recv_message(connection)
+        distributed.send_message(connection, {"type": "task", "task_id": 0, "task": task})
+        connection.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+        connection.close()
+        worker.join(30)
+    assert not worker.is_alive() and worker_result in ([0], [1])
+
+    print("\nOK - Test distribuovaneho spousteni byl uspesny!")
+    return True
+
+
+def test_match_replay():
+    """Testuje přehrávání historie zápasu ze seedu."""
+    print("\n" + "="*70)
+    print("TEST 14: Historie zapasu ze seedu")
+    print("="*70)
+
+    import contextlib
+    import io
+    from game import Match
+
+    players = load_players("players.json")
+    match = Match(players[0], players[1], winning_score=7, seed=1234)
+    with contextlib.redirect_stdout(io.StringIO()):
+        match.play()
+
+    history = match.get_history()
+    print(f"Seed: {match.seed}, delka historie: {len(history)}")
+    assert not hasattr(match, "__dict__")
+    assert history == Match.replay_history(1234, 7, 6)
+    assert len(history) == match.hp_points + match.gp_points
+    assert history[-1] == match.score()
+
+    tournament = RoundRobinTournament(players=load_players("players.json"), location="Replay",
+                                      winning_score=5)
+    with contextlib.redirect_stdout(io.StringIO()):
+        tournament.play()
+    for record in tournament.get_results()["matches"]:
+        final = record["final_score"]
+        assert "seed" in record
+        assert record["score_history"][-1] == (final["player1"], final["player2"])
+        assert len(record["score_history"]) == record["match_duration"]
+
+    print("\nOK - Test historie zapasu byl uspesny!")
+    return True
+
+
+def test_events():
+    """Testuje postupné (i asynchronní) procházení událostí turnaje."""
+    print("\n" + "="*70)
+    print("TEST 15: Udalosti turnaje")
+    print("="*70)
+
+    import asyncio
+    from events import TournamentStarted, RoundStarted, MatchPlayed, StandingsSnapshot, TournamentWon
+
+    players = load_players("players.json")
+    tournament = RoundRobinTournament(players=players, location="Udalosti", winning_score=3)
+    events = tournament.iter_events()
+
+    assert isinstance(next(events), TournamentStarted)
+    assert isinstance(next(events), RoundStarted)
+    first = next(events)
+    assert isinstance(first, MatchPlayed)
+    # Generátor je líný - zatím je odehrán jediný zápas
+    assert len(tournament.matches) == 1
+    assert first.record["winner"] == first.winner.nickname
+
+    rest = list(events)
+    assert isinstance(rest[-1], TournamentWon)
+    assert rest[-1].winner is tournament.winner
+    snapshots = [e for e in rest if isinstance(e, StandingsSnapshot)]
+    assert len(snapshots) == tournament._get_total_rounds()
+
+    async def collect():
+        elimination = EliminationTournament(players=load_players("players.json"), location="Async",
+                                            winning_score=3)
+        return elimination, [event async for event in elimination.iter_events_async()]
+
+    elimination, async_events = asyncio.run(collect())
+    played = [e for e in async_events if isinstance(e, MatchPlayed)]
+    print(f"Udalosti: {len(rest) + 3} (round-robin), {len(async_events)} (eliminace)")
+    assert len(played) == len(elimination.matches) == len(players) - 1
+    assert async_events[-1].winner is elimination.winner
+
+    print("\nOK - Test udalosti turnaje byl uspesny!")
+    return True
+
+
+def test_online_statistics():
+    """Testuje průběžné statistiky zápasů."""
+    print("\n" + "="*70)
+    print("TEST 16: Prubezne statistiky")
+    print("="*70)
+
+    import contextlib
+    import io
+    import statistics
+    from tournament_stats import OnlineStatistics
+
+    tournament = RoundRobinTournament(players=load_players("players.json"), location="Statistiky")
+    with contextlib.redirect_stdout(io.StringIO()):
+        tournament.play()
+
+    stats = tournament.get_results()["statistics"]
+    durations = [m["match_duration"] for m in tournament._detailed_results]
+    print(f"Prumer: {stats['match_duration']['mean']:.2f}, upset rate: {stats['upset_rate']} %")
+    assert stats["total_matches"] == len(durations)
+    assert stats["average_match_duration"] == sum(durations) / len(durations)
+    assert abs(stats["match_duration"]["variance"] - statistics.variance(durations)) < 1e-9
+    assert sum(stats["margin_histogram"].values()) == len(durations)
+    assert stats["house_wins"] + stats["guest_wins"] == len(durations)
+    assert sum(r["matches"] for r in stats["rounds"]) == len(durations)
+
+    # Sloučení dvou polovin dá stejný výsledek jako jeden akumulátor
+    first, second = OnlineStatistics(), OnlineStatistics()
+    for i, record in enumerate(tournament._detailed_results):
+        score = (record["final_score"]["player1"], record["final_score"]["player2"])
+        (first if i % 2 else second).add_match(record["round"], score)
+    first.merge(second)
+    assert first.to_dict()["margin_histogram"] == stats["margin_histogram"]
+    assert abs(first.variance - stats["match_duration"]["variance"]) < 1e-9
+
+    print("\nOK - Test prubeznych statistik byl uspesny!")
+    return True
+
+
+def test_retention():
+    """Testuje politiku uchovávání odehraných zápasů."""
+    print("\n" + "="*70)
+    print("TEST 17: Politika uchovavani zapasu")
+    print("="*70)
+
+    import contextlib
+    import io
+    import random
+    from tournament import RetentionPolicy
+
+    def run(retention):
+        random.seed(17)
+        tournament = TournamentFactory.create("round_robin", load_players("players.json"), "Pamet",
+                                              winning_score=5, retention=retention)
+        with contextlib.redirect_stdout(io.StringIO()):
+            tournament.play()
+        return tournament, tournament.get_results()
+
+    full, full_results = run("all")
+    per_round = len(full.players) // 2
+
+    for spec in ("last:2", "sample:0.25", "none"):
+        tournament, results = run(spec)
+        retained = len(results["matches"])
+        print(f"{spec:<12} uchovano {retained}/{results['statistics']['total_matches']} zapasu")
+        # Pořadí a statistiky nezávisí na politice
+        assert results["final_standings"] == full_results["final_standings"]
+        assert results["statistics"]["match_duration"] == full_results["statistics"]["match_duration"]
+        assert results["tournament_info"]["retention"] == spec
+        assert retained == len(tournament.matches) == results["statistics"]["retained_matches"]
+
+        if spec == "last:2":
+            assert retained <= 2 * per_round
+            assert {m["round"] for m in results["matches"]} == {12, 13}
+        elif spec == "none":
+            assert retained == 0
+        else:
+            assert 0 < retained < len(full_results["matches"])
+            full_seeds = {m["seed"] for m in full_results["matches"]}
+            assert {m["seed"] for m in results["matches"]} <= full_seeds
+
+    # Žebříček má všechny zápasy v kole 1 - "last:K" drží posledních K zápasů
+    ladder_full = TournamentFactory.create("ladder", load_players("players.json"), "Pamet",
+                                           winning_score=5, seed=17, games_per_player=6)
+    ladder = TournamentFactory.create("ladder", load_players("players.json"), "Pamet",
+                                      winning_score=5, seed=17, games_per_player=6, retention="last:5")
+    for tournament in (ladder_full, ladder):
+        with contextlib.redirect_stdout(io.StringIO()):
+            tournament.play()
+    ladder_results, ladder_full_results = ladder.get_results(), ladder_full.get_results()
+    assert ladder_results["statistics"]["total_matches"] > 5
+    assert len(ladder.matches) == len(ladder_results["matches"]) == 5
+    assert ladder_results["matches"] == ladder_full_results["matches"][-5:]
+    assert ladder_results["final_standings"] == ladder_full_results["final_standings"]
+
+    for invalid in ("last:0", "sample:2", "keep"):
+        try:
+            RetentionPolicy.parse(invalid)
+            assert False, f"Politika '{invalid}' mela byt odmitnuta"
+        except ValueError:
+            pass
+
+    print("\nOK - Test politiky uchovavani byl uspesny!")
+    return True
+
+
+def test_roster_generator():
+    """Testuje generátor syntetických soupisek a čtení JSONL."""
+    print("\n" + "="*70)
+    print("TEST 18: Generator soupisek")
+    print("="*70)
+
+    import os
+    import tempfile
+    from game import Gender
+    from roster_generator import write_roster, generate_players
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        rosters = {}
+        for ext in (".json", ".jsonl", ".jsonl.gz", ".csv"):
+            path = os.path.join(tmp_dir, "roster" + ext)
+            assert write_roster(path, 2500, seed=7, states={"CZE": 3, "SVK": 1}, female_ratio=0.25) == 2500
+            rosters[ext] = [(p.nickname, p.gender, p.state) for p in load_players(path)]
+            print(f"{ext:<10} {os.path.getsize(path)} B")
+
+        # Všechny formáty obsahují stejnou soupisku
+        reference = rosters[".json"]
+        assert all(roster == reference for roster in rosters.values())
+        assert len({nickname for nickname, _, _ in reference}) == 2500
+        assert {state for _, _, state in reference} == {"CZE", "SVK"}
+        assert all(isinstance(gender, Gender) for _, gender, _ in reference)
+
+    # Stejný seed => stejná soupiska, jiný seed => jiná
+    assert list(generate_players(100, seed=1)) == list(generate_players(100, seed=1))
+    assert list(generate_players(100, seed=1)) != list(generate_players(100, seed=2))
+
+    print("\nOK - Test generatoru soupisek byl uspesny!")
+    return True
+
+
+def test_pair_cache():
+    """Testuje cache výsledků dvojic pro přírůstkový round-robin."""
+    print("\n" + "="*70)
+    print("TEST 19: Cache vysledku dvojic")
+    print("="*70)
+
+    import os
+    import random
+    import tempfile
+    from result_cache import PairResultCache
+
+    def run(players, cache=None):
+        tournament = RoundRobinTournament(players=players, location="Dvojice", winning_score=5,
+                                          seed=99, pair_cache=cache)
+        for _ in tournament.iter_events():
+            pass
+        return tournament.get_results()
+
+    cache = PairResultCache(99, winning_score=5)
+    run(load_players("players.json")[:-1], cache)
+    first_misses = cache.misses
+    assert len(cache) == first_misses == 12 * 11 // 2
+
+    # Přidání hráče => simulují se jen jeho zápasy
+    random.seed(1)
+    incremental = run(load_players("players.json"), cache)
+    print(f"Nove simulace: {cache.misses - first_misses}, z cache: {cache.hits}")
+    assert cache.misses - first_misses == 12
+    assert cache.hits == len(cache) - 12
+
+    random.seed(2)
+    fresh = run(load_players("players.json"))
+    assert incremental["final_standings"] == fresh["final_standings"]
+    assert incremental["matches"] == fresh["matches"]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "pairs.json.gz")
+        cache.save(path)
+        loaded = PairResultCache.load(path)
+        assert len(loaded) == len(cache)
+        run(load_players("players.json"), loaded)
+        assert loaded.misses == 0
+
+    try:
+        RoundRobinTournament(players=load_players("players.json"), location="Bez seedu", pair_cache=cache)
+        assert False, "Cache bez seedu mela byt odmitnuta"
+    except ValueError as e:
+        print(f"OK - Očekávaná výjimka: {e}")
+
+    # Cache s jiným seedem se odmítne už při vytvoření turnaje (před výpisem hlavičky)
+    try:
+        RoundRobinTournament(load_players("players.json"), "Jiny seed", winning_score=5, seed=1, pair_cache=cache)
+        assert False, "Cache s jinym seedem mela byt odmitnuta"
+    except ValueError as e:
+        print(f"OK - Očekávaná výjimka: {e}")
+
+    print("\nOK - Test cache dvojic byl uspesny!")
+    return True
+
+
+def test_stats_context():
+    """Testuje sdílení jedné soupisky více turnaji (statistiky v kontextu turnaje)."""
+    print("\n" + "="*70)
+    print("TEST 20: Sdilena soupiska a kontext statistik")
+    print("="*70)
+
+    from concurrent.futures import ThreadPoolExecutor
+    from game import Match, StatsContext
+
+    def run(players, seed):
+        tournament = RoundRobinTournament(players=players, location="Sdileni", winning_score=5, seed=seed)
+        for _ in tournament.iter_events():
+            pass
+        return tournament.get_results()
+
+    shared = load_players("players.json")
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        parallel = list(executor.map(lambda seed: run(shared, seed), range(8)))
+
+    # Stejné výsledky jako s čerstvou soupiskou pro každý turnaj
+    for seed, results in enumerate(parallel):
+        assert results["final_standings"] == run(load_players("players.json"), seed)["final_standings"]
+    # Sdílení hráči zůstali beze změny
+    assert all(p.count_of_games == 0 and p.wins == 0 for p in shared)
+    print(f"Turnaju nad jednou soupiskou: {len(parallel)}")
+
+    context = StatsContext()
+    match = Match(shared[0], shared[1], winning_score=3, seed=5, stats=context)
+    match.play()
+    assert context[shared[0]].count_of_games == context[shared[1]].count_of_games == 1
+    assert context[shared[0]].wins + context[shared[1]].wins == 1
+    assert shared[0].count_of_games == 0
+
+    print("\nOK - Test kontextu statistik byl uspesny!")
+    return True
+
+
+def test_ladder():
+    """Testuje frontu párování podle ratingu a žebříček s průběžnými příchody."""
+    print("\n" + "="*70)
+    print("TEST 21: Zebricek a parovani podle ratingu")
+    print("="*70)
+
+    import time
+    from events import TournamentWon
+    from game import Player, Gender
+    from matchmaking import Matchmaker
+    from tournament import LadderTournament
+
+    players = load_players("players.json")
+    matchmaker = Matchmaker(bucket_width=50, max_gap=100)
+    assert matchmaker.add(players[0], 1000) is None
+    assert matchmaker.add(players[1], 1300) is None    # mimo dosah
+    assert matchmaker.add(players[2], 1080) is players[0]
+    assert players[0] not in matchmaker and len(matchmaker) == 1
+    try:
+        matchmaker.add(players[1], 1300)
+        assert False, "Mel byt vyhozen ValueError"
+    except ValueError:
+        pass
+
+    # Odchod z fronty - hráč se už nespáruje
+    assert matchmaker.remove(players[1]) and not matchmaker.remove(players[1])
+    assert matchmaker.add(players[3], 1290) is None
+    assert len(matchmaker) == 1
+
+    # Odchody a příchody přihrádky nezvětšují (záznam se odstraní hned)
+    for _ in range(1000):
+        matchmaker.add(players[4], 1500)
+        matchmaker.remove(players[4])
+    assert sum(len(bucket) for bucket in matchmaker._buckets.values()) == len(matchmaker) == 1
+
+    # Odešlí hráči za nejdéle čekajícím se z fronty podle příchodu průběžně vyřazují
+    matchmaker = Matchmaker(bucket_width=100, max_gap=10)
+    assert matchmaker.add(players[0], 1000) is None
+    for _ in range(1000):
+        assert matchmaker.add(players[4], 1080) is None
+        matchmaker.remove(players[4])
+    bucket = matchmaker._buckets[matchmaker._bucket(1000)]
+    assert len(bucket.queue) <= 2 and bucket.players[bucket.first()] is players[0]
+
+    # Celá přihrádka v dosahu - nejdéle čekající; okrajová přihrádka - nejbližší rating
+    matchmaker = Matchmaker(bucket_width=100, max_gap=30)
+    assert matchmaker.add(players[0], 1010) is None
+    assert matchmaker.add(players[1], 1065) is None
+    assert matchmaker.add(players[2], 1040) is players[0]
+    matchmaker = Matchmaker(bucket_width=100, max_gap=30)
+    for player, rating in ((players[0], 1000), (players[1], 1040), (players[3], 1080)):
+        assert matchmaker.add(player, rating) is None
+    assert matchmaker.add(players[2], 1065) is players[3]
+
+    ladder = TournamentFactory.create("ladder", players, "Zebricek", winning_score=5, seed=3)
+    events = list(ladder.iter_events())
+    assert isinstance(events[-1], TournamentWon)
+    assert all(ladder.stats[p].count_of_games <= ladder.games_per_player for p in players)
+    assert len(ladder.matchmaker) == 0
+    standings = ladder.get_standings()
+    assert standings[0][0] is ladder.winner
+    ratings = [ladder.rating(p) for p, _, _ in standings]
+    assert ratings == sorted(ratings, reverse=True)
+    assert abs(sum(ladder.ratings.values()) - len(ladder.ratings) * LadderTournament.INITIAL_RATING) < 1e-6
+
+    # Stejný seed = stejný průběh
+    again = TournamentFactory.create("ladder", load_players("players.json"), "Zebricek", winning_score=5, seed=3)
+    for _ in again.iter_events():
+        pass
+    assert again.get_results()["ratings"] == ladder.get_results()["ratings"]
+
+    # Nový hráč se přidá na soupisku při příchodu
+    newcomer = Player("Novacek", Gender.male, "CZE")
+    first = ladder.join(newcomer)
+    second = ladder.join(players[0])
+    assert first is None and second is not None and newcomer in ladder.players
+    assert ladder.get_standings()   # průběžné pořadí kdykoliv
+
+    # Propustnost fronty
+    crowd = [Player(f"Hrac{i}", Gender.female, "CZE") for i in range(2000)]
+    ladder = LadderTournament(crowd[:2], "Zatez", winning_score=3, seed=1, retention="none")
+    start = time.perf_counter()
+    for i in range(20000):
+        player = crowd[(i * 7919) % len(crowd)]
+        if player in ladder.matchmaker:
+            ladder.leave(player)
+        else:
+            ladder.join(player)
+    elapsed = time.perf_counter() - start
+    print(f"Udalosti ve fronte: {20000 / elapsed:.0f}/s, zapasu: {ladder.match_stats.count}")
+    assert ladder.match_stats.count > 0
+
+    print("\nOK - Test zebricku byl uspesny!")
+    return True
+
+
+def test_group_knockout():
+    """Testuje kombinovaný turnaj se skupinami a vyřazovací fází."""
+    print("\n" + "="*70)
+    print("TEST 22: Skupiny a vyrazovaci faze")
+    print("="*70)
+
+    import json
+    import os
+    import tempfile
+    from events import Bye, GroupFinished
+
+    players = load_players("players.json")
+    tournament = TournamentFactory.create("group_knockout", players, "Skupiny", winning_score=5,
+                                          seed=11, num_groups=4, advance=2)
+    events = list(tournament.iter_events())
+    assert [len(p) for p in tournament.groups.values()] == [4, 3, 3, 3]
+    assert sum(isinstance(e, GroupFinished) for e in events) == 4
+
+    results = tournament.get_results()
+    group_matches = [m for m in results["matches"] if m["match_type"] == "round_robin"]
+    knockout_matches = [m for m in results["matches"] if m["match_type"] == "elimination"]
+    assert len(group_matches) == 6 + 3 + 3 + 3 and all("group" in m for m in group_matches)
+    assert len(knockout_matches) == 7    # 8 postupujících, bez volných losů
+    assert results["statistics"]["total_matches"] == 22
+    # Kola vyřazovací fáze navazují na skupiny
+    assert min(m["round"] for m in knockout_matches) > max(m["round"] for m in group_matches)
+    assert results["statistics"]["total_rounds"] == 3 + 3
+
+    qualified = {p for group in results["groups"] for p in group["qualified"]}
+    assert len(qualified) == 8
+    assert {m["player1"]["nickname"] for m in knockout_matches} <= qualified
+    assert tournament.get_standings()[0][0] is tournament.winner
+    assert results["final_standings"][0]["player"] == results["winner"]["nickname"]
+
+    # Počet vláken ani sdílená soupiska výsledek nemění
+    serial = TournamentFactory.create("group_knockout", players, "Skupiny", winning_score=5,
+                                      seed=11, num_groups=4, advance=2, max_workers=1)
+    for _ in serial.iter_events():
+        pass
+    assert serial.get_results()["final_standings"] == results["final_standings"]
+    assert all(p.count_of_games == 0 for p in players)
+
+    # Lichý počet postupujících - nejvýše nasazení dostanou volný los
+    tournament = TournamentFactory.create("group_knockout", players, "Skupiny", winning_score=5,
+                                          seed=3, num_groups=3, advance=2)
+    events = list(tournament.iter_events())
+    byes = [e.player for e in events if isinstance(e, Bye)]
+    group_winners = {qualified[0] for qualified in tournament.qualified.values()}
+    assert len(byes) == 2 and set(byes) <= group_winners
+
+    # Jeden výsledkový soubor s oběma fázemi
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "group_knockout.json")
+        tournament.save_tournament_results(path)
+        with open(path, encoding='utf-8') as file:
+            saved = json.load(file)
+    assert saved["tournament_info"]["type"] == "group_knockout"
+    assert {m["match_type"] for m in saved["matches"]} == {"round_robin", "elimination"}
+
+    # Neseedovaný turnaj: vlákna skupin nesdílí globální generátor, stejný random.seed = stejný výsledek
+    import random
+    from game import Gender, Player
+
+    def unseeded_run():
+        roster = [Player(f"Hrac{i}", Gender.male, "CZE") for i in range(80)]
+        random.seed(43)
+        run = TournamentFactory.create("group_knockout", roster, "Skupiny", winning_score=5,
+                                       num_groups=8, max_workers=8)
+        list(run.iter_events())
+        return [(m["player1"]["nickname"], m["final_score"]["player1"], m["final_score"]["player2"])
+                for m in run.get_results()["matches"]]
+
+    first = unseeded_run()
+    assert all(unseeded_run() == first for _ in range(3))
+
+    for kwargs in ({"num_groups": 7}, {"num_groups": 4, "advance": 4}):
+        try:
+            TournamentFactory.create("group_knockout", players, "Skupiny", **kwargs)
+            assert False, "Mel byt vyhozen ValueError"
+        except ValueError:
+            pass
+
+    print(f"Vitez: {tournament.winner.nickname}, zapasu: {saved['statistics']['total_matches']}")
+    print("\nOK - Test skupin a vyrazovaci faze byl uspesny!")
+    return True
+
+
+def test_server():
+    """Testuje HTTP službu (endpointy, keep-alive, dávkování a statistiky latence)."""
+    print("\n" + "="*70)
+    print("TEST 23: HTTP sluzba se slucovanim pozadavku")
+    print("="*70)
+
+    import asyncio
+    import json
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    from server import MAX_PLAYERS, MAX_WINNING_SCORE, SimulationServer, execute_batch
+
+    async def request(reader, writer, method, path, body=None):
+        data = json.dumps(body).encode('utf-8') if body is not None else b''
+        writer.write(f"{method} {path} HTTP/1.1\r\nHost: test\r\nContent-Length: {len(data)}\r\n\r\n"
+                     .encode('latin-1') + data)
+        await writer.drain()
+        status = int((await reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await reader.readline()
+            if line == b'\r\n':
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            if name.lower() == "content-length":
+                length = int(value)
+        return status, json.loads(await reader.readexactly(length))
+
+    house = {"nickname": "Houska", "gender": "man", "state": "CZE"}
+    guest = {"nickname": "Greta", "gender": "woman", "state": "SWE"}
+
+    async def client(port, requests):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        results = []
+        for seed in requests:    # jedno spojení pro všechny požadavky (keep-alive)
+            results.append(await request(reader, writer, "POST", "/match",
+                                         {"house": house, "guest": guest, "seed": seed, "winning_score": 5}))
+        writer.close()
+        return results
+
+    async def scenario():
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            server = SimulationServer(port=0, max_concurrency=8, batch_size=16, executor=executor)
+            await server.start()
+            try:
+                clients = await asyncio.gather(*(client(server.port, range(i, i + 20)) for i in range(20)))
+                reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+                tournament = await request(reader, writer, "POST", "/tournament", {
+                    "players": json.load(open("players.json", encoding='utf-8')),
+                    "tournament_type": "elimination", "seed": 7, "winning_score": 5
+                })
+                predict = await request(reader, writer, "GET", "/predict?house=3&guest=5&winning_score=10")
+                huge = await request(reader, writer, "GET", "/predict?winning_score=1500")
+                bad = await request(reader, writer, "POST", "/match", {"house": house})
+                missing = await request(reader, writer, "GET", "/nic")
+                stats = await request(reader, writer, "GET", "/stats")
+                writer.close()
+            finally:
+                await server.close()
+            return clients, tournament, predict, huge, bad, missing, stats
+
+    clients, tournament, predict, huge, bad, missing, stats = asyncio.run(scenario())
+
+    matches = [result for results in clients for result in results]
+    assert len(matches) == 400 and all(status == 200 for status, _ in matches)
+    # Stejný seed = stejný zápas, i když přišel jiným spojením a v jiné dávce
+    by_seed = {}
+    for _, body in matches:
+        assert max(body["score"]) == 5
+        assert by_seed.setdefault(body["seed"], body["score"]) == body["score"]
+
+    assert tournament[0] == 200 and tournament[1]["tournament_info"]["type"] == "elimination"
+    assert tournament[1]["statistics"]["total_matches"] == 12
+    assert predict[0] == 200 and abs(predict[1]["win_probability"] - 0.2744140625) < 1e-9
+    assert bad[0] == 400 and "error" in bad[1]
+    assert huge[0] == 400 and str(MAX_WINNING_SCORE) in huge[1]["error"]
+    assert missing[0] == 404
+
+    # Příliš velká soupiska se odmítne dřív, než se turnaj vytvoří
+    [(status, error)] = execute_batch([("tournament", {"players": [{}] * (MAX_PLAYERS + 1)})])
+    assert status == 400 and str(MAX_PLAYERS) in error
+
+    # Klient smí nastavit jen povolené volby turnaje v jejich rozsahu
+    roster = json.load(open("players.json", encoding='utf-8'))
+    [(status, error), (bad_type, _), (bad_range, _), (bad_timeout, _)] = execute_batch([
+        ("tournament", {"players": roster, "options": {"max_workers": 1000}}),
+        ("tournament", {"players": roster, "tournament_type": "ladder", "options": {"games_per_player": "5"}}),
+        ("tournament", {"players": roster, "tournament_type": "ladder", "options": {"games_per_player": 10 ** 9}}),
+        ("tournament", {"players": roster, "timeout": -1}),
+    ])
+    assert status == 400 and "max_workers" in error
+    assert bad_type == bad_range == bad_timeout == 400
+
+    # Limit služby platí i bez timeoutu v požadavku a klient ho nemůže prodloužit
+    large = [{"nickname": f"Hrac{i}", "gender": "man", "state": "CZE"} for i in range(300)]
+
+    async def overlong():
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            server = SimulationServer(port=0, executor=executor, tournament_timeout=0.1,
+                                      max_tournament_timeout=0.2)
+            await server.start()
+            try:
+                reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+                results = []
+                for timeout in (None, 3600):
+                    start = time.perf_counter()
+                    status, body = await request(reader, writer, "POST", "/tournament", {
+                        "players": large, "winning_score": 100, "retention": "none", "timeout": timeout})
+                    results.append((status, body, time.perf_counter() - start))
+                writer.close()
+            finally:
+                await server.close()
+            return results
+
+    for status, body, elapsed in asyncio.run(overlong()):
+        assert status == 200 and body["tournament_info"]["cancelled"] == "Vypršel časový limit"
+        assert body["statistics"]["total_matches"] < len(large) * (len(large) - 1) // 2
+        assert elapsed < 5
+    try:
+        SimulationServer(tournament_timeout=5, max_tournament_timeout=1)
+        assert False, "Výchozí limit delší než maximální měl být odmítnut"
+    except ValueError:
+        pass
+
+    stats = stats[1]
+    assert stats["latency"]["POST /match"]["count"] == 401
+    assert stats["latency"]["POST /match"]["errors"] == 1
+    assert stats["batching"]["match"]["mean_batch_size"] > 1
+    assert stats["in_flight"] == 0
+    print(f"Zapasu: {len(matches)}, prumerna davka: {stats['batching']['match']['mean_batch_size']}, "
+          f"p95: {stats['latency']['POST /match']['p95_ms']} ms")
+
+    print("\nOK - Test HTTP sluzby byl uspesny!")
+    return True
+
+
+def test_leaderboard():
+    """Testuje průběžně aktualizovaný kariérní žebříček hráčů."""
+    print("\n" + "="*70)
+    print("TEST 24: Karierni zebricek")
+    print("="*70)
+
+    import os
+    import tempfile
+    from leaderboard import Leaderboard
+
+    players = load_players("players.json")
+    events = []
+    for seed in range(3):
+        tournament = RoundRobinTournament(players, "Praha", winning_score=3, seed=seed)
+        for _ in tournament.iter_events():
+            pass
+        events.append(tournament.get_results())
+    elimination = EliminationTournament(players, "Brno", winning_score=3, seed=9)
+    for _ in elimination.iter_events():
+        pass
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with Leaderboard(os.path.join(tmp_dir, "leaderboard.db")) as leaderboard:
+            assert all(leaderboard.record(results) for results in events)
+            elimination.save_tournament_results(os.path.join(tmp_dir, "elim.json"), leaderboard=leaderboard)
+            events.append(elimination.get_results())
+
+            # Opakované započtení stejného turnaje nic nezmění
+            assert not leaderboard.record(events[0])
+            assert not leaderboard.import_file(os.path.join(tmp_dir, "elim.json"))
+            assert leaderboard.tournaments() == 4 and len(leaderboard) == len(players)
+
+            # Součty odpovídají přepočtu přes všechny turnaje
+            for player in players:
+                rows = [row for results in events for row in results["final_standings"]
+                        if row["player"] == player.nickname]
+                career = leaderboard.player(player.nickname)
+                assert career["tournaments"] == 4
+                assert career["games"] == sum(row["games"] for row in rows)
+                assert career["wins"] == sum(row["wins"] for row in rows)
+                assert career["score_plus"] == sum(row["score_plus"] for row in rows)
+                assert career["titles"] == sum(r["winner"]["nickname"] == player.nickname for r in events)
+            assert leaderboard.player("Nikdo") is None
+
+            top = leaderboard.top(5)
+            assert len(top) == 5
+            assert [(r["wins"], r["score_difference"]) for r in top] == \
+                sorted(((r["wins"], r["score_difference"]) for r in top), reverse=True)
+            assert sum(r["titles"] for r in leaderboard.top(len(players), order="titles")) == 4
+            rates = [r["win_rate"] for r in leaderboard.top(len(players), order="win_rate")]
+            assert rates == sorted(rates, reverse=True)
+            try:
+                leaderboard.top(order="nic")
+                assert False, "Mel byt vyhozen ValueError"
+            except ValueError:
+                pass
+            print(f"Vedouci hrac: {top[0]['nickname']} ({top[0]['wins']} vyher, {top[0]['titles']} titulu)")
+
+    print("\nOK - Test karierniho zebricku byl uspesny!")
+    return True
+
+
+def test_cancellation():
+    """Testuje kooperativní rušení turnaje a časový limit."""
+    print("\n" + "="*70)
+    print("TEST 25: Ruseni turnaje a casovy limit")
+    print("="*70)
+
+    from cancellation import CancellationToken
+    from events import MatchPlayed, TournamentCancelled
+
+    # Zrušení po 10 zápasech - další zápasy se už nehrají
+    token = CancellationToken()
+    tournament = RoundRobinTournament(load_players("players.json"), "Praha", winning_score=5, seed=1)
+    events = []
+    for event in tournament.iter_events(token):
+        events.append(event)
+        if isinstance(event, MatchPlayed) and tournament.match_stats.count == 10:
+            token.cancel("Test")
+    assert isinstance(events[-1], TournamentCancelled)
+    assert events[-1].reason == "Test" and events[-1].matches_played == 10
+    assert sum(isinstance(e, MatchPlayed) for e in events) == 10
+    assert tournament.cancelled == "Test" and tournament.winner is None
+
+    # Částečné výsledky - pořadí i statistiky odehrané části
+    results = tournament.get_results()
+    assert results["tournament_info"]["cancelled"] == "Test"
+    assert results["statistics"]["total_matches"] == 10 and len(results["matches"]) == 10
+    assert sum(row["games"] for row in results["final_standings"]) == 20
+    assert events[-1].statistics["house_wins"] + events[-1].statistics["guest_wins"] == 10
+
+    # Vypršený limit - turnaj skončí hned na první hranici
+    elimination = EliminationTournament(load_players("players.json"), "Brno", winning_score=5)
+    assert not elimination.play(timeout=0)
+    assert elimination.match_stats.count == 0 and elimination.cancelled == "Vypršel časový limit"
+
+    # Bez zrušení turnaj doběhne normálně
+    tournament = RoundRobinTournament(load_players("players.json"), "Praha", winning_score=5, seed=1)
+    assert tournament.play(cancel=CancellationToken(timeout=60))
+    assert tournament.cancelled is None and tournament.winner is not None
+
+    # Zrušení nebo vypršení limitu až po vyhlášení vítěze turnaj nepřeruší
+    from events import TournamentWon
+    token = CancellationToken(timeout=60)
+    tournament = RoundRobinTournament(load_players("players.json"), "Praha", winning_score=5, seed=1)
+    events = []
+    for event in tournament.iter_events(token):
+        events.append(event)
+        if isinstance(event, TournamentWon):
+            token.deadline = 0
+    assert token.cancelled and isinstance(events[-1], TournamentWon)
+    assert tournament.cancelled is None and tournament.winner is not None
+
+    try:
+        CancellationToken(timeout=-1)
+        assert False, "Mel byt vyhozen ValueError"
+    except ValueError:
+        pass
+
+    print("\nOK - Test ruseni turnaje byl uspesny!")
+    return True
+
+
+def test_roster_snapshot():
+    """Testuje binární snímek soupisky a jeho zneplatnění."""
+    print("\n" + "="*70)
+    print("TEST 26: Binarni snimek soupisky")
+    print("="*70)
+
+    import os
+    import shutil
+    import tempfile
+    from game import save_players
+    from roster_snapshot import (HEADER, SECTION, load_players_cached, read_snapshot, snapshot_path,
+                                 write_snapshot)
+
+    def rows(players):
+        return [(p.nickname, p.gender, p.state) for p in players]
+
+    expected = load_players("players.json")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        source = os.path.join(tmp_dir, "players.json")
+        shutil.copy("players.json", source)
+        snapshot = snapshot_path(source)
+
+        assert read_snapshot(snapshot, source) is None
+        assert rows(load_players_cached(source)) == rows(expected)
+        assert os.path.exists(snapshot)
+        cached = read_snapshot(snapshot, source)
+        assert rows(cached) == rows(expected)
+        assert cached[0].count_of_games == 0 and str(cached[0]) == str(expected[0])
+
+        # Jen změněný mtime - obsah se ověří hashem a snímek platí dál
+        stat = os.stat(source)
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert read_snapshot(snapshot, source) is not None
+
+        # Změněný obsah - snímek je neplatný a vytvoří se znovu
+        save_players(source, expected[:5])
+        assert read_snapshot(snapshot, source) is None
+        assert rows(load_players_cached(source)) == rows(expected[:5])
+        assert len(read_snapshot(snapshot, source)) == 5
+
+        # Poškozený snímek se ignoruje
+        with open(snapshot, mode='r+b') as file:
+            file.write(b'XXXX')
+        assert read_snapshot(snapshot, source) is None
+        assert rows(load_players_cached(source)) == rows(expected[:5])
+
+        # Neplatný kód pohlaví a neplatné UTF-8 v přezdívkách se také ignorují
+        def damage(section, value):
+            with open(snapshot, mode='r+b') as file:
+                data = file.read()
+                offset = HEADER.size
+                for _ in range(section):
+                    offset += SECTION.size + SECTION.unpack_from(data, offset)[0]
+                file.seek(offset + SECTION.size)
+                file.write(value)
+
+        for section, value in ((2, b'\x07'), (1, b'\xff\xfe')):
+            write_snapshot(source, expected[:5], snapshot)
+            damage(section, value)
+            assert read_snapshot(snapshot, source) is None
+            assert rows(load_players_cached(source)) == rows(expected[:5])
+
+        # Soupiska změněná během parsování - snímek nese stav před parsováním a příště se zahodí
+        import roster_snapshot
+        save_players(source, expected)
+        original_load = roster_snapshot.load_players
+
+        def racing_load(path):
+            players = original_load(path)
+            save_players(source, expected[:3])
+            return players
+
+        roster_snapshot.load_players = racing_load
+        try:
+            assert rows(load_players_cached(source)) == rows(expected)
+        finally:
+            roster_snapshot.load_players = original_load
+        assert read_snapshot(snapshot, source) is None
+        assert rows(load_players_cached(source)) == rows(expected[:3])
+
+        # Snímek funguje pro všechny formáty soupisky
+        csv_source = os.path.join(tmp_dir, "players.csv")
+        save_players(csv_source, expected)
+        load_players_cached(csv_source)
+        assert rows(read_snapshot(snapshot_path(csv_source), csv_source)) == rows(expected)
+
+    print(f"Hracu ve snimku: {len(expected)}")
+    print("\nOK - Test binarniho snimku soupisky byl uspesny!")
+    return True
+
+
+def test_head_to_head():
+    """Testuje matici vzájemných zápasů a pomocná kritéria pořadí."""
+    print("\n" + "="*70)
+    print("TEST 27: Matice vzajemnych zapasu")
+    print("="*70)
+
+    from tournament_stats import HeadToHeadMatrix
+
+    players = load_players("players.json")[:7]
+    tournament = RoundRobinTournament(players, "Praha", winning_score=3, seed=11)
+    tournament.play()
+    matrix = tournament.head_to_head
+    by_nick = {p.nickname: p for p in players}
+
+    # Každá buňka odpovídá záznamu zápasu, matice je antisymetrická
+    for record in tournament._detailed_results:
+        p1, p2 = by_nick[record["player1"]["nickname"]], by_nick[record["player2"]["nickname"]]
+        margin = record["final_score"]["player1"] - record["final_score"]["player2"]
+        assert matrix.result(p1, p2) == margin and matrix.result(p2, p1) == -margin
+        assert matrix.winner(p1, p2).nickname == record["winner"]
+    assert all(matrix.result(p, p) == 0 for p in players)
+
+    # Vítěz je první v pořadí a hráči se stejným počtem výher jsou seřazeni podle vzájemných zápasů
+    standings = tournament.get_standings()
+    assert tournament.winner == standings[0][0]
+    for (a, wins_a, _), (b, wins_b, _) in zip(standings, standings[1:]):
+        assert wins_a >= wins_b
+        if wins_a == wins_b:
+            tied = [p for p, w, _ in standings if w == wins_a]
+            league = matrix.mini_league(tied)
+            assert league[a] >= league[b]
+
+    # Sonneborn-Berger = součet výher poražených soupeřů
+    wins = [tournament.stats[p].wins for p in matrix.players]
+    for player in players:
+        expected = sum(tournament.stats[o].wins for o in players if matrix.result(player, o) > 0)
+        assert matrix.sonneborn_berger(player, wins) == expected
+
+    # Kompaktní export ve výsledcích
+    exported = tournament.get_results()["head_to_head"]
+    rows = HeadToHeadMatrix.decode(exported)
+    assert exported["players"] == [p.nickname for p in players]
+    assert rows[0][1] == matrix.result(players[0], players[1])
+
+    # Matice se alokuje až se začátkem turnaje a jen tehdy, když se pomocná kritéria používají
+    plain = RoundRobinTournament(players, "Praha", winning_score=3, seed=11, tie_breaks=False)
+    assert RoundRobinTournament(players, "Praha", winning_score=3).head_to_head is None
+    plain.play()
+    assert plain.head_to_head is None and "head_to_head" not in plain.get_results()
+    assert [w for _, w, _ in plain.get_standings()] == [w for _, w, _ in standings]
+
+    # Šířka buňky podle počtu bodů k vítězství
+    assert [HeadToHeadMatrix(players, score).typecode for score in (127, 128, 32768)] == ['b', 'h', 'i']
+    wide = HeadToHeadMatrix(players[:2], 40000)
+    wide.record(players[0], players[1], (40000, 3))
+    assert wide.result(players[1], players[0]) == -39997
+    try:
+        RoundRobinTournament(players, "Praha", winning_score=2 ** 31)
+        assert False, "Prilis vysoky pocet bodu mel byt odmitnut"
+    except ValueError:
+        pass
+
+    print(f"Vitez: {tournament.winner.nickname}, poradi: {[p.nickname for p, _, _ in standings]}")
+    print("\nOK - Test matice vzajemnych zapasu byl uspesny!")
+    return True
+
+
+def test_memory_monitor():
+    """Testuje sledování paměti turnaje a paměťový limit."""
+    print("\n" + "="*70)
+    print("TEST 28: Sledovani pameti turnaje")
+    print("="*70)
+
+    import contextlib
+    import io
+    import tracemalloc
+    from profiling import MemoryMonitor
+
+    players = load_players("players.json")
+
+    # Měření po kolech (kolo 0 = příprava turnaje)
+    tournament = RoundRobinTournament(players, "Praha", winning_score=5, seed=3)
+    with contextlib.redirect_stdout(io.StringIO()):
+        with MemoryMonitor(top=3) as monitor:
+            assert tournament.play(monitor)
+    assert not tracemalloc.is_tracing()
+    report = monitor.report()
+    assert [r["round"] for r in report["rounds"]] == list(range(tournament._get_total_rounds() + 1))
+    assert report["peak"] > 0 and report["cancelled"] is None
+    assert all(len(r["top"]) <= 3 for r in report["rounds"])
+    assert any(site["site"].startswith("tournament.py:") for r in report["rounds"] for site in r["top"])
+
+    # Překročený limit přeruší turnaj s dosavadními výsledky
+    tournament = RoundRobinTournament(players, "Praha", winning_score=5, seed=3)
+    with contextlib.redirect_stdout(io.StringIO()):
+        with MemoryMonitor(limit_mb=0.03) as monitor:
+            assert not tournament.play(monitor)
+    assert "paměťový limit" in tournament.cancelled
+    results = tournament.get_results()
+    assert results["tournament_info"]["cancelled"] == tournament.cancelled
+    assert 0 < results["statistics"]["total_matches"] < len(players) * (len(players) - 1) // 2
+
+    try:
+        MemoryMonitor(limit_mb=0)
+        assert False, "Nulovy limit mel byt odmitnut"
+    except ValueError:
+        pass
+
+    print(f"Spicka: {report['peak']} B, preruseno po {results['statistics']['total_matches']} zapasech")
+    print("\nOK - Test sledovani pameti byl uspesny!")
+    return True
+
+
+def test_cpu_profiler():
+    """Testuje CPU profil turnaje (.pstats a sbalené zásobníky)."""
+    print("\n" + "="*70)
+    print("TEST 29: CPU profil turnaje")
+    print("="*70)
+
+    import contextlib
+    import io
+    import os
+    import pstats
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "profil", "turnaj.pstats")
+        tournament = RoundRobinTournament(load_players("players.json"), "Praha", winning_score=5, seed=3)
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert tournament.play(profile=path)
+        assert tournament.winner is not None
+
+        functions = {name for _, _, name in pstats.Stats(path).stats}
+        assert {"play", "roll", "print_event"} <= functions
+
+        with open(os.path.join(tmp_dir, "profil", "turnaj.folded"), encoding='utf-8') as file:
+            lines = file.read().splitlines()
+        assert lines
+        for line in lines:
+            stack, microseconds = line.rsplit(' ', 1)
+            assert int(microseconds) > 0 and stack
+        assert any("roll (game.py:" in line and "play (game.py:" in line for line in lines)
+
+        # Skupiny hrané na pracovních vláknech se do profilu započtou
+        from tournament import GroupKnockoutTournament
+        group_path = os.path.join(tmp_dir, "skupiny.pstats")
+        groups = GroupKnockoutTournament(load_players("players.json"), "Brno", winning_score=3, seed=5)
+        with contextlib.redirect_stdout(io.StringIO()):
+            groups.play(profile=group_path)
+        match_calls = [calls for (filename, _, name), (_, calls, _, _, _) in pstats.Stats(group_path).stats.items()
+                       if name == "play" and filename.endswith("game.py")]
+        assert match_calls == [groups.match_stats.count]
+
+    # Profil ani paměťový limit nejdou v dávce kombinovat s cache výsledků
+    from batch import expand_jobs
+    try:
+        expand_jobs({"cache_dir": ".cache", "seed": 1, "profile": True})
+        assert False, "Kombinace s cache mela byt odmitnuta"
+    except ValueError:
+        pass
+
+    print(f"Funkci v profilu: {len(functions)}, zasobniku: {len(lines)}")
+    print("\nOK - Test CPU profilu byl uspesny!")
+    return True
+
+
 def main():
     """Spustí všechny testy."""
     print("\n" + "="*70)
@@ -210,6 +1754,106 @@ def main():
     # Test 4
     result4 = test_factory()
     results.append(("TournamentFactory", result4))
+
+    # Test 5
+    result5 = test_batch()
+    results.append(("Davka", result5))
+
+    # Test 6
+    result6 = test_match_predictor()
+    results.append(("Prediktor", result6))
+
+    # Test 7
+    result7 = test_result_cache()
+    results.append(("Cache vysledku", result7))
+
+    # Test 8
+    result8 = test_results_archive()
+    results.append(("Archiv vysledku", result8))
+
+    # Test 9
+    result9 = test_results_database()
+    results.append(("SQLite uloziste", result9))
+
+    # Test 10
+    result10 = test_csv_streaming()
+    results.append(("CSV import/export", result10))
+
+    # Test 11
+    result11 = test_json_output()
+    results.append(("JSON vystup", result11))
+
+    # Test 12
+    result12 = test_async_io()
+    results.append(("Asynchronni I/O", result12))
+
+    # Test 13
+    result13 = test_distributed()
+    results.append(("Distribuce", result13))
+
+    # Test 14
+    result14 = test_match_replay()
+    results.append(("Historie zapasu", result14))
+
+    # Test 15
+    result15 = test_events()
+    results.append(("Udalosti turnaje", result15))
+
+    # Test 16
+    result16 = test_online_statistics()
+    results.append(("Prubezne statistiky", result16))
+
+    # Test 17
+    result17 = test_retention()
+    results.append(("Politika uchovavani", result17))
+
+    # Test 18
+    result18 = test_roster_generator()
+    results.append(("Generator soupisek", result18))
+
+    # Test 19
+    result19 = test_pair_cache()
+    results.append(("Cache dvojic", result19))
+
+    # Test 20
+    result20 = test_stats_context()
+    results.append(("Kontext statistik", result20))
+
+    # Test 21
+    result21 = test_ladder()
+    results.append(("Zebricek", result21))
+
+    # Test 22
+    result22 = test_group_knockout()
+    results.append(("Skupiny + pavouk", result22))
+
+    # Test 23
+    result23 = test_server()
+    results.append(("HTTP sluzba", result23))
+
+    # Test 24
+    result24 = test_leaderboard()
+    results.append(("Karierni zebricek", result24))
+
+    # Test 25
+    result25 = test_cancellation()
+    results.append(("Ruseni turnaje", result25))
+
+    # Test 26
+    result26 = test_roster_snapshot()
+    results.append(("Snimek soupisky", result26))
+
+    # Test 27
+    result27 = test_head_to_head()
+    results.append(("Vzajemne zapasy", result27))
+
+    # Test 28
+    result28 = test_memory_monitor()
+    results.append(("Sledovani pameti", result28))
+
+    # Test 29
+    result29 = test_cpu_profiler()
+    results.append(("CPU profil", result29))
     
     # Shrnutí
     print("\n" + "="*70)